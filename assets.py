@@ -0,0 +1,77 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+
+IMAGE_PACK_MAGIC = b"RCIP"
+IMAGE_PACK_VERSION = 1
+IMAGE_PACK_HEADER = struct.Struct('<4sHHI')
+IMAGE_PACK_ENTRY = struct.Struct('<HIIHH')
+
+def write_image_pack(output_path: str, images: Iterable[Tuple[str, bytes, int, int]]) -> int:
+    images = list(images)
+    names = [name.encode('utf-8') for name, _, _, _ in images]
+    table_size = IMAGE_PACK_HEADER.size + sum(IMAGE_PACK_ENTRY.size + len(name) for name in names)
+    offset = table_size
+    table = [IMAGE_PACK_HEADER.pack(IMAGE_PACK_MAGIC, IMAGE_PACK_VERSION, 0, len(images))]
+    for name, (_, data, width, height) in zip(names, images):
+        table.append(IMAGE_PACK_ENTRY.pack(len(name), offset, len(data), width, height))
+        table.append(name)
+        offset += len(data)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(b"".join(table))
+        for _, data, _, _ in images:
+            f.write(data)
+    os.replace(temp_path, output_path)
+    return offset
+
+class ImagePack:
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Tuple[int, int, int, int]] = {}
+        with open(path, 'rb') as f:
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.mapping)
+        try:
+            self.read_table()
+        except BaseException:
+            self.close()
+            raise
+    def read_table(self) -> None:
+        if len(self.view) < IMAGE_PACK_HEADER.size:
+            raise ValueError(f"Image pack is truncated: {self.path}")
+        magic, version, _, count = IMAGE_PACK_HEADER.unpack_from(self.view, 0)
+        if magic != IMAGE_PACK_MAGIC or version != IMAGE_PACK_VERSION:
+            raise ValueError(f"Unsupported image pack: {self.path}")
+        position = IMAGE_PACK_HEADER.size
+        if position + count * IMAGE_PACK_ENTRY.size > len(self.view):
+            raise ValueError(f"Image pack table is truncated: {self.path}")
+        for _ in range(count):
+            if position + IMAGE_PACK_ENTRY.size > len(self.view):
+                raise ValueError(f"Image pack table is truncated: {self.path}")
+            name_length, offset, length, width, height = IMAGE_PACK_ENTRY.unpack_from(self.view, position)
+            position += IMAGE_PACK_ENTRY.size
+            if position + name_length > len(self.view):
+                raise ValueError(f"Image pack table is truncated: {self.path}")
+            name = bytes(self.view[position:position + name_length]).decode('utf-8')
+            position += name_length
+            if offset + length > len(self.view):
+                raise ValueError(f"Image pack entry {name} is out of range: {self.path}")
+            self.entries[name] = (offset, length, width, height)
+    def names(self) -> List[str]:
+        return list(self.entries)
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+    def get(self, name: str) -> Optional[memoryview]:
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        offset, length, _, _ = entry
+        return self.view[offset:offset + length]
+    def get_size(self, name: str) -> Optional[Tuple[int, int]]:
+        entry = self.entries.get(name)
+        return (entry[2], entry[3]) if entry else None
+    def close(self) -> None:
+        self.view.release()
+        self.mapping.close()
@@ -0,0 +1,29 @@
+import sys
+import time
+from benchmark_search import generate_synthetic_catalog
+from trucks import TruckClassifier, TruckRuleEngine, load_classifier_rules
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    catalog = generate_synthetic_catalog(count)
+    started = time.perf_counter()
+    engine = TruckRuleEngine(load_classifier_rules())
+    print(f"Compiled rules in {(time.perf_counter() - started) * 1000:.2f} ms")
+    for label in ("cold", "memoized"):
+        started = time.perf_counter()
+        for truck_id, display_name in catalog.items():
+            engine.classify(truck_id, display_name)
+        elapsed = time.perf_counter() - started
+        print(f"{label}: classified {len(catalog)} trucks in {elapsed * 1000:.1f} ms "
+              f"({elapsed / len(catalog) * 1e6:.2f} us per truck)")
+    TruckClassifier.reload_rules()
+    started = time.perf_counter()
+    for truck_id, display_name in catalog.items():
+        TruckClassifier.get_truck_type(truck_id, display_name)
+        TruckClassifier.get_truck_rarity(truck_id, display_name)
+        TruckClassifier.get_truck_category(truck_id)
+    elapsed = time.perf_counter() - started
+    print(f"TruckClassifier type+rarity+category: {elapsed * 1000:.1f} ms for {len(catalog)} trucks")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import gc
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+from constants import LEVELS_KNOWN
+from main import JSON_CODECS, JsonCodec, orjson
+from trucks import TRUCK_ID_TO_DISPLAY_NAME
+
+PLAIN_TEXTS = ["gravel", "logs", "concrete", "pipes", ""]
+PLAIN_FLOATS = [0.5, 12.25, 100.0]
+# Text the stdlib encoder escapes: quotes, backslashes, control characters, DEL, accents, Cyrillic, CJK and emoji
+SYNTHETIC_TEXTS = ["gravel", 'say "hi"', "back\\slash", "tab\tnew\nline", "bell\x07\x1f\x7f", "Café Ærø",
+                   "Лесовоз", "道路工事", "🚚 convoy", ""]
+# Floats the two encoders format differently unless the codec falls back
+SYNTHETIC_FLOATS = [0.1, 1 / 3, -0.0, 2.5e-05, 1e-07, 1e16, 1.7976931348623157e308, 123456.789, -42.0]
+REPEATS = 5
+
+def generate_synthetic_save(record_count: int, seed: int = 0, edge_cases: bool = True) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    texts = SYNTHETIC_TEXTS if edge_cases else PLAIN_TEXTS
+    floats = SYNTHETIC_FLOATS if edge_cases else PLAIN_FLOATS
+    truck_ids = sorted(TRUCK_ID_TO_DISPLAY_NAME)
+    map_ids = [map_id for map_id, _ in LEVELS_KNOWN]
+    unlocked = sorted(rng.sample(truck_ids, len(truck_ids) // 4))
+    world: List[Dict[str, Any]] = []
+    for i in range(record_count):
+        world.append({
+            "id": f"object_{i}",
+            "pos": [rng.uniform(-5000, 5000), rng.uniform(0, 300), rng.choice(floats)],
+            "label": rng.choice(texts),
+            "cargo": {"type": rng.choice(texts), "amount": rng.randint(0, 2 ** 40)} if i % 3 else {},
+            "links": [[]] if i % 7 == 0 else [rng.randint(0, record_count) for _ in range(i % 4)],
+            "state": {"flags": {"broken": i % 5 == 0, "owner": None}, "history": []},
+        })
+    return {
+        "CompleteSave": {"version": 7, "meta": {}, "tags": []},
+        "SslType": "CompleteSave",
+        "SslValue": {
+            "money": 1234567, "xp": 98765, "companyName": "Дорожная служба «Север» 🚧",
+            "lockedTrucks": sorted(set(truck_ids) - set(unlocked)),
+            "unlockedTrucks": {map_id: list(unlocked) for map_id in map_ids},
+            "newUnlockedTrucks": unlocked[:3],
+            "unlockedLevels": map_ids[::2],
+            "completedLevels": map_ids[::3],
+            "levelsProgress": {map_id: rng.random() for map_id in map_ids},
+            "recoveryCoins": {map_id: rng.randint(0, 50) for map_id in map_ids},
+            "fobsResources": {map_id: {"resources": [rng.randint(0, 999) for _ in range(8)]} for map_id in map_ids},
+            "world": world,
+            "emptyObject": {}, "emptyList": [], "nestedEmpty": {"a": {"b": []}, "c": [{}, []]},
+        },
+    }
+
+def median_ms(run) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+def main():
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    # Edge-case floats make the orjson codec fall back to the stdlib encoder for the whole document
+    for label, edge_cases in (("plain", False), ("edge cases", True)):
+        document = generate_synthetic_save(record_count, edge_cases=edge_cases)
+        expected = JsonCodec().dumps(document)
+        print(f"Synthetic save with {label}: {len(expected) / (1024 * 1024):.1f} MB compact JSON")
+        codecs = {name: codec_class() for name, codec_class in JSON_CODECS.items()
+                  if name == JsonCodec.name or orjson is not None}
+        dumps_ms = {}
+        for name, codec in codecs.items():
+            if codec.dumps(document) != expected:
+                print(f"FAILED: {name} output differs from the stdlib compact form")
+                sys.exit(1)
+            dumps_ms[name] = median_ms(lambda: codec.dumps(document))
+        # Parse without the source document alive, as on load, so the collector does not rescan it
+        del document
+        gc.collect()
+        for name, codec in codecs.items():
+            loads_ms = median_ms(lambda: codec.loads(expected))
+            print(f"  {name:8s} loads {loads_ms:8.1f} ms, dumps {dumps_ms[name]:8.1f} ms, output identical")
+        if orjson is None:
+            print("  orjson: skipped, not installed")
+
+if __name__ == "__main__":
+    main()
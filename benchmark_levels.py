@@ -0,0 +1,43 @@
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+from PyQt6.QtWidgets import QApplication, QWidget
+from constants import LEVELS_KNOWN
+from main import LevelsPanel
+
+def generate_synthetic_levels(count: int) -> Tuple[List[Tuple[str, str]], Dict[str, Any]]:
+    levels = list(LEVELS_KNOWN)
+    for i in range(len(levels), count):
+        levels.append((f"synthetic_map_{i:04d}", f"Synthetic Map {i}"))
+    level_ids = [level_id for level_id, _ in levels]
+    ssl_value = {
+        "unlockedLevels": level_ids[::2],
+        "completedLevels": level_ids[::3],
+        "levelsProgress": {level_id: i % 101 for i, level_id in enumerate(level_ids)},
+        "recoveryCoins": {level_id: i % 50 for i, level_id in enumerate(level_ids)},
+        "fobsResources": {level_id: {"resources": [i % 1000] * 8} for i, level_id in enumerate(level_ids)}
+    }
+    return levels, ssl_value
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    app = QApplication(sys.argv[:1])
+    levels, ssl_value = generate_synthetic_levels(count)
+    panel = LevelsPanel()
+    panel.resize(1200, 800)
+    panel.show()
+    app.processEvents()
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        panel.load_levels(levels, ssl_value)
+        app.processEvents()
+        timings.append(time.perf_counter() - started)
+    print(f"Repopulated {len(levels)} levels: median {statistics.median(timings) * 1000:.1f} ms, "
+          f"max {max(timings) * 1000:.1f} ms")
+    print(f"Widgets in levels panel: {len(panel.findChildren(QWidget))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+from benchmark_search import generate_synthetic_catalog
+from constants import LEVELS_KNOWN
+from trucks import TruckLockState
+
+MAP_IDS = [map_id for map_id, _ in LEVELS_KNOWN]
+REPEATS = 20
+
+def list_group_unlock(ssl_value: Dict, group: List[str], map_ids: List[str]) -> None:
+    group_set = set(group)
+    ssl_value["lockedTrucks"] = [truck_id for truck_id in ssl_value["lockedTrucks"] if truck_id not in group_set]
+    for map_id in map_ids:
+        ssl_value["unlockedTrucks"][map_id] = sorted(set(ssl_value["unlockedTrucks"][map_id]) | group_set)
+
+def list_unlocked_everywhere(ssl_value: Dict, map_ids: List[str]) -> List[str]:
+    unlocked = set(ssl_value["unlockedTrucks"][map_ids[0]])
+    for map_id in map_ids[1:]:
+        unlocked &= set(ssl_value["unlockedTrucks"][map_id])
+    return sorted(unlocked)
+
+def list_unlock_all(ssl_value: Dict, all_trucks: List[str]) -> None:
+    ssl_value["lockedTrucks"] = []
+    for map_id in MAP_IDS:
+        ssl_value["unlockedTrucks"][map_id] = sorted(all_trucks)
+
+def run_list(ssl_value: Dict, group: List[str], all_trucks: List[str]) -> None:
+    list_group_unlock(ssl_value, group, MAP_IDS[3:8])
+    list_unlocked_everywhere(ssl_value, MAP_IDS)
+    list_unlock_all(ssl_value, all_trucks)
+
+def run_bitset(state: TruckLockState, group: List[str], all_trucks: List[str]) -> None:
+    state.unlock_mask(state.mask_for(group), MAP_IDS[3:8])
+    state.truck_ids_for(state.unlocked_mask(require_all=True))
+    state.set_all_unlocked(all_trucks)
+
+def make_ssl_value(truck_ids: List[str], seed: int = 0) -> Dict:
+    rng = random.Random(seed)
+    unlocked = sorted(rng.sample(truck_ids, len(truck_ids) // 4))
+    return {"lockedTrucks": sorted(set(truck_ids) - set(unlocked)),
+            "unlockedTrucks": {map_id: list(unlocked) for map_id in MAP_IDS}}
+
+def median_ms(run) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [85, 2000, 10000]
+    for count in counts:
+        truck_ids = sorted(generate_synthetic_catalog(count))
+        group = truck_ids[::3]
+        ssl_value = make_ssl_value(truck_ids)
+        state = TruckLockState.from_ssl_value(ssl_value, MAP_IDS, truck_ids)
+        list_ms = median_ms(lambda: run_list(ssl_value, group, truck_ids))
+        bitset_ms = median_ms(lambda: run_bitset(state, group, truck_ids))
+        print(f"{len(truck_ids):6d} trucks, group unlock on 5 maps + intersection + unlock all: "
+              f"lists {list_ms:.2f} ms, bitset {bitset_ms:.2f} ms")
+
+if __name__ == "__main__":
+    main()
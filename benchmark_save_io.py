@@ -0,0 +1,58 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+from main import SAVE_FILE_HEADER_LENGTH, SaveManager
+
+# A header with zeroed totals and MD5; encode_file fills them in
+SYNTHETIC_HEADER = b"SAVE" + bytes(SAVE_FILE_HEADER_LENGTH - 4)
+DECODE_BLOCK_SIZE = 4096
+DECODE_BLOCK_COUNTS = (500, 1000, 2000, 4000)
+ENCODE_WORKERS = (1, 2, 4, 8)
+
+def generate_synthetic_payload(size: int) -> bytes:
+    record = b'{"id":%d,"pos":[%d.25,%d.5,%d.75],"state":"idle","cargo":{"type":"gravel","amount":%d}},'
+    parts = [b'{"SslValue":{"world":[']
+    total = len(parts[0])
+    i = 0
+    while total < size:
+        part = record % (i, i * 7 % 1000, i * 13 % 1000, i * 17 % 1000, i % 97)
+        parts.append(part)
+        total += len(part)
+        i += 1
+    return b"".join(parts)[:size]
+
+def write_synthetic_save(path: str, size: int, block_size: int) -> None:
+    SaveManager().encode_file(SYNTHETIC_HEADER, generate_synthetic_payload(size), path, block_size=block_size, workers=1)
+
+def time_call(callable_, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        callable_()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+def bench_decode_scaling(directory: str) -> None:
+    manager = SaveManager()
+    for block_count in DECODE_BLOCK_COUNTS:
+        path = os.path.join(directory, f"decode_{block_count}")
+        write_synthetic_save(path, DECODE_BLOCK_SIZE * block_count, DECODE_BLOCK_SIZE)
+        elapsed = time_call(lambda: manager.decode_file(path), 3)
+        print(f"decode {block_count:5d} blocks: {elapsed * 1000:8.1f} ms ({elapsed / block_count * 1e6:.1f} us per block)")
+
+def bench_encode_workers(path: str, payload: bytes) -> None:
+    manager = SaveManager()
+    for workers in ENCODE_WORKERS:
+        elapsed = time_call(lambda: manager.encode_file(SYNTHETIC_HEADER, payload, path, workers=workers), 1)
+        print(f"encode {len(payload) / 1e6:.0f} MB with {workers} workers: {elapsed * 1000:.0f} ms")
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as directory:
+        bench_decode_scaling(directory)
+        bench_encode_workers(os.path.join(directory, "large"), generate_synthetic_payload(size_mb * 1000 * 1000))
+
+if __name__ == "__main__":
+    main()
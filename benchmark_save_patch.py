@@ -0,0 +1,41 @@
+import json
+import statistics
+import sys
+import time
+from benchmark_json_codec import generate_synthetic_save
+from main import LazyDocument, get_json_codec
+
+REPEATS = 5
+
+def median_ms(run) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+def main():
+    record_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    codec = get_json_codec()
+    document = generate_synthetic_save(record_count)
+    raw = bytearray(json.dumps(document, separators=(",", ":")).encode('ascii'))
+    print(f"Synthetic save: {len(raw) / (1024 * 1024):.1f} MB compact JSON, {codec.name} codec")
+    lazy = LazyDocument.parse(raw, codec)
+    edits = iter(range(10 ** 6, 10 ** 9))
+    def patch():
+        money = next(edits)
+        lazy.data["SslValue"]["money"] = money
+        document["SslValue"]["money"] = money
+        return lazy.patch_in_place(lazy.data)
+    patch_ms = median_ms(patch)
+    splice_ms = median_ms(lambda: lazy.dumps(lazy.data))
+    full_ms = median_ms(lambda: codec.dumps(document))
+    if bytes(patch()) != json.dumps(document, separators=(",", ":")).encode('ascii'):
+        print("FAILED: the patched buffer differs from a full re-serialization")
+        sys.exit(1)
+    print(f"money edit: patch in place {patch_ms:.2f} ms, splice untouched spans {splice_ms:.1f} ms, "
+          f"full dumps {full_ms:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import random
+import statistics
+import sys
+import time
+from typing import Dict
+from trucks import TRUCK_ID_TO_DISPLAY_NAME, TruckSearchIndex, tokenize_search_text
+
+# Queries typed one character at a time, including typos
+TYPED_QUERIES = ["kronenwerk l34", "scout", "asphlt paver", "mtk md76 harv", "zikz heavy crane", "tayga dumptruk"]
+
+def generate_synthetic_catalog(count: int, seed: int = 0) -> Dict[str, str]:
+    rng = random.Random(seed)
+    words = sorted({token for name in TRUCK_ID_TO_DISPLAY_NAME.values() for token in tokenize_search_text(name)
+                    if token.isalpha() and len(token) > 2})
+    catalog = dict(TRUCK_ID_TO_DISPLAY_NAME)
+    while len(catalog) < count:
+        model = f"{rng.choice('ABCDEFGHKLMPRSTVZ')}{rng.randint(1, 999)}"
+        name_words = [rng.choice(words).title(), model] + [rng.choice(words).title() for _ in range(rng.randint(1, 3))]
+        display_name = " ".join(name_words)
+        truck_id = "_".join(tokenize_search_text(display_name)) + rng.choice(["_new", "_old", "_res"])
+        catalog.setdefault(truck_id, display_name)
+    return catalog
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    catalog = generate_synthetic_catalog(count)
+    started = time.perf_counter()
+    index = TruckSearchIndex(catalog)
+    print(f"Indexed {len(catalog)} trucks in {(time.perf_counter() - started) * 1000:.1f} ms")
+    timings = []
+    for query in TYPED_QUERIES:
+        index.search("")
+        for length in range(1, len(query) + 1):
+            started = time.perf_counter()
+            results = index.search(query[:length])
+            timings.append(time.perf_counter() - started)
+        print(f"{query!r}: {len(results)} results")
+    timings.sort()
+    print(f"Per keystroke: median {statistics.median(timings) * 1000:.3f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)] * 1000:.3f} ms, max {timings[-1] * 1000:.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 import os
 import PyInstaller.__main__
+from PyQt6.QtCore import QBuffer, QIODevice, Qt
+from PyQt6.QtGui import QImage, QImageWriter
+from assets import write_image_pack
+from constants import IMAGE_PACK_FILE_NAME
+from style import StyleManager
+from trucks import IMAGE_DIR, IMAGE_EXTENSIONS, IMAGE_PACK_SCALES, get_packed_image_name
 
 # Application name
 APP_NAME = "RoadCraft SaveEditor"
@@ -7,12 +13,55 @@ APP_NAME = "RoadCraft SaveEditor"
 MAIN_SCRIPT = "main.py"
 current_dir = os.path.dirname(os.path.abspath(__file__))
 icon_path = os.path.join(current_dir, "images", "ui", "icon.ico")
+image_pack_path = os.path.join(current_dir, "build", "asset_pack", IMAGE_PACK_FILE_NAME)
+IMAGE_PACK_QUALITY = 90
+
+def encode_image(image: QImage) -> bytes:
+    image_format = "WEBP" if b"webp" in QImageWriter.supportedImageFormats() else "PNG"
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, image_format, IMAGE_PACK_QUALITY if image_format == "WEBP" else -1)
+    return bytes(buffer.data())
+
+def build_image_pack(output_path: str) -> None:
+    width, height = StyleManager.TRUCK_IMAGE_SIZE
+    images = []
+    source_size = 0
+    for file_name in sorted(os.listdir(IMAGE_DIR)):
+        if os.path.splitext(file_name)[1].lower() not in IMAGE_EXTENSIONS:
+            continue
+        source_path = os.path.join(IMAGE_DIR, file_name)
+        source = QImage(source_path)
+        if source.isNull():
+            print(f"WARNING: Skipping unreadable image: {source_path}")
+            continue
+        with open(source_path, 'rb') as f:
+            source_data = f.read()
+        source_size += len(source_data)
+        for scale in IMAGE_PACK_SCALES:
+            image = source
+            if source.width() > width * scale or source.height() > height * scale:
+                image = source.scaled(
+                    width * scale, height * scale,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            data = encode_image(image)
+            if len(data) >= len(source_data):
+                image, data = source, source_data
+            images.append((get_packed_image_name(file_name, scale), data, image.width(), image.height()))
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    pack_size = write_image_pack(output_path, images)
+    print(f"Packed {len(images)} truck images: {source_size / 1024:.0f} KB -> {pack_size / 1024:.0f} KB")
 
 if not os.path.exists(icon_path):
     print(f"WARNING: Icon not found at: {icon_path}")
     print("Continuing without icon...")
     icon_path = None
 
+print("Packing truck images...")
+build_image_pack(image_pack_path)
+
 args = [
     MAIN_SCRIPT,
     '--name=' + APP_NAME,
@@ -20,7 +69,8 @@ args = [
     '--windowed',
     '--clean',
     '--noconfirm',
-    '--add-data=images;images',
+    '--add-data=images/ui;images/ui',
+    f'--add-data={image_pack_path};images',
 ]
 
 if icon_path:
@@ -28,4 +78,4 @@ if icon_path:
 
 print("Starting PyInstaller build...")
 PyInstaller.__main__.run(args)
-print("Build complete!")
\ No newline at end of file
+print("Build complete!")
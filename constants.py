@@ -4,8 +4,11 @@ WINDOW_TITLE = "Save Editor"
 
 CONFIG_DIR_NAME = ".roadcraft_editor"
 CONFIG_FILE_NAME = "config.json"
+THUMBNAIL_CACHE_DIR_NAME = "thumbnails"
+TRUCK_RULES_FILE_NAME = "truck_rules.json"
 IMAGES_DIR_NAME = "images"
 UI_IMAGES_DIR_NAME = "ui"
+IMAGE_PACK_FILE_NAME = "trucks.pack"
 
 RESOURCE_INDEX = {
     'LOGS': 4,
@@ -30,6 +33,11 @@ LEVELS_KNOWN = [
     ("rb_map_10_geothermal", "Geothermal"),
 ]
 
+SSL_VALUE_EDITED_KEYS = (
+    "money", "xp", "companyName", "lockedTrucks", "unlockedTrucks", "newUnlockedTrucks",
+    "unlockedLevels", "completedLevels", "levelsProgress", "recoveryCoins", "fobsResources",
+)
+
 BACKUP_FILE_PATTERN = "CompleteSave_backup_{timestamp}.bak"
 BACKUP_MAX_COUNT = 5
 
@@ -37,7 +45,12 @@ STATUS_READY = "Ready. Open a CompleteSave file to begin."
 STATUS_SAVE_SUCCESS = "Changes saved successfully"
 STATUS_SAVE_FAIL = "Save failed: {error}"
 STATUS_LOAD_SUCCESS = "Save file loaded successfully"
+STATUS_LOAD_SUCCESS_DETAILS = "Save file loaded successfully ({compressed:.2f} MB compressed, {uncompressed:.2f} MB uncompressed, checksum {integrity})"
+STATUS_INTEGRITY_OK = "OK"
+STATUS_INTEGRITY_MISMATCH = "mismatch"
 STATUS_LOAD_FAIL = "Load failed: {error}"
+STATUS_LOAD_CANCELLED = "Load cancelled"
+STATUS_SAVE_CANCELLED = "Save cancelled, the save file was not modified"
 WARNING_NO_TRUCK_SELECTED = "No truck selected"
 CONFIRM_UNLOCK_ALL = "Unlock all trucks?"
 CONFIRM_LOCK_ALL = "Lock all trucks?"
@@ -92,6 +105,7 @@ BUTTON_1M = "$1M"
 BUTTON_MAX_XP = "Max XP"
 BUTTON_OPEN_SAVE_FILE = "Open Save File..."
 BUTTON_SAVE_CHANGES = "Save Changes"
+BUTTON_CANCEL = "Cancel"
 
 DIALOG_PROCESSING_TITLE = "Processing"
 DIALOG_PROCESSING_MESSAGE = "Please wait..."
@@ -116,12 +130,16 @@ TAB_LEVELS = "Levels"
 TAB_SETTINGS = "Settings"
 
 DIALOG_LOADING_READING = "Reading file..."
+DIALOG_LOADING_DECOMPRESSING = "Decompressing..."
 DIALOG_LOADING_PARSING = "Parsing JSON data..."
 DIALOG_LOADING_VALIDATING = "Validating data..."
 DIALOG_LOADING_COMPLETE = "Loading complete!"
 DIALOG_SAVING_CHANGES_MESSAGE = "Saving changes to the save file..."
+DIALOG_SAVE_SERIALIZING = "Serializing JSON data..."
 DIALOG_SAVE_PROGRESS = "Saving file..."
 DIALOG_SAVE_COMPLETE = "Save complete!"
+DIALOG_PROGRESS_BYTES = "{detail} {done:.1f} / {total:.1f} MB"
+DIALOG_CANCELLING = "Cancelling..."
 
 ERROR_SELECT_SAVE_FILE = "Please select a CompleteSave file"
 ERROR_DECOMPRESS_SAVE = "Failed to decompress save file data"
@@ -131,6 +149,8 @@ ERROR_SAVE_CHANGES = "Failed to save changes: {error}"
 ERROR_DECOMPRESS_BLOCK = "Failed to decompress block at file offset {offset}"
 ERROR_READING_FILE = "Error reading file {file_path}: {error}"
 ERROR_ENCODING = "Error during encoding: {error}"
+ERROR_JSON_SPAN = "Unexpected JSON structure at offset {offset}"
+ERROR_SAVE_HEADER_TOO_SHORT = "Save header is truncated ({length} of 53 bytes)"
 
 WARNING_NO_TRUCK_SELECTED = "No truck selected"
 CONFIRM_UNLOCK_ALL = "Unlock all trucks?"
@@ -149,6 +169,7 @@ DIALOG_LOADING_MESSAGE = "Loading save file..."
 PLACEHOLDER_MONEY = "Enter money amount"
 PLACEHOLDER_XP = "Enter XP amount"
 PLACEHOLDER_COMPANY = "Enter company name"
+PLACEHOLDER_SEARCH_TRUCKS = "Search trucks..."
 
 ROADCRAFT_SAVE_PATH = os.path.join(
     os.path.expanduser("~"),
@@ -1,22 +1,39 @@
 import sys
 import os
+import bisect
+import copy
 import json
 import glob
 import hashlib
+import math
+import mmap
+import re
 import shutil
+import struct
+import threading
+import time
 import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Iterable, Iterator, Callable, Set
 from pathlib import Path
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QFileDialog, QLabel, QPushButton, 
-    QLineEdit, QComboBox, QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem, QProgressBar, QDialog, 
+    QLineEdit, QComboBox, QListView, QTableView, QStyledItemDelegate, QProgressBar, QDialog, 
     QFormLayout, QSpinBox, QCheckBox, QStatusBar, QMessageBox, QFrame, QSizePolicy, QScrollArea, 
     QSplitter, QGridLayout, QGraphicsDropShadowEffect
 )
-from PyQt6.QtGui import QPixmap, QFont, QColor, QIcon, QPalette
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer, QRect
-from trucks import TrucksData
+from PyQt6.QtGui import QPixmap, QImage, QFont, QColor, QIcon, QPalette
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QSize, QTimer, QRect, QObject, QRunnable, QThreadPool, QAbstractListModel,
+    QAbstractTableModel, QSortFilterProxyModel, QModelIndex
+)
+from trucks import TrucksData, TruckLockState, find_packed_image
 from style import StyleManager
 from constants import *
 def resource_path(relative_path):
@@ -28,6 +45,24 @@ BACKGROUND_IMAGE = os.path.join(UI_IMAGES_DIR, "background.jpg")
 ICON_PATH = os.path.join(UI_IMAGES_DIR, "icon.ico")
 SAVE_FILE_HEADER_LENGTH = 53
 SAVE_FILE_WBITS_VALUE = -15
+SAVE_FILE_INFLATE_CHUNK_SIZE = 64 * 1024
+SAVE_FILE_STREAM_CHUNK_SIZE = 1024 * 1024
+SAVE_FILE_BLOCK_SIZE_MB = 4
+SAVE_FILE_COMPRESS_WORKERS = min(4, os.cpu_count() or 1)
+SAVE_FILE_DECOMPRESS_WORKERS = min(4, os.cpu_count() or 1)
+SAVE_FILE_TEMP_SUFFIX = ".tmp"
+SAVE_PROGRESS_INTERVAL = 1 / 60
+PIXMAP_CACHE_MB = 32
+IMAGE_LOADER_WORKERS = min(2, os.cpu_count() or 1)
+IMAGE_PREFETCH_RADIUS = 3
+JSON_CODEC_AUTO = "auto"
+DOCUMENT_SECTION_TRUCKS = "trucks"
+DOCUMENT_SECTION_STATS = "stats"
+DOCUMENT_SECTION_LEVELS = "levels"
+DOCUMENT_SECTION_RESOURCES = "resources"
+JSON_STRING_PATTERN_SOURCE = rb'"(?:[^"\\]++|\\.)*+"'
+JSON_INLINE_CONTAINER_DEPTH = 4
+JSON_SCAN_WINDOW_SIZE = 256 * 1024
 class Config:    
     CONFIG_DIR_NAME = CONFIG_DIR_NAME
     CONFIG_FILE_NAME = CONFIG_FILE_NAME
@@ -35,7 +70,15 @@ class Config:
         'window_geometry': f"{StyleManager.DEFAULT_WINDOW_SIZE[0]}x{StyleManager.DEFAULT_WINDOW_SIZE[1]}",
         'auto_backup': True,
         'backup_count': BACKUP_MAX_COUNT,
-        'theme': 'dark'
+        'theme': 'dark',
+        'save_block_size_mb': SAVE_FILE_BLOCK_SIZE_MB,
+        'save_workers': SAVE_FILE_COMPRESS_WORKERS,
+        'load_workers': SAVE_FILE_DECOMPRESS_WORKERS,
+        'json_codec': JSON_CODEC_AUTO,
+        'lazy_document': True,
+        'pixmap_cache_mb': PIXMAP_CACHE_MB,
+        'thumbnail_cache': True,
+        'image_workers': IMAGE_LOADER_WORKERS
     }
     def __init__(self):
         self.config_dir = os.path.join(os.path.expanduser("~"), self.CONFIG_DIR_NAME)
@@ -68,15 +111,281 @@ class Config:
     def reset_to_defaults(self) -> None:
         self.config = self.default_config.copy()
         self.save_config()
+class JsonCodec:
+    name = "json"
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode('ascii')
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+    NON_ASCII_PATTERN = re.compile(rb'[\x7f-\xff]+')
+    EXPONENT_PATTERN = re.compile(rb'e[-0-9]')
+    def loads(self, data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return super().loads(data)
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            data = orjson.dumps(obj)
+        except (TypeError, orjson.JSONEncodeError):
+            return super().dumps(obj)
+        # orjson writes NaN and Infinity as null, so only the stdlib encoder keeps them
+        if b'null' in data and self.contains_non_finite_float(obj):
+            return super().dumps(obj)
+        if not self.is_stdlib_float_compatible(data):
+            return super().dumps(obj)
+        if not data.isascii() or b'\x7f' in data:
+            data = self.NON_ASCII_PATTERN.sub(self._escape_non_ascii, data)
+        return data
+    def is_stdlib_float_compatible(self, data: bytes) -> bool:
+        # orjson writes floats in [1e-05, 1e-04) positionally where the stdlib switches to an exponent
+        position = data.find(b'0.0000')
+        while position != -1:
+            if position == 0 or data[position - 1] not in b'0123456789':
+                return False
+            position = data.find(b'0.0000', position + 1)
+        for match in self.EXPONENT_PATTERN.finditer(data):
+            if match.start() > 0 and data[match.start() - 1] in b'0123456789':
+                return False
+        return True
+    @staticmethod
+    def contains_non_finite_float(obj: Any) -> bool:
+        isfinite = math.isfinite
+        pending = [[obj]]
+        while pending:
+            container = pending.pop()
+            for value in (container.values() if isinstance(container, dict) else container):
+                value_type = type(value)
+                if value_type is float:
+                    if not isfinite(value):
+                        return True
+                elif value_type is dict or value_type is list:
+                    pending.append(value)
+                elif value_type is str or value_type is int or value is None or value_type is bool:
+                    continue
+                elif isinstance(value, float):
+                    if not isfinite(value):
+                        return True
+                elif isinstance(value, (dict, list, tuple)):
+                    pending.append(value)
+        return False
+    @staticmethod
+    def _escape_non_ascii(match) -> bytes:
+        return json.encoder.encode_basestring_ascii(match.group().decode('utf-8'))[1:-1].encode('ascii')
+JSON_CODECS = {codec.name: codec for codec in (JsonCodec, OrjsonCodec)}
+def get_json_codec(name: str = JSON_CODEC_AUTO) -> JsonCodec:
+    if name == JSON_CODEC_AUTO:
+        name = OrjsonCodec.name if orjson is not None else JsonCodec.name
+    if name == OrjsonCodec.name and orjson is None:
+        name = JsonCodec.name
+    return JSON_CODECS.get(name, JsonCodec)()
+def json_container_pattern_source(depth: int) -> bytes:
+    inner = rb'[^"\[\]{}]++|' + JSON_STRING_PATTERN_SOURCE
+    if depth > 0:
+        inner += b'|' + json_container_pattern_source(depth - 1)
+    return rb'\{(?:' + inner + rb')*+\}|\[(?:' + inner + rb')*+\]'
+class LazyDocument:
+    WHITESPACE_PATTERN = re.compile(rb'[ \t\n\r]*+')
+    STRING_PATTERN = re.compile(JSON_STRING_PATTERN_SOURCE)
+    VALUE_PATTERN = re.compile(
+        JSON_STRING_PATTERN_SOURCE + b'|' + json_container_pattern_source(JSON_INLINE_CONTAINER_DEPTH) + rb'|[^"\[\]{},:\s]++'
+    )
+    MEMBERS_PATTERN = re.compile(
+        rb'(?:[^"\[\]{}]++|' + JSON_STRING_PATTERN_SOURCE + b'|' + json_container_pattern_source(JSON_INLINE_CONTAINER_DEPTH) + rb')*+'
+    )
+    def __init__(self, raw: bytearray, codec: JsonCodec, decoded_keys=SSL_VALUE_EDITED_KEYS):
+        self.raw = raw
+        self.codec = codec
+        self.decoded_keys = frozenset(decoded_keys)
+        self.members = []
+        self.ssl_members = None
+        self.data = {}
+        self.snapshot = {}
+    @classmethod
+    def parse(cls, raw: bytearray, codec: JsonCodec) -> 'LazyDocument':
+        document = cls(raw, codec)
+        document.members, end = document.scan_object(0)
+        if document.skip_whitespace(end) != len(raw):
+            raise ValueError(ERROR_JSON_SPAN.format(offset=end))
+        for key, _, _, value_start, value_end in document.members:
+            if key != "SslValue":
+                continue
+            if raw[value_start] == 0x7b:
+                document.ssl_members, _ = document.scan_object(value_start)
+                document.data[key] = {
+                    ssl_key: codec.loads(raw[ssl_value_start:ssl_value_end])
+                    for ssl_key, _, _, ssl_value_start, ssl_value_end in document.ssl_members
+                    if ssl_key in document.decoded_keys
+                }
+            else:
+                document.data[key] = codec.loads(raw[value_start:value_end])
+        document.snapshot = copy.deepcopy(document.data)
+        return document
+    def skip_whitespace(self, pos: int) -> int:
+        return self.WHITESPACE_PATTERN.match(self.raw, pos).end()
+    def skip_value(self, pos: int) -> int:
+        window_end = pos + JSON_SCAN_WINDOW_SIZE
+        match = self.VALUE_PATTERN.match(self.raw, pos, window_end)
+        if match is not None and (match.end() < window_end or window_end >= len(self.raw)):
+            return match.end()
+        if pos >= len(self.raw) or self.raw[pos] not in b'{[':
+            match = self.VALUE_PATTERN.match(self.raw, pos)
+            if match is None:
+                raise ValueError(ERROR_JSON_SPAN.format(offset=pos))
+            return match.end()
+        pos += 1
+        while True:
+            window_end = pos + JSON_SCAN_WINDOW_SIZE
+            pos = self.MEMBERS_PATTERN.match(self.raw, pos, window_end).end()
+            if pos >= len(self.raw):
+                raise ValueError(ERROR_JSON_SPAN.format(offset=pos))
+            if self.raw[pos] in b'}]':
+                return pos + 1
+            if pos < window_end:
+                pos = self.skip_value(pos)
+    def scan_object(self, pos: int) -> Tuple[List[Tuple[str, int, int, int, int]], int]:
+        raw = self.raw
+        pos = self.skip_whitespace(pos)
+        if pos >= len(raw) or raw[pos] != 0x7b:
+            raise ValueError(ERROR_JSON_SPAN.format(offset=pos))
+        members = []
+        pos = self.skip_whitespace(pos + 1)
+        if pos < len(raw) and raw[pos] == 0x7d:
+            return members, pos + 1
+        while True:
+            key_match = self.STRING_PATTERN.match(raw, pos)
+            if key_match is None:
+                raise ValueError(ERROR_JSON_SPAN.format(offset=pos))
+            key_start, key_end = key_match.span()
+            pos = self.skip_whitespace(key_end)
+            if pos >= len(raw) or raw[pos] != 0x3a:
+                raise ValueError(ERROR_JSON_SPAN.format(offset=pos))
+            value_start = self.skip_whitespace(pos + 1)
+            value_end = self.skip_value(value_start)
+            members.append((self.codec.loads(raw[key_start:key_end]), key_start, key_end, value_start, value_end))
+            pos = self.skip_whitespace(value_end)
+            if pos < len(raw) and raw[pos] == 0x2c:
+                pos = self.skip_whitespace(pos + 1)
+            elif pos < len(raw) and raw[pos] == 0x7d:
+                return members, pos + 1
+            else:
+                raise ValueError(ERROR_JSON_SPAN.format(offset=pos))
+    def splice_object(self, view: memoryview, members, values: Dict[str, Any], decoded_keys, spliced: Optional[Dict[str, List]] = None) -> List:
+        spliced = spliced or {}
+        parts = [b'{']
+        seen = set()
+        for key, key_start, key_end, value_start, value_end in members:
+            if key in seen:
+                continue
+            if key in spliced:
+                value_parts = spliced[key]
+            elif key in values:
+                value_parts = [self.codec.dumps(values[key])]
+            elif key in decoded_keys:
+                continue
+            else:
+                value_parts = [view[value_start:value_end]]
+            seen.add(key)
+            parts.append(view[key_start:key_end])
+            parts.append(b':')
+            parts.extend(value_parts)
+            parts.append(b',')
+        for key, value in values.items():
+            if key not in seen:
+                parts.extend((self.codec.dumps(key), b':', self.codec.dumps(value), b','))
+        if parts[-1] == b',':
+            parts.pop()
+        parts.append(b'}')
+        return parts
+    def patch_in_place(self, data: Dict[str, Any]) -> Optional[bytearray]:
+        ssl_value = data.get("SslValue")
+        if self.ssl_members is None or not isinstance(ssl_value, dict) or data.keys() != self.snapshot.keys():
+            return None
+        snapshot = self.snapshot["SslValue"]
+        if ssl_value.keys() != snapshot.keys():
+            return None
+        patches = []
+        for key, _, _, value_start, value_end in self.ssl_members:
+            if key in snapshot and ssl_value[key] != snapshot[key]:
+                patches.append((value_start, value_end, self.codec.dumps(ssl_value[key])))
+        for value_start, value_end, value in reversed(patches):
+            self.raw[value_start:value_end] = value
+        if patches:
+            patch_ends = [value_end for _, value_end, _ in patches]
+            shifts = [0]
+            for value_start, value_end, value in patches:
+                shifts.append(shifts[-1] + len(value) - (value_end - value_start))
+            def shift(offset):
+                return offset + shifts[bisect.bisect_right(patch_ends, offset)]
+            self.members = [(key, shift(ks), shift(ke), shift(vs), shift(ve)) for key, ks, ke, vs, ve in self.members]
+            self.ssl_members = [(key, shift(ks), shift(ke), shift(vs), shift(ve)) for key, ks, ke, vs, ve in self.ssl_members]
+            self.snapshot = copy.deepcopy(data)
+        return self.raw
+    def dumps(self, data: Dict[str, Any]) -> bytes:
+        with memoryview(self.raw) as view:
+            ssl_value = data.get("SslValue")
+            spliced = {}
+            values = data
+            if self.ssl_members is not None and isinstance(ssl_value, dict):
+                spliced["SslValue"] = self.splice_object(view, self.ssl_members, ssl_value, self.decoded_keys)
+                values = {key: value for key, value in data.items() if key != "SslValue"}
+            return b"".join(self.splice_object(view, self.members, values, self.data.keys(), spliced))
+class SaveHeader:
+    __slots__ = (
+        'magic', 'total_compressed_size', 'unknown_bytes_8_12', 'total_uncompressed_size',
+        'unknown_bytes_16_20', 'md5_hex', 'unknown_byte_52', 'verified'
+    )
+    LAYOUT = struct.Struct('<4sI4sI4s32s1s')
+    def __init__(self, magic: bytes, total_compressed_size: int, unknown_bytes_8_12: bytes, total_uncompressed_size: int,
+                 unknown_bytes_16_20: bytes, md5_hex: str, unknown_byte_52: bytes):
+        self.magic = magic
+        self.total_compressed_size = total_compressed_size
+        self.unknown_bytes_8_12 = unknown_bytes_8_12
+        self.total_uncompressed_size = total_uncompressed_size
+        self.unknown_bytes_16_20 = unknown_bytes_16_20
+        self.md5_hex = md5_hex
+        self.unknown_byte_52 = unknown_byte_52
+        self.verified = None
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SaveHeader':
+        if len(data) < SAVE_FILE_HEADER_LENGTH:
+            raise Exception(ERROR_SAVE_HEADER_TOO_SHORT.format(length=len(data)))
+        magic, total_compressed_size, unknown_bytes_8_12, total_uncompressed_size, unknown_bytes_16_20, md5_bytes, unknown_byte_52 = cls.LAYOUT.unpack_from(data)
+        return cls(magic, total_compressed_size, unknown_bytes_8_12, total_uncompressed_size,
+                   unknown_bytes_16_20, md5_bytes.decode('ascii', errors='replace'), unknown_byte_52)
+    @classmethod
+    def read(cls, file_path: str) -> 'SaveHeader':
+        with open(file_path, 'rb') as f:
+            return cls.from_bytes(f.read(SAVE_FILE_HEADER_LENGTH))
+    def to_bytes(self) -> bytes:
+        return self.LAYOUT.pack(
+            self.magic, self.total_compressed_size, self.unknown_bytes_8_12, self.total_uncompressed_size,
+            self.unknown_bytes_16_20, self.md5_hex.encode('ascii'), self.unknown_byte_52
+        )
+class SaveCancelledError(Exception):
+    pass
 class SaveManager:
     def compute_md5_hex(self, data: bytes) -> str:
         return hashlib.md5(data).hexdigest()
+    def iter_zlib_blocks(self, data, start_offset: int = SAVE_FILE_HEADER_LENGTH, stream_size: Optional[int] = None) -> Iterator[Tuple[int, int, int, memoryview]]:
+        with memoryview(data) as view:
+            end_offset = len(view)
+            stream_end = start_offset + stream_size if stream_size is not None else end_offset
+            offset = start_offset
+            while offset < stream_end and offset + 8 <= end_offset:
+                uncompressed_size, compressed_size = struct.unpack_from('<II', view, offset)
+                payload_end = offset + 8 + compressed_size
+                if compressed_size < 6 or payload_end > end_offset:
+                    raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=offset))
+                yield offset, uncompressed_size, compressed_size, view[offset + 8:payload_end]
+                offset = payload_end
     def try_decompress_zlib_block(self, data: bytes, start_offset: int = 0) -> Optional[Dict]:
-        zlib_block_with_headers = data[start_offset:]
+        zlib_block_with_headers = memoryview(data)[start_offset:]
         if len(zlib_block_with_headers) < 8:
             return None
-        uncompressed_size = int.from_bytes(zlib_block_with_headers[0:4], byteorder='little')
-        compressed_size = int.from_bytes(zlib_block_with_headers[4:8], byteorder='little')
+        uncompressed_size, compressed_size = struct.unpack_from('<II', zlib_block_with_headers)
         if len(zlib_block_with_headers) < compressed_size + 8:
             return None
         if compressed_size < 6:
@@ -93,63 +402,239 @@ class SaveManager:
             'compressed_size': compressed_size,
             'decompressed_bytes': decompressed
         }
-    def decode_file(self, file_path: str) -> Tuple[Optional[bytes], Optional[bytes]]:
+    def iter_payload_slices(self, payload, slice_size: int = SAVE_FILE_INFLATE_CHUNK_SIZE) -> Iterator[memoryview]:
+        for start in range(0, len(payload), slice_size):
+            yield payload[start:start + slice_size]
+    def iter_file_payload_slices(self, file_obj, compressed_size: int, offset: int, slice_size: int = SAVE_FILE_INFLATE_CHUNK_SIZE) -> Iterator[bytes]:
+        remaining = compressed_size
+        while remaining > 0:
+            data = file_obj.read(min(slice_size, remaining))
+            if not data:
+                raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=offset))
+            remaining -= len(data)
+            yield data
+    def iter_file_blocks(self, file_obj) -> Iterator[Tuple[int, Iterator[bytes]]]:
+        header = SaveHeader.from_bytes(file_obj.read(SAVE_FILE_HEADER_LENGTH))
+        stream_end = SAVE_FILE_HEADER_LENGTH + header.total_compressed_size
+        offset = SAVE_FILE_HEADER_LENGTH
+        while offset < stream_end:
+            block_header = file_obj.read(8)
+            if len(block_header) < 8:
+                break
+            _, compressed_size = struct.unpack('<II', block_header)
+            if compressed_size < 6:
+                raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=offset))
+            yield offset, self.iter_file_payload_slices(file_obj, compressed_size, offset)
+            offset += compressed_size + 8
+    def iter_buffer_blocks(self, data) -> Iterator[Tuple[int, Iterator[memoryview]]]:
+        stream_size = int.from_bytes(data[4:8], byteorder='little')
+        for offset, _, _, payload in self.iter_zlib_blocks(data, stream_size=stream_size):
+            yield offset, self.iter_payload_slices(payload)
+    def iter_inflated_block(self, payload_slices, max_length: int = 0) -> Iterator[bytes]:
+        decompressor = zlib.decompressobj(wbits=15)
+        for compressed in payload_slices:
+            yield decompressor.decompress(compressed, max_length)
+            while decompressor.unconsumed_tail:
+                yield decompressor.decompress(decompressor.unconsumed_tail, max_length)
+        yield decompressor.flush()
+        if not decompressor.eof:
+            raise zlib.error("incomplete zlib stream")
+    def iter_decompressed_chunks(self, source, chunk_size: int = SAVE_FILE_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                yield from self.iter_decompressed_chunks(f, chunk_size)
+            return
+        if isinstance(source, (mmap.mmap, bytes, bytearray, memoryview)):
+            blocks = self.iter_buffer_blocks(source)
+        else:
+            blocks = self.iter_file_blocks(source)
+        pending = bytearray()
+        try:
+            for offset, payload_slices in blocks:
+                try:
+                    for data in self.iter_inflated_block(payload_slices, chunk_size):
+                        pending += data
+                        while len(pending) >= chunk_size:
+                            yield bytes(pending[:chunk_size])
+                            del pending[:chunk_size]
+                except zlib.error:
+                    raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=offset))
+        finally:
+            blocks.close()
+        if pending:
+            yield bytes(pending)
+    def inflate_block_into(self, payload, output: bytearray, position: int = 0,
+                           progress: Optional[Callable[[int], None]] = None) -> int:
+        for chunk in self.iter_inflated_block(self.iter_payload_slices(payload)):
+            output[position:position + len(chunk)] = chunk
+            position += len(chunk)
+            if progress is not None:
+                progress(position)
+        return position
+    def scan_block_index(self, data) -> List[Tuple[int, int, int, memoryview]]:
+        stream_size = int.from_bytes(data[4:8], byteorder='little')
+        return list(self.iter_zlib_blocks(data, stream_size=stream_size))
+    def inflate_blocks_parallel(self, block_index: List[Tuple[int, int, int, memoryview]], workers: int,
+                                progress: Optional[Callable[[int, int], None]] = None) -> Optional[bytearray]:
+        positions = []
+        total_uncompressed_size = 0
+        for _, uncompressed_size, _, _ in block_index:
+            positions.append(total_uncompressed_size)
+            total_uncompressed_size += uncompressed_size
+        decompressed_data = bytearray(total_uncompressed_size)
+        def inflate(block, position):
+            offset, uncompressed_size, _, payload = block
+            try:
+                data = zlib.decompress(payload, wbits=15, bufsize=max(uncompressed_size, 1))
+            except zlib.error:
+                raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=offset))
+            if len(data) != uncompressed_size:
+                return False
+            decompressed_data[position:position + uncompressed_size] = data
+            return True
+        placed = []
+        inflated_size = 0
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for block, block_placed in zip(block_index, executor.map(inflate, block_index, positions)):
+                placed.append(block_placed)
+                inflated_size += block[1]
+                if progress is not None:
+                    progress(inflated_size, total_uncompressed_size)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return decompressed_data if all(placed) else None
+    def decode_file(self, file_path: str, workers: int = 1,
+                    progress: Optional[Callable[[int, int], None]] = None) -> Tuple[Optional[bytes], Optional[bytearray]]:
         try:
             with open(file_path, 'rb') as f:
-                file_content = f.read()
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         except Exception as e:
             raise Exception(f"Error reading file {file_path}: {e}")
-        offset = SAVE_FILE_HEADER_LENGTH
-        decompressed_data = bytearray()
-        total_compressed_size_expected = int.from_bytes(file_content[4:8], byteorder='little')
-        total_uncompressed_size_expected = int.from_bytes(file_content[12:16], byteorder='little')
-        bytes_processed_in_stream = 0
-        while bytes_processed_in_stream < total_compressed_size_expected and (offset + 8) <= len(file_content):
-            current_block_data = file_content[offset:]
-            result = self.try_decompress_zlib_block(current_block_data, start_offset=0)
-            if result is None:
-                raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=offset))
-            decompressed_data.extend(result['decompressed_bytes'])
-            bytes_processed_in_stream += result['compressed_size'] + 8
-            offset += result['compressed_size'] + 8
+        try:
+            header_content = mapped[:SAVE_FILE_HEADER_LENGTH]
+            header = SaveHeader.from_bytes(header_content)
+            total_compressed_size_expected = header.total_compressed_size
+            total_uncompressed_size_expected = header.total_uncompressed_size
+            block_index = self.scan_block_index(mapped)
+            failed_offset = None
+            try:
+                decompressed_data = None
+                if workers > 1 and len(block_index) > 1:
+                    decompressed_data = self.inflate_blocks_parallel(block_index, workers, progress)
+                if decompressed_data is None:
+                    decompressed_data = bytearray(total_uncompressed_size_expected)
+                    position = 0
+                    block_progress = None
+                    if progress is not None:
+                        block_progress = lambda done: progress(done, total_uncompressed_size_expected)
+                    for offset, _, _, payload in block_index:
+                        try:
+                            position = self.inflate_block_into(payload, decompressed_data, position, block_progress)
+                        except zlib.error:
+                            failed_offset = offset
+                            break
+                    del decompressed_data[position:]
+            finally:
+                for _, _, _, payload in block_index:
+                    payload.release()
+        finally:
+            mapped.close()
+        if failed_offset is not None:
+            raise Exception(ERROR_DECOMPRESS_BLOCK.format(offset=failed_offset))
+        bytes_processed_in_stream = sum(compressed_size + 8 for _, _, compressed_size, _ in block_index)
         if len(decompressed_data) != total_uncompressed_size_expected:
             pass
         if bytes_processed_in_stream != total_compressed_size_expected:
             pass
-        return file_content, decompressed_data
-    def encode_file(self, original_header_content: bytes, decompressed_data_bytes: bytes, output_path: str) -> bool:
+        return header_content, decompressed_data
+    def compress_block(self, chunk) -> bytes:
+        return zlib.compress(chunk, level=zlib.Z_DEFAULT_COMPRESSION, wbits=15)
+    def iter_compressed_blocks(self, decompressed_data_bytes: bytes, block_size: int, workers: int = 1) -> Iterator[Tuple[int, bytes]]:
+        view = memoryview(decompressed_data_bytes)
+        chunks = [view[start:start + block_size] for start in range(0, len(view), block_size)]
+        if workers > 1 and len(chunks) > 1:
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                for chunk, compressed_data in zip(chunks, executor.map(self.compress_block, chunks)):
+                    yield len(chunk), compressed_data
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            for chunk in chunks:
+                yield len(chunk), self.compress_block(chunk)
+    def build_header(self, original_header_content: bytes, total_compressed_size: int, total_uncompressed_size: int, md5_hex: str) -> bytes:
+        header = SaveHeader.from_bytes(original_header_content)
+        header.total_compressed_size = total_compressed_size
+        header.total_uncompressed_size = total_uncompressed_size
+        header.md5_hex = md5_hex
+        return header.to_bytes()
+    def encode_file(self, original_header_content: bytes, decompressed_data_bytes: bytes, output_path: str,
+                    block_size: int = SAVE_FILE_BLOCK_SIZE_MB * 1024 * 1024, workers: int = SAVE_FILE_COMPRESS_WORKERS,
+                    progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        temp_path = output_path + SAVE_FILE_TEMP_SUFFIX
         try:
             if not decompressed_data_bytes:
                 raise Exception(ERROR_DECOMPRESS_SAVE)
-            new_compressed_data = zlib.compress(
-                decompressed_data_bytes, 
-                level=zlib.Z_DEFAULT_COMPRESSION, 
-                wbits=15
-            )
-            new_block_uncompressed_size_bytes = len(decompressed_data_bytes).to_bytes(4, 'little')
-            new_block_compressed_size_bytes = len(new_compressed_data).to_bytes(4, 'little')
-            new_zlib_data_blocks = new_block_uncompressed_size_bytes + new_block_compressed_size_bytes + new_compressed_data
-            magic_bytes = original_header_content[0:4]
-            unknown_bytes_8_12 = original_header_content[8:12]
-            unknown_bytes_16_20 = original_header_content[16:20]
-            unknown_byte_52 = original_header_content[52:53]
-            new_total_compressed_size_bytes = len(new_zlib_data_blocks).to_bytes(4, 'little')
-            new_total_uncompressed_size_bytes = len(decompressed_data_bytes).to_bytes(4, 'little')
-            new_md5_header_bytes = self.compute_md5_hex(new_zlib_data_blocks).encode('ascii')
-            final_header = (
-                magic_bytes +
-                new_total_compressed_size_bytes +
-                unknown_bytes_8_12 +
-                new_total_uncompressed_size_bytes +                unknown_bytes_16_20 +
-                new_md5_header_bytes +
-                unknown_byte_52
-            )
-            final_data_to_write = final_header + new_zlib_data_blocks
-            with open(output_path, 'wb') as f:
-                f.write(final_data_to_write)
+            md5 = hashlib.md5()
+            total_compressed_size = 0
+            total_uncompressed_size = 0
+            with open(temp_path, 'wb') as f:
+                f.write(bytes(SAVE_FILE_HEADER_LENGTH))
+                blocks = self.iter_compressed_blocks(decompressed_data_bytes, max(1, block_size), max(1, workers))
+                try:
+                    for uncompressed_size, compressed_data in blocks:
+                        block_header = struct.pack('<II', uncompressed_size, len(compressed_data))
+                        md5.update(block_header)
+                        md5.update(compressed_data)
+                        f.write(block_header)
+                        f.write(compressed_data)
+                        total_compressed_size += len(block_header) + len(compressed_data)
+                        total_uncompressed_size += uncompressed_size
+                        if progress is not None:
+                            progress(total_uncompressed_size, len(decompressed_data_bytes))
+                finally:
+                    blocks.close()
+                f.seek(0)
+                f.write(self.build_header(original_header_content, total_compressed_size, len(decompressed_data_bytes), md5.hexdigest()))
+            os.replace(temp_path, output_path)
             return True
         except Exception as e:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if isinstance(e, SaveCancelledError):
+                raise
             raise Exception(ERROR_ENCODING.format(error=e))
+    def verify_save(self, file_path: str, header: Optional[SaveHeader] = None,
+                    progress: Optional[Callable[[int, int], None]] = None) -> bool:
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            if header is None:
+                header = SaveHeader.from_bytes(f.read(SAVE_FILE_HEADER_LENGTH))
+            else:
+                f.seek(SAVE_FILE_HEADER_LENGTH)
+            remaining = header.total_compressed_size
+            while remaining > 0:
+                data = f.read(min(SAVE_FILE_STREAM_CHUNK_SIZE, remaining))
+                if not data:
+                    break
+                md5.update(data)
+                remaining -= len(data)
+                if progress is not None:
+                    progress(header.total_compressed_size - remaining, header.total_compressed_size)
+        header.verified = remaining == 0 and md5.hexdigest() == header.md5_hex.lower()
+        return header.verified
+    def peek_save(self, file_path: str, verify: bool = False,
+                  progress: Optional[Callable[[int, int], None]] = None) -> Optional[SaveHeader]:
+        try:
+            header = SaveHeader.read(file_path)
+            if verify:
+                self.verify_save(file_path, header, progress)
+            return header
+        except SaveCancelledError:
+            raise
+        except Exception as e:
+            return None
     def get_steam_users(self) -> Dict[str, List[str]]:
         users = {}
         try:
@@ -218,29 +703,386 @@ class SaveManager:
         return warnings
 BACKGROUND_IMAGE = os.path.join(UI_IMAGES_DIR, "background.jpg")
 os.makedirs(UI_IMAGES_DIR, exist_ok=True)
+class PixmapCache:
+    def __init__(self, max_bytes: int = PIXMAP_CACHE_MB * 1024 * 1024, thumbnail_dir: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.thumbnail_dir = thumbnail_dir
+        self.entries: "OrderedDict[Tuple[str, int, int, float], QPixmap]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.decodes = 0
+        self.decode_seconds = 0.0
+    @staticmethod
+    def pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+    def peek(self, key: Tuple[str, int, int, float]) -> Optional[QPixmap]:
+        pixmap = self.entries.get(key)
+        if pixmap is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return pixmap
+    def get(self, path: str, width: int, height: int, device_pixel_ratio: float = 1.0) -> Optional[QPixmap]:
+        key = (path, width, height, device_pixel_ratio)
+        pixmap = self.peek(key)
+        if pixmap is not None:
+            return pixmap
+        self.misses += 1
+        image, decode_seconds = self.load_image(path, width, height, device_pixel_ratio)
+        self.record_load(image, decode_seconds)
+        return self.insert_image(key, image)
+    def record_load(self, image: Optional[QImage], decode_seconds: Optional[float]) -> None:
+        if image is None:
+            return
+        if decode_seconds is None:
+            self.disk_hits += 1
+        else:
+            self.decodes += 1
+            self.decode_seconds += decode_seconds
+    def insert_image(self, key: Tuple[str, int, int, float], image: Optional[QImage]) -> Optional[QPixmap]:
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[3])
+        self.put(key, pixmap)
+        return pixmap
+    def put(self, key: Tuple[str, int, int, float], pixmap: QPixmap) -> None:
+        size = self.pixmap_bytes(pixmap)
+        if size > self.max_bytes:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= self.pixmap_bytes(previous)
+        self.entries[key] = pixmap
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= self.pixmap_bytes(evicted)
+    def clear(self) -> None:
+        self.entries.clear()
+        self.total_bytes = 0
+    def get_thumbnail_path(self, path: str, stat: os.stat_result, pixel_width: int, pixel_height: int) -> str:
+        key = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}|{pixel_width}x{pixel_height}"
+        return os.path.join(self.thumbnail_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".png")
+    def load_image(self, path: str, width: int, height: int,
+                   device_pixel_ratio: float) -> Tuple[Optional[QImage], Optional[float]]:
+        pixel_width = max(1, round(width * device_pixel_ratio))
+        pixel_height = max(1, round(height * device_pixel_ratio))
+        packed = find_packed_image(path, pixel_width, pixel_height)
+        if packed is not None:
+            started = time.perf_counter()
+            image = QImage.fromData(packed)
+            if image.isNull():
+                return None, None
+            if image.width() != pixel_width and image.height() != pixel_height:
+                image = image.scaled(
+                    pixel_width, pixel_height,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+            return image, time.perf_counter() - started
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None, None
+        thumbnail_path = None
+        if self.thumbnail_dir:
+            thumbnail_path = self.get_thumbnail_path(path, stat, pixel_width, pixel_height)
+            if os.path.isfile(thumbnail_path):
+                image = QImage(thumbnail_path)
+                if not image.isNull():
+                    return image, None
+        started = time.perf_counter()
+        source = QImage(path)
+        if source.isNull():
+            return None, None
+        image = source.scaled(
+            pixel_width, pixel_height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        decode_seconds = time.perf_counter() - started
+        if thumbnail_path:
+            self.save_thumbnail(image, thumbnail_path)
+        return image, decode_seconds
+    def save_thumbnail(self, image: QImage, thumbnail_path: str) -> None:
+        temp_path = f"{thumbnail_path}.{threading.get_ident()}{SAVE_FILE_TEMP_SUFFIX}"
+        try:
+            os.makedirs(self.thumbnail_dir, exist_ok=True)
+            if image.save(temp_path, "PNG"):
+                os.replace(temp_path, thumbnail_path)
+        except OSError:
+            pass
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'decodes': self.decodes,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'decode_ms': self.decode_seconds * 1000,
+            'avg_decode_ms': self.decode_seconds * 1000 / self.decodes if self.decodes else 0.0,
+            'entries': len(self.entries),
+            'bytes': self.total_bytes
+        }
+class ImageLoadTask(QRunnable):
+    def __init__(self, loader: 'ImageLoader', key: Tuple[str, int, int, float], generation: int):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.generation = generation
+    def run(self):
+        if self.generation != self.loader.generation:
+            return
+        image, decode_seconds = self.loader.pixmap_cache.load_image(*self.key)
+        try:
+            self.loader.loaded.emit(self.key, image, decode_seconds)
+        except RuntimeError:
+            pass
+class ImageLoader(QObject):
+    loaded = pyqtSignal(object, object, object)
+    imageReady = pyqtSignal(object)
+    def __init__(self, pixmap_cache: PixmapCache, workers: int = IMAGE_LOADER_WORKERS, parent=None):
+        super().__init__(parent)
+        self.pixmap_cache = pixmap_cache
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(1, workers))
+        self.pending = set()
+        self.generation = 0
+        self.loaded.connect(self._on_loaded)
+    def request(self, path: str, width: int, height: int, device_pixel_ratio: float = 1.0,
+                prefetch: bool = False) -> Optional[QPixmap]:
+        key = (path, width, height, device_pixel_ratio)
+        pixmap = self.pixmap_cache.peek(key)
+        if pixmap is not None or key in self.pending:
+            return pixmap
+        self.pixmap_cache.misses += 1
+        self.pending.add(key)
+        self.pool.start(ImageLoadTask(self, key, self.generation), 0 if prefetch else 1)
+        return None
+    def cancel_pending(self) -> None:
+        self.generation += 1
+        self.pool.clear()
+        self.pending.clear()
+    def shutdown(self) -> None:
+        self.cancel_pending()
+        self.pool.waitForDone()
+    def _on_loaded(self, key, image, decode_seconds):
+        self.pending.discard(key)
+        self.pixmap_cache.record_load(image, decode_seconds)
+        self.pixmap_cache.insert_image(key, image)
+        self.imageReady.emit(key)
+class SaveFileWorker(QThread):
+    progressChanged = pyqtSignal(int, str)
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    def __init__(self, save_manager: SaveManager, task: Callable[[], Any], parent=None):
+        super().__init__(parent)
+        self.save_manager = save_manager
+        self.task = task
+        self.cancel_event = threading.Event()
+        self.last_progress_time = 0.0
+    def cancel(self) -> None:
+        self.cancel_event.set()
+    def check_cancelled(self) -> None:
+        if self.cancel_event.is_set():
+            raise SaveCancelledError()
+    def report(self, value: int, detail: str, force: bool = False) -> None:
+        self.check_cancelled()
+        now = time.monotonic()
+        if force or now - self.last_progress_time >= SAVE_PROGRESS_INTERVAL:
+            self.last_progress_time = now
+            self.progressChanged.emit(value, detail)
+    def stage_progress(self, start: int, end: int, detail: str) -> Callable[[int, int], None]:
+        self.report(start, detail, force=True)
+        def progress(done: int, total: int) -> None:
+            self.report(start + (end - start) * done // max(total, 1), DIALOG_PROGRESS_BYTES.format(
+                detail=detail, done=done / (1024 * 1024), total=total / (1024 * 1024)
+            ))
+        return progress
+    def run(self):
+        try:
+            result = self.task()
+        except SaveCancelledError:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(result)
+class SaveLoadWorker(SaveFileWorker):
+    def __init__(self, save_manager: SaveManager, json_codec: JsonCodec, save_path: str,
+                 workers: int = 1, lazy_document: bool = True, parent=None):
+        super().__init__(save_manager, self.load_save, parent)
+        self.json_codec = json_codec
+        self.save_path = save_path
+        self.workers = workers
+        self.lazy_document = lazy_document
+    def load_save(self) -> Tuple[Optional[SaveHeader], bytes, Any, Optional[LazyDocument]]:
+        header = self.save_manager.peek_save(
+            self.save_path, verify=True, progress=self.stage_progress(0, 20, DIALOG_LOADING_READING)
+        )
+        header_content, decompressed_data = self.save_manager.decode_file(
+            self.save_path, workers=self.workers, progress=self.stage_progress(20, 70, DIALOG_LOADING_DECOMPRESSING)
+        )
+        if decompressed_data is None:
+            raise Exception(ERROR_DECOMPRESS_SAVE)
+        self.report(70, DIALOG_LOADING_PARSING, force=True)
+        document = None
+        if self.lazy_document:
+            try:
+                document = LazyDocument.parse(decompressed_data, self.json_codec)
+            except ValueError:
+                document = None
+        json_data = document.data if document is not None else self.json_codec.loads(decompressed_data)
+        del decompressed_data
+        self.report(95, DIALOG_LOADING_VALIDATING, force=True)
+        self.save_manager.validate_save_data(json_data)
+        self.report(100, DIALOG_LOADING_COMPLETE, force=True)
+        return header, header_content, json_data, document
+class SaveWriteWorker(SaveFileWorker):
+    def __init__(self, save_manager: SaveManager, json_codec: JsonCodec, json_data: Dict[str, Any],
+                 lazy_document: Optional[LazyDocument], header_content: bytes, save_path: str,
+                 block_size: int, workers: int = 1, parent=None):
+        super().__init__(save_manager, self.write_save, parent)
+        self.json_codec = json_codec
+        self.json_data = json_data
+        self.lazy_document = lazy_document
+        self.header_content = header_content
+        self.save_path = save_path
+        self.block_size = block_size
+        self.workers = workers
+    def write_save(self) -> bool:
+        self.report(0, DIALOG_SAVE_SERIALIZING, force=True)
+        if self.lazy_document is not None:
+            decompressed_data_bytes = self.lazy_document.patch_in_place(self.json_data)
+            if decompressed_data_bytes is None:
+                decompressed_data_bytes = self.lazy_document.dumps(self.json_data)
+        else:
+            decompressed_data_bytes = self.json_codec.dumps(self.json_data)
+        self.save_manager.encode_file(
+            self.header_content, decompressed_data_bytes, self.save_path,
+            block_size=self.block_size, workers=self.workers,
+            progress=self.stage_progress(10, 100, DIALOG_SAVE_PROGRESS)
+        )
+        # The file has been replaced by now, so a late cancel must not report the save as untouched
+        self.progressChanged.emit(100, DIALOG_SAVE_COMPLETE)
+        return True
+class SaveDocument(QObject):
+    trucksChanged = pyqtSignal(object)
+    statsChanged = pyqtSignal(object)
+    levelsChanged = pyqtSignal()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ssl_value: Dict[str, Any] = {}
+        self.truck_state: Optional[TruckLockState] = None
+        self.touched: Set[str] = set()
+        self.operation: Optional[str] = None
+        self.rebuild_counts: Dict[str, int] = {}
+    def begin_operation(self, operation: str) -> None:
+        self.operation = operation
+        self.rebuild_counts[operation] = 0
+    def end_operation(self) -> None:
+        self.operation = None
+    def record_rebuild(self, count: int) -> None:
+        if self.operation is not None:
+            self.rebuild_counts[self.operation] += count
+    def get_rebuild_counts(self) -> Dict[str, int]:
+        return dict(self.rebuild_counts)
+    def touch(self, section: str) -> None:
+        self.touched.add(section)
+    def is_touched(self, *sections: str) -> bool:
+        return any(section in self.touched for section in sections)
+    def mark_saved(self) -> None:
+        self.touched.clear()
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'money': self.ssl_value.get("money", 0),
+            'xp': self.ssl_value.get("xp", 0),
+            'companyName': self.ssl_value.get("companyName", "")
+        }
+    def load(self, ssl_value: Dict[str, Any], truck_state: TruckLockState) -> None:
+        self.ssl_value = ssl_value
+        self.truck_state = truck_state
+        self.touched.clear()
+        self.begin_operation("load")
+        try:
+            self.trucksChanged.emit(None)
+            self.statsChanged.emit(self.get_stats())
+            self.levelsChanged.emit()
+        finally:
+            self.end_operation()
+    def move_truck(self, truck_id: str, unlock: bool) -> None:
+        if unlock:
+            self.truck_state.unlock(truck_id)
+        else:
+            self.truck_state.lock(truck_id)
+        self.touch(DOCUMENT_SECTION_TRUCKS)
+        self.begin_operation("move_truck")
+        try:
+            self.trucksChanged.emit([truck_id])
+        finally:
+            self.end_operation()
+    def move_all_trucks(self, truck_ids: Iterable[str], unlock: bool) -> None:
+        if unlock:
+            self.truck_state.set_all_unlocked(truck_ids)
+        else:
+            self.truck_state.set_all_locked(truck_ids)
+        self.touch(DOCUMENT_SECTION_TRUCKS)
+        self.begin_operation("move_all_trucks")
+        try:
+            self.trucksChanged.emit(None)
+        finally:
+            self.end_operation()
+    def set_stats(self, money: int, xp: int, company_name: str) -> None:
+        stats = {'money': money, 'xp': xp, 'companyName': company_name}
+        if stats == self.get_stats():
+            return
+        self.ssl_value.update(stats)
+        self.touch(DOCUMENT_SECTION_STATS)
+        self.begin_operation("set_stats")
+        try:
+            self.statsChanged.emit(stats)
+        finally:
+            self.end_operation()
 class ProgressDialog(QDialog):
+    cancelRequested = pyqtSignal()
     def __init__(self, parent=None, title=DIALOG_PROCESSING_TITLE, message=DIALOG_PROCESSING_MESSAGE):
         super().__init__(parent)
         self.setWindowTitle(title)
         self.setModal(True)
-        self.setFixedSize(400, 150)
+        self.setFixedSize(400, 190)
         layout = QVBoxLayout(self)
         self.label = QLabel(message)
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.label.setStyleSheet(StyleManager.get_style('dialog_label'))
+        self.label.setObjectName("dialogLabel")
         self.progress_bar = QProgressBar()
         self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet(StyleManager.get_style('progress_bar'))
+        self.progress_bar.setObjectName("progressBar")
         self.detail_label = QLabel("")
         self.detail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.cancel_button = QPushButton(BUTTON_CANCEL)
+        self.cancel_button.setObjectName("actionButton")
+        self.cancel_button.clicked.connect(self.reject)
         layout.addWidget(self.label)
         layout.addWidget(self.progress_bar)
         layout.addWidget(self.detail_label)
+        layout.addWidget(self.cancel_button, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.setContentsMargins(*StyleManager.PANEL_MARGINS)
     def update_progress(self, value: int, detail: str = ""):
+        if not self.cancel_button.isEnabled():
+            return
         self.progress_bar.setValue(value)
         self.detail_label.setText(detail)
-        QApplication.processEvents()
+    def reject(self):
+        if self.cancel_button.isEnabled():
+            self.cancel_button.setEnabled(False)
+            self.detail_label.setText(DIALOG_CANCELLING)
+            self.cancelRequested.emit()
+    def finish(self):
+        self.done(QDialog.DialogCode.Accepted)
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -249,11 +1091,22 @@ class MainWindow(QMainWindow):
         self._drag_pos = None
         self.config = Config()
         self.current_save_path = None
-        self.original_file_content = None
+        self.original_header_content = None
         self.json_data = None
+        self.lazy_document = None
+        self.truck_state = None
+        self.document = SaveDocument(self)
         self.current_truck_image = None
         self.save_manager = SaveManager()
+        self.json_codec = get_json_codec(self.config.get('json_codec'))
         self.trucks_data = TrucksData()
+        self.pixmap_cache = PixmapCache(
+            int(self.config.get('pixmap_cache_mb') * 1024 * 1024),
+            os.path.join(self.config.config_dir, THUMBNAIL_CACHE_DIR_NAME) if self.config.get('thumbnail_cache') else None
+        )
+        self.image_loader = ImageLoader(self.pixmap_cache, self.config.get('image_workers'), self)
+        self.file_worker = None
+        self.file_progress = None
         self.setWindowTitle(WINDOW_TITLE)
         self.resize(*StyleManager.DEFAULT_WINDOW_SIZE)
         if os.path.exists(ICON_PATH):
@@ -277,7 +1130,6 @@ class MainWindow(QMainWindow):
         main_layout.setSpacing(StyleManager.PANEL_SPACING)
         header_frame = QFrame()
         header_frame.setObjectName("headerFrame")
-        header_frame.setStyleSheet(StyleManager.get_style('header_frame'))
         header_container = QVBoxLayout()
         header_container.setContentsMargins(0, 0, 0, 0)
         header_container.setSpacing(0)
@@ -288,12 +1140,12 @@ class MainWindow(QMainWindow):
         btn_min = QPushButton("–")
         btn_min.setMinimumSize(28, 28)
         btn_min.setMaximumSize(28, 28)
-        btn_min.setStyleSheet(StyleManager.get_style('window_min_button'))
+        btn_min.setObjectName("windowMinButton")
         btn_min.clicked.connect(self.showMinimized)
         btn_close = QPushButton("×")
         btn_close.setMinimumSize(28, 28)
         btn_close.setMaximumSize(28, 28)
-        btn_close.setStyleSheet(StyleManager.get_style('window_close_button'))
+        btn_close.setObjectName("windowCloseButton")
         btn_close.clicked.connect(self.close)
         window_controls_bar.addWidget(btn_min)
         window_controls_bar.addWidget(btn_close)
@@ -312,11 +1164,11 @@ class MainWindow(QMainWindow):
                 Qt.TransformationMode.SmoothTransformation
             )
             logo_label.setPixmap(scaled_pixmap)
-            logo_label.setStyleSheet(StyleManager.get_style('logo_label'))
+            logo_label.setObjectName("logoLabel")
             header_content_layout.addWidget(logo_label)
         else:
             title_label = QLabel(WINDOW_TITLE.upper())
-            title_label.setStyleSheet(StyleManager.get_style('main_title_label'))
+            title_label.setObjectName("mainTitleLabel")
             header_content_layout.addWidget(title_label)
         header_content_layout.addStretch(1)
         file_layout = QHBoxLayout()
@@ -325,10 +1177,9 @@ class MainWindow(QMainWindow):
         self.file_entry = QLineEdit()
         self.file_entry.setReadOnly(True)
         self.file_entry.setMinimumWidth(StyleManager.FILE_ENTRY_MIN_WIDTH)
-        self.file_entry.setStyleSheet(StyleManager.get_style('input_field'))
+        self.file_entry.setObjectName("inputField")
         self.browse_button = QPushButton(BUTTON_OPEN_SAVE_FILE)
         self.browse_button.setObjectName("actionButton")
-        self.browse_button.setStyleSheet(StyleManager.get_style('action_button'))
         self.browse_button.clicked.connect(self._browse_save_file)
         file_layout.addWidget(self.file_entry)
         file_layout.addWidget(self.browse_button)
@@ -337,7 +1188,7 @@ class MainWindow(QMainWindow):
         header_frame.setLayout(header_container)
         main_layout.addWidget(header_frame)
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet(StyleManager.get_style('tab_widget'))
+        self.tabs.setObjectName("mainTabs")
         self.trucks_tab = QWidget()
         self.stats_tab = QWidget()
         self.levels_tab = QWidget()
@@ -348,14 +1199,13 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.settings_tab, TAB_SETTINGS)
         main_layout.addWidget(self.tabs, 1)
         self.status = QStatusBar()
-        self.status.setStyleSheet(StyleManager.get_style('status_bar'))
+        self.status.setObjectName("statusBar")
         self.setStatusBar(self.status)
         self.status.showMessage(STATUS_READY)
         footer_layout = QHBoxLayout()
         footer_layout.addStretch(1)
         self.save_button = QPushButton(BUTTON_SAVE_CHANGES)
         self.save_button.setObjectName("actionButton")
-        self.save_button.setStyleSheet(StyleManager.get_style('action_button'))
         self.save_button.setMinimumWidth(StyleManager.FOOTER_BUTTON_MIN_WIDTH)
         self.save_button.setEnabled(False)
         self.save_button.clicked.connect(self._save_changes)
@@ -365,11 +1215,24 @@ class MainWindow(QMainWindow):
         self._init_stats_tab()
         self._init_levels_tab()
         self._init_settings_tab()
+        self.document.trucksChanged.connect(self._on_trucks_changed)
+        self.document.statsChanged.connect(self._on_stats_changed)
+        self.document.levelsChanged.connect(self._on_levels_changed)
+        self.stats_panel.statsEdited.connect(self._on_stats_edited)
+        self.levels_panel.levels_model.dataChanged.connect(self._on_levels_edited)
     def _init_trucks_tab(self):
-        layout = QHBoxLayout(self.trucks_tab)
+        tab_layout = QVBoxLayout(self.trucks_tab)
+        tab_layout.setContentsMargins(0, 0, 0, 0)
+        tab_layout.setSpacing(StyleManager.PANEL_SPACING)
+        self.truck_search_field = StyleManager.create_input_field(PLACEHOLDER_SEARCH_TRUCKS)
+        self.truck_search_field.setClearButtonEnabled(True)
+        self.truck_search_field.textChanged.connect(self._apply_truck_search)
+        tab_layout.addWidget(self.truck_search_field)
+        layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(StyleManager.PANEL_SPACING)
-        panel_height = StyleManager.PANEL_HEIGHT
+        tab_layout.addLayout(layout)
+        panel_height = StyleManager.PANEL_HEIGHT - self.truck_search_field.sizeHint().height() - StyleManager.PANEL_SPACING
         self.locked_trucks_panel = TruckListPanel(LABEL_LOCKED_TRUCKS)
         self.locked_trucks_panel.setFixedHeight(panel_height)
         self.locked_trucks_panel.selectionChanged.connect(self._on_locked_truck_selected)
@@ -382,7 +1245,7 @@ class MainWindow(QMainWindow):
         self.unlocked_trucks_panel = TruckListPanel(LABEL_UNLOCKED_TRUCKS)
         self.unlocked_trucks_panel.setFixedHeight(panel_height)
         self.unlocked_trucks_panel.selectionChanged.connect(self._on_unlocked_truck_selected)
-        self.truck_details_panel = TruckDetailsPanel()
+        self.truck_details_panel = TruckDetailsPanel(self.pixmap_cache, self.image_loader)
         self.truck_details_panel.setFixedHeight(panel_height)
         layout.addWidget(self.locked_trucks_panel, 3)
         layout.addWidget(self.truck_action_panel)
@@ -399,7 +1262,17 @@ class MainWindow(QMainWindow):
         image_path = self.trucks_data.get_truck_image_path(truck_id)
         if image_path is None:
             image_path = ""
+        self.image_loader.cancel_pending()
         self.truck_details_panel.update_truck_details(stats, image_path)
+        self._prefetch_truck_images()
+    def _prefetch_truck_images(self):
+        image_paths = []
+        for panel in (self.locked_trucks_panel, self.unlocked_trucks_panel):
+            for truck_id in panel.get_neighbor_truck_ids(IMAGE_PREFETCH_RADIUS):
+                image_path = self.trucks_data.get_truck_image_path(truck_id)
+                if image_path and image_path not in image_paths:
+                    image_paths.append(image_path)
+        self.truck_details_panel.prefetch_images(image_paths)
     def _unlock_selected(self):
         truck_id = self.locked_trucks_panel.get_selected_truck_id()
         if not truck_id:
@@ -419,52 +1292,15 @@ class MainWindow(QMainWindow):
         if QMessageBox.question(self, DIALOG_CONFIRM_TITLE, CONFIRM_LOCK_ALL) == QMessageBox.StandardButton.Yes:
             self._move_all_trucks("lock")
     def _move_truck(self, truck_id, action):
-        if not self.json_data:
+        if not self.json_data or self.truck_state is None:
             return
-        ssl_value = self.json_data["SslValue"]
-        locked_trucks = ssl_value.get("lockedTrucks", [])
-        unlocked_trucks_dict = ssl_value.get("unlockedTrucks", {})
-        map_ids = [map_id for map_id, _ in LEVELS_KNOWN]
-        if action == "unlock":
-            if truck_id in locked_trucks:
-                locked_trucks.remove(truck_id)
-            for map_id in map_ids:
-                unlocked_trucks = unlocked_trucks_dict.get(map_id, [])
-                if truck_id not in unlocked_trucks:
-                    unlocked_trucks.append(truck_id)
-                unlocked_trucks_dict[map_id] = sorted(unlocked_trucks)
-        else:
-            for map_id in map_ids:
-                unlocked_trucks = unlocked_trucks_dict.get(map_id, [])
-                if truck_id in unlocked_trucks:
-                    unlocked_trucks.remove(truck_id)
-                unlocked_trucks_dict[map_id] = sorted(unlocked_trucks)
-            if truck_id not in locked_trucks:
-                locked_trucks.append(truck_id)
-        ssl_value["lockedTrucks"] = sorted(locked_trucks)
-        ssl_value["unlockedTrucks"] = unlocked_trucks_dict
-        self._populate_save_data()
+        self.document.move_truck(truck_id, action == "unlock")
         action_text = STATUS_TRUCK_UNLOCKED if action == "unlock" else STATUS_TRUCK_LOCKED
         self.status.showMessage(f"{action_text}: {self.trucks_data.get_display_name(truck_id)}")
     def _move_all_trucks(self, action):
-        if not self.json_data:
+        if not self.json_data or self.truck_state is None:
             return
-        ssl_value = self.json_data["SslValue"]
-        map_ids = [map_id for map_id, _ in LEVELS_KNOWN]
-        all_trucks = list(self.trucks_data.get_all_trucks().keys())
-        if action == "unlock":
-            ssl_value["lockedTrucks"] = []
-            if "unlockedTrucks" not in ssl_value:
-                ssl_value["unlockedTrucks"] = {}
-            for map_id in map_ids:
-                ssl_value["unlockedTrucks"][map_id] = sorted(all_trucks)
-        else:
-            ssl_value["lockedTrucks"] = sorted(all_trucks)
-            if "unlockedTrucks" not in ssl_value:
-                ssl_value["unlockedTrucks"] = {}
-            for map_id in map_ids:
-                ssl_value["unlockedTrucks"][map_id] = []
-        self._populate_save_data()
+        self.document.move_all_trucks(self.trucks_data.get_all_trucks().keys(), action == "unlock")
         action_text = STATUS_ALL_TRUCKS_UNLOCKED if action == "unlock" else STATUS_ALL_TRUCKS_LOCKED
         self.status.showMessage(action_text)
     def _init_stats_tab(self):
@@ -483,45 +1319,42 @@ class MainWindow(QMainWindow):
         self.levels_panel.set_progress_btn.clicked.connect(self._levels_set_all_progress)
         layout.addWidget(self.levels_panel)
         self._levels_known = LEVELS_KNOWN
-        self.levels_widgets = []
     def _init_settings_tab(self):
         layout = QVBoxLayout(self.settings_tab)
         layout.setContentsMargins(*StyleManager.PANEL_MARGINS)
         layout.setSpacing(StyleManager.PANEL_SPACING)
         settings_panel = QFrame()
         settings_panel.setObjectName("settingsPanel")
-        settings_panel.setStyleSheet(StyleManager.get_style('panel'))
         settings_layout = QFormLayout(settings_panel)
         settings_layout.setSpacing(StyleManager.FORM_LAYOUT_SPACING)
         settings_layout.setContentsMargins(*StyleManager.PANEL_MARGINS)
         settings_title = QLabel(LABEL_SETTINGS_TITLE)
-        settings_title.setStyleSheet(StyleManager.get_style('settings_title_label'))
+        settings_title.setObjectName("settingsTitleLabel")
         settings_layout.addRow(settings_title)
         self.auto_backup_cb = QCheckBox(LABEL_AUTO_BACKUP)
-        self.auto_backup_cb.setStyleSheet(StyleManager.get_style('checkbox'))
+        self.auto_backup_cb.setObjectName("checkbox")
         self.auto_backup_cb.setChecked(self.config.get("auto_backup", True))
         self.auto_backup_cb.stateChanged.connect(self._save_settings)
         self.backup_count_spin = QSpinBox()
         self.backup_count_spin.setMinimum(1)
         self.backup_count_spin.setMaximum(20)
         self.backup_count_spin.setValue(self.config.get("backup_count", 5))
-        self.backup_count_spin.setStyleSheet(StyleManager.get_style('spinbox'))
+        self.backup_count_spin.setObjectName("spinbox")
         self.backup_count_spin.valueChanged.connect(self._save_settings)
         backups_label = QLabel(LABEL_MAX_BACKUPS)
-        backups_label.setStyleSheet(StyleManager.get_style('form_label'))
+        backups_label.setObjectName("formLabel")
         settings_layout.addRow(self.auto_backup_cb)
         settings_layout.addRow(backups_label, self.backup_count_spin)
         about_panel = QFrame()
         about_panel.setObjectName("aboutPanel")
-        about_panel.setStyleSheet(StyleManager.get_style('panel'))
         about_layout = QVBoxLayout(about_panel)
         about_title = QLabel(LABEL_ABOUT_TITLE)
-        about_title.setStyleSheet(StyleManager.get_style('about_title_label'))
+        about_title.setObjectName("aboutTitleLabel")
         about_content = QLabel()
         about_content.setTextFormat(Qt.TextFormat.RichText)
         about_content.setOpenExternalLinks(True)
         about_content.setText(LABEL_ABOUT_CONTENT)
-        about_content.setStyleSheet(StyleManager.get_style('about_content_label'))
+        about_content.setObjectName("aboutContentLabel")
         about_content.setWordWrap(True)
         about_content.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
         about_layout.addWidget(about_title)
@@ -544,166 +1377,172 @@ class MainWindow(QMainWindow):
         if not self.current_save_path:
             QMessageBox.critical(self, DIALOG_ERROR_TITLE, ERROR_SELECT_SAVE_FILE)
             return
-        progress = ProgressDialog(self, DIALOG_LOADING_TITLE, DIALOG_LOADING_MESSAGE)
-        progress.show()
-        QApplication.processEvents()
-        try:
-            progress.update_progress(10, DIALOG_LOADING_READING)
-            self.original_file_content, decompressed_data = self.save_manager.decode_file(self.current_save_path)
-            if decompressed_data is None:
-                raise Exception(ERROR_DECOMPRESS_SAVE)
-            progress.update_progress(60, DIALOG_LOADING_PARSING)
-            self.json_data = json.loads(decompressed_data.decode('utf-8'))
-            progress.update_progress(80, DIALOG_LOADING_VALIDATING)
-            warnings = self.save_manager.validate_save_data(self.json_data)
-            if warnings:
-                pass
-            progress.update_progress(100, DIALOG_LOADING_COMPLETE)
-            self._populate_save_data()
+        if self.file_worker is not None:
+            return
+        worker = SaveLoadWorker(
+            self.save_manager, self.json_codec, self.current_save_path,
+            workers=self.config.get('load_workers'), lazy_document=self.config.get('lazy_document'), parent=self
+        )
+        worker.succeeded.connect(self._on_save_loaded)
+        worker.failed.connect(self._on_save_load_failed)
+        worker.cancelled.connect(self._on_save_load_cancelled)
+        self._start_file_worker(worker, DIALOG_LOADING_TITLE, DIALOG_LOADING_MESSAGE)
+    def _start_file_worker(self, worker: SaveFileWorker, title: str, message: str):
+        self.file_worker = worker
+        self.file_progress = ProgressDialog(self, title, message)
+        self.file_progress.cancelRequested.connect(worker.cancel)
+        worker.progressChanged.connect(self.file_progress.update_progress)
+        worker.finished.connect(self._on_file_worker_finished)
+        self.file_progress.show()
+        worker.start()
+    def _on_file_worker_finished(self):
+        if self.file_progress is not None:
+            self.file_progress.finish()
+            self.file_progress.deleteLater()
+            self.file_progress = None
+        if self.file_worker is not None:
+            self.file_worker.wait()
+            self.file_worker.deleteLater()
+            self.file_worker = None
+    def shutdown_file_worker(self):
+        if self.file_worker is not None:
+            self.file_worker.cancel()
+            self.file_worker.wait()
+    def _on_save_loaded(self, result):
+        header, self.original_header_content, self.json_data, self.lazy_document = result
+        self.truck_state = None
+        ssl_value = self.json_data.get("SslValue") if isinstance(self.json_data, dict) else None
+        self.trucks_data.reset_discovered()
+        if isinstance(ssl_value, dict):
+            self.trucks_data.discover_trucks(ssl_value)
+        self._populate_save_data()
+        if header is not None:
+            self.status.showMessage(STATUS_LOAD_SUCCESS_DETAILS.format(
+                compressed=header.total_compressed_size / (1024 * 1024),
+                uncompressed=header.total_uncompressed_size / (1024 * 1024),
+                integrity=STATUS_INTEGRITY_OK if header.verified else STATUS_INTEGRITY_MISMATCH
+            ))
+        else:
             self.status.showMessage(STATUS_LOAD_SUCCESS)
-            self.save_button.setEnabled(True)
-        except Exception as e:
-            QMessageBox.critical(self, DIALOG_ERROR_TITLE, ERROR_LOAD_SAVE.format(error=e))
-            self.status.showMessage(STATUS_LOAD_FAIL.format(error=e))
-        progress.close()
-    def _populate_save_data(self):
-        if not self.json_data:
+        self.save_button.setEnabled(True)
+    def _on_save_load_failed(self, error: str):
+        QMessageBox.critical(self, DIALOG_ERROR_TITLE, ERROR_LOAD_SAVE.format(error=error))
+        self.status.showMessage(STATUS_LOAD_FAIL.format(error=error))
+    def _on_save_load_cancelled(self):
+        self.status.showMessage(STATUS_LOAD_CANCELLED)
+    def _populate_truck_lists(self):
+        if self.truck_state is None:
             return
-        ssl_value = self.json_data.get("SslValue", {})
-        locked_trucks = ssl_value.get("lockedTrucks", [])
-        unlocked_trucks_dict = ssl_value.get("unlockedTrucks", {})
-        unlocked_trucks = sorted(set(truck for trucks in unlocked_trucks_dict.values() for truck in trucks))
+        locked_trucks = self.truck_state.get_locked_list()
+        unlocked_trucks = self.truck_state.get_unlocked_list()
         self.locked_trucks_panel.populate_trucks(locked_trucks, self.trucks_data.get_display_name)
         self.unlocked_trucks_panel.populate_trucks(unlocked_trucks, self.trucks_data.get_display_name)
-        stats_data = {
-            'money': ssl_value.get("money", 0),
-            'xp': ssl_value.get("xp", 0),
-            'companyName': ssl_value.get("companyName", "")
-        }
-        self.stats_panel.set_stats_data(stats_data)
-        completed = set(ssl_value.get("completedLevels", []))
-        unlocked = set(ssl_value.get("unlockedLevels", []))
-        progress = ssl_value.get("levelsProgress", {})
-        recovery_coins = ssl_value.get("recoveryCoins", {})
-        fobs_resources = ssl_value.get("fobsResources", {})
-        self.levels_panel.levels_table.setRowCount(len(self._levels_known))
-        self.levels_widgets.clear()
-        for row, (level_id, level_name) in enumerate(self._levels_known):
-            name_item = QTableWidgetItem(level_name)
-            name_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            unlocked_cb = QCheckBox()
-            unlocked_cb.setChecked(level_id in unlocked)
-            completed_cb = QCheckBox()
-            completed_cb.setChecked(level_id in completed)
-            prog_spin = StyleManager.create_table_cell_spinbox(0, 100, progress.get(level_id, 0))
-            fuel_spin = StyleManager.create_table_cell_spinbox(0, 9999, recovery_coins.get(level_id, 0))
-            fob_vals = []
-            if level_id in fobs_resources and "resources" in fobs_resources[level_id]:
-                fob_vals = fobs_resources[level_id]["resources"]
-                if len(fob_vals) < 8:
-                    fob_vals += [0] * (8 - len(fob_vals))
+        self.document.record_rebuild(len(locked_trucks) + len(unlocked_trucks))
+        self._apply_truck_search()
+    def _sync_truck_lists(self, truck_ids: Iterable[str]):
+        rebuilt = 0
+        for truck_id in truck_ids:
+            if self.truck_state.is_locked(truck_id):
+                rebuilt += self.locked_trucks_panel.add_truck(truck_id)
             else:
-                fob_vals = [0] * 8
-                pass
-            logs_spin = StyleManager.create_table_cell_spinbox(0, 999999, fob_vals[RESOURCE_INDEX['LOGS']])
-            steel_beams_spin = StyleManager.create_table_cell_spinbox(0, 999999, fob_vals[RESOURCE_INDEX['STEEL_BEAMS']])
-            concrete_slabs_spin = StyleManager.create_table_cell_spinbox(0, 9999, fob_vals[RESOURCE_INDEX['CONCRETE_SLABS']])
-            steel_pipes_spin = StyleManager.create_table_cell_spinbox(0, 999999, fob_vals[RESOURCE_INDEX['STEEL_PIPES']])
-            self.levels_panel.levels_table.setItem(row, 0, name_item)
-            self.levels_panel.levels_table.setCellWidget(row, 1, unlocked_cb)
-            self.levels_panel.levels_table.setCellWidget(row, 2, completed_cb)
-            self.levels_panel.levels_table.setCellWidget(row, 3, prog_spin)
-            self.levels_panel.levels_table.setCellWidget(row, 4, fuel_spin)
-            self.levels_panel.levels_table.setCellWidget(row, 5, logs_spin)
-            self.levels_panel.levels_table.setCellWidget(row, 6, steel_beams_spin)
-            self.levels_panel.levels_table.setCellWidget(row, 7, concrete_slabs_spin)
-            self.levels_panel.levels_table.setCellWidget(row, 8, steel_pipes_spin)
-            self.levels_widgets.append((level_id, unlocked_cb, completed_cb, prog_spin, fuel_spin, logs_spin, steel_beams_spin, concrete_slabs_spin, steel_pipes_spin))
+                rebuilt += self.locked_trucks_panel.remove_truck(truck_id)
+            if self.truck_state.is_unlocked(truck_id):
+                rebuilt += self.unlocked_trucks_panel.add_truck(truck_id)
+            else:
+                rebuilt += self.unlocked_trucks_panel.remove_truck(truck_id)
+        self.document.record_rebuild(rebuilt)
+    def _on_trucks_changed(self, truck_ids):
+        if truck_ids is None:
+            self._populate_truck_lists()
+        else:
+            self._sync_truck_lists(truck_ids)
+    def _on_stats_changed(self, stats):
+        self.document.record_rebuild(self.stats_panel.set_stats_data(stats))
+    def _on_stats_edited(self):
+        self.document.touch(DOCUMENT_SECTION_STATS)
+    def _on_levels_changed(self):
+        self.levels_panel.load_levels(self._levels_known, self.document.ssl_value)
+        self.document.record_rebuild(self.levels_panel.levels_model.rowCount() * self.levels_panel.levels_model.columnCount())
+    def _on_levels_edited(self, top_left, bottom_right, roles=()):
+        if any(column in LevelsTableModel.RESOURCE_COLUMNS for column in range(top_left.column(), bottom_right.column() + 1)):
+            self.document.touch(DOCUMENT_SECTION_RESOURCES)
+        if any(column not in LevelsTableModel.RESOURCE_COLUMNS for column in range(top_left.column(), bottom_right.column() + 1)):
+            self.document.touch(DOCUMENT_SECTION_LEVELS)
+    def _apply_truck_search(self):
+        ranking = None
+        query = self.truck_search_field.text()
+        if query.strip():
+            ranking = {truck_id: rank for rank, truck_id in enumerate(self.trucks_data.search_trucks(query))}
+        self.locked_trucks_panel.set_search_ranking(ranking)
+        self.unlocked_trucks_panel.set_search_ranking(ranking)
+    def _populate_save_data(self):
+        if not self.json_data:
+            return
+        ssl_value = self.json_data.get("SslValue", {})
+        if self.truck_state is None:
+            self.truck_state = TruckLockState.from_ssl_value(ssl_value, [map_id for map_id, _ in LEVELS_KNOWN],
+                                                             self.trucks_data.get_truck_ids_by_ordinal())
+        self.document.load(ssl_value, self.truck_state)
     def _save_changes(self):
         if not self.json_data:
             return
-        if self.original_file_content is None or self.current_save_path is None:
+        if self.original_header_content is None or self.current_save_path is None:
             QMessageBox.critical(self, DIALOG_ERROR_TITLE, ERROR_MISSING_ORIGINAL_FILE_OR_PATH)
             self.status.showMessage(STATUS_SAVE_FAIL.format(error="missing file content or path"))
             return
-        progress = ProgressDialog(self, DIALOG_SAVING_CHANGES_TITLE, DIALOG_SAVING_CHANGES_MESSAGE)
-        progress.show()
-        QApplication.processEvents()
+        if self.file_worker is not None:
+            return
         try:
             ssl_value = self.json_data["SslValue"]
-            new_locked_trucks = self.locked_trucks_panel.get_all_truck_ids()
-            ssl_value["lockedTrucks"] = sorted(new_locked_trucks)
-            new_unlocked_trucks = self.unlocked_trucks_panel.get_all_truck_ids()
-            if "unlockedTrucks" not in ssl_value:
-                ssl_value["unlockedTrucks"] = {}
-            for map_id, _ in LEVELS_KNOWN:
-                ssl_value["unlockedTrucks"][map_id] = sorted(new_unlocked_trucks)
-            if "newUnlockedTrucks" in ssl_value:
-                if not new_unlocked_trucks:
-                    for truck in ssl_value.get("newUnlockedTrucks", []):
-                        if truck not in ssl_value["lockedTrucks"]:
-                            ssl_value["lockedTrucks"].append(truck)
-                    ssl_value["lockedTrucks"] = sorted(set(ssl_value["lockedTrucks"]))
-                    ssl_value["newUnlockedTrucks"] = []
-                else:
-                    ssl_value["newUnlockedTrucks"] = sorted(new_unlocked_trucks)
-            stats_data = self.stats_panel.get_stats_data()
-            ssl_value["money"] = stats_data['money']
-            ssl_value["xp"] = stats_data['xp']
-            ssl_value["companyName"] = stats_data['company_name']
-            if hasattr(self, 'levels_widgets'):
-                unlocked = []
-                completed = []
-                level_progress = {}
-                recovery_coins = {}
-                fobs_resources = {}
-                for (level_id, unlocked_cb, completed_cb, prog_spin, fuel_spin, logs_spin, steel_beams_spin, concrete_slabs_spin, steel_pipes_spin) in self.levels_widgets:
-                    if unlocked_cb.isChecked():
-                        unlocked.append(level_id)
-                    if completed_cb.isChecked():
-                        completed.append(level_id)
-                    level_progress[level_id] = prog_spin.value()
-                    recovery_coins[level_id] = fuel_spin.value()
-                    res_list = [0]*8
-                    if level_id in self.json_data["SslValue"].get("fobsResources", {}) and "resources" in self.json_data["SslValue"]["fobsResources"][level_id]:
-                        res_list = self.json_data["SslValue"]["fobsResources"][level_id]["resources"]
-                        if len(res_list) < 8:
-                            res_list += [0]*(8-len(res_list))
-                    res_list[RESOURCE_INDEX['LOGS']] = logs_spin.value()
-                    res_list[RESOURCE_INDEX['STEEL_BEAMS']] = steel_beams_spin.value()
-                    res_list[RESOURCE_INDEX['CONCRETE_SLABS']] = concrete_slabs_spin.value()
-                    res_list[RESOURCE_INDEX['STEEL_PIPES']] = steel_pipes_spin.value()
-                    fobs_resources[level_id] = {"resources": res_list}
-                self.json_data["SslValue"]["unlockedLevels"] = unlocked
-                self.json_data["SslValue"]["completedLevels"] = completed
-                self.json_data["SslValue"]["levelsProgress"] = level_progress
-                self.json_data["SslValue"]["recoveryCoins"] = recovery_coins
-                self.json_data["SslValue"]["fobsResources"] = fobs_resources
-            progress.update_progress(90, DIALOG_SAVE_PROGRESS)
-            decompressed_data_bytes = json.dumps(self.json_data, separators=(",", ":")).encode('utf-8')
-            self.save_manager.encode_file(self.original_file_content[:53], decompressed_data_bytes, self.current_save_path)
-            progress.update_progress(100, DIALOG_SAVE_COMPLETE)
-            self.status.showMessage(STATUS_SAVE_SUCCESS)
+            if self.document.is_touched(DOCUMENT_SECTION_TRUCKS):
+                self.truck_state.spread_unlocked()
+                self.truck_state.to_ssl_value(ssl_value)
+                new_unlocked_trucks = self.truck_state.get_unlocked_list()
+                if "newUnlockedTrucks" in ssl_value:
+                    if not new_unlocked_trucks:
+                        self.truck_state.lock_many(ssl_value.get("newUnlockedTrucks", []))
+                        ssl_value["lockedTrucks"] = self.truck_state.get_locked_list()
+                        ssl_value["newUnlockedTrucks"] = []
+                    else:
+                        ssl_value["newUnlockedTrucks"] = sorted(new_unlocked_trucks)
+            if self.document.is_touched(DOCUMENT_SECTION_STATS):
+                stats_data = self.stats_panel.get_stats_data()
+                self.document.set_stats(stats_data['money'], stats_data['xp'], stats_data['company_name'])
+            self.levels_panel.commit_edits()
+            if self.document.is_touched(DOCUMENT_SECTION_LEVELS, DOCUMENT_SECTION_RESOURCES):
+                self.levels_panel.levels_model.apply_to_ssl_value(ssl_value)
         except Exception as e:
-            QMessageBox.critical(self, DIALOG_ERROR_TITLE, ERROR_SAVE_CHANGES.format(error=e))
-            self.status.showMessage(STATUS_SAVE_FAIL.format(error=e))
-        progress.close()
+            self._on_save_write_failed(str(e))
+            return
+        worker = SaveWriteWorker(
+            self.save_manager, self.json_codec, self.json_data, self.lazy_document,
+            self.original_header_content, self.current_save_path,
+            block_size=self.config.get('save_block_size_mb') * 1024 * 1024,
+            workers=self.config.get('save_workers'), parent=self
+        )
+        worker.succeeded.connect(self._on_save_written)
+        worker.failed.connect(self._on_save_write_failed)
+        worker.cancelled.connect(self._on_save_write_cancelled)
+        self._start_file_worker(worker, DIALOG_SAVING_CHANGES_TITLE, DIALOG_SAVING_CHANGES_MESSAGE)
+    def _on_save_written(self, _):
+        self.document.mark_saved()
+        self.status.showMessage(STATUS_SAVE_SUCCESS)
+    def _on_save_write_failed(self, error: str):
+        QMessageBox.critical(self, DIALOG_ERROR_TITLE, ERROR_SAVE_CHANGES.format(error=error))
+        self.status.showMessage(STATUS_SAVE_FAIL.format(error=error))
+    def _on_save_write_cancelled(self):
+        self.status.showMessage(STATUS_SAVE_CANCELLED)
     def _save_settings(self):
         self.config.set("auto_backup", self.auto_backup_cb.isChecked())
         self.config.set("backup_count", self.backup_count_spin.value())
     def _levels_unlock_all(self):
-        for _, unlocked_cb, _, _, _, _, _, _, _ in self.levels_widgets:
-            unlocked_cb.setChecked(True)
+        self.levels_panel.levels_model.set_column(LevelsTableModel.UNLOCKED_COLUMN, True)
     def _levels_lock_all(self):
-        for _, unlocked_cb, _, _, _, _, _, _, _ in self.levels_widgets:
-            unlocked_cb.setChecked(False)
+        self.levels_panel.levels_model.set_column(LevelsTableModel.UNLOCKED_COLUMN, False)
     def _levels_complete_all(self):
-        for _, _, completed_cb, _, _, _, _, _, _ in self.levels_widgets:
-            completed_cb.setChecked(True)
+        self.levels_panel.levels_model.set_column(LevelsTableModel.COMPLETED_COLUMN, True)
     def _levels_set_all_progress(self):
-        value = self.levels_panel.progress_spin.value()
-        for _, _, _, prog_spin, _, _, _, _, _ in self.levels_widgets:
-            prog_spin.setValue(value)
+        self.levels_panel.levels_model.set_column(LevelsTableModel.PROGRESS_COLUMN, self.levels_panel.progress_spin.value())
     def mousePressEvent(self, a0):
         if a0 is not None and a0.button() == Qt.MouseButton.LeftButton:
             self._drag_pos = a0.globalPosition().toPoint() - self.frameGeometry().topLeft()
@@ -720,7 +1559,6 @@ class BasePanel(QFrame):
     def __init__(self, title: str = "", parent=None):
         super().__init__(parent)
         self.setObjectName("basePanel")
-        self.setStyleSheet(StyleManager.get_style('panel'))
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(*StyleManager.PANEL_MARGINS)
         self.main_layout.setSpacing(StyleManager.PANEL_SPACING)
@@ -745,8 +1583,14 @@ class QuickButtonPanel(BasePanel):
         self.buttons_layout.addWidget(button)
         return button
 class TruckDetailsPanel(BasePanel):
-    def __init__(self, parent=None):
+    def __init__(self, pixmap_cache: Optional[PixmapCache] = None, image_loader: Optional[ImageLoader] = None,
+                 parent=None):
         super().__init__(LABEL_TRUCK_DETAILS, parent)
+        self.pixmap_cache = pixmap_cache if pixmap_cache is not None else PixmapCache()
+        self.image_loader = image_loader
+        self.image_key = None
+        if self.image_loader is not None:
+            self.image_loader.imageReady.connect(self._on_image_ready)
         self.setMaximumWidth(StyleManager.TRUCK_DETAILS_MAX_WIDTH)
         outer_container = QVBoxLayout()
         outer_container.setContentsMargins(0, 0, 0, 0)
@@ -755,7 +1599,6 @@ class TruckDetailsPanel(BasePanel):
         image_container = QFrame()
         image_container.setFixedSize(*StyleManager.TRUCK_IMAGE_CONTAINER_SIZE)
         image_container.setObjectName("imageContainer")
-        image_container.setStyleSheet(StyleManager.get_truck_frame_stylesheet())
         image_layout = QVBoxLayout(image_container)
         image_layout.setContentsMargins(0, 0, 0, 0)
         image_layout.setSpacing(0)
@@ -763,10 +1606,7 @@ class TruckDetailsPanel(BasePanel):
         self.truck_image_label = QLabel()
         self.truck_image_label.setFixedSize(*StyleManager.TRUCK_IMAGE_LABEL_SIZE)
         self.truck_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.truck_image_label.setStyleSheet(
-            StyleManager.get_style('panel') +
-            "background: transparent; background-position: center; background-repeat: no-repeat;"
-        )
+        self.truck_image_label.setObjectName("truckImageLabel")
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(18)
         shadow.setColor(QColor(StyleManager.DARK_THEME['background']))
@@ -779,7 +1619,7 @@ class TruckDetailsPanel(BasePanel):
         label_width = 220
         self.truck_name_label = QLabel()
         self.truck_name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.truck_name_label.setStyleSheet(StyleManager.get_style('truck_details_small_label') + "margin-top: 12px; text-align: center;")
+        self.truck_name_label.setObjectName("truckNameLabel")
         self.truck_name_label.setFixedWidth(label_width)
         outer_container.addWidget(self.truck_name_label, 0, Qt.AlignmentFlag.AlignCenter)
 
@@ -787,13 +1627,12 @@ class TruckDetailsPanel(BasePanel):
 
         details_frame = QFrame()
         details_frame.setObjectName("detailsFrame")
-        details_frame.setStyleSheet(StyleManager.get_truck_frame_stylesheet())
         details_frame_layout = QVBoxLayout(details_frame)
         details_frame_layout.setContentsMargins(8, 4, 8, 4)
         details_frame_layout.setSpacing(2)
         self.truck_details_label = QLabel()
 
-        self.truck_details_label.setStyleSheet("color: #fff; background: transparent; border: none; font-size: 13px; font-family: 'Segoe UI', Arial, sans-serif;")
+        self.truck_details_label.setObjectName("truckDetailsLabel")
         self.truck_details_label.setFixedWidth(label_width)
         self.truck_details_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self.truck_details_label.setWordWrap(True)
@@ -808,51 +1647,144 @@ class TruckDetailsPanel(BasePanel):
         details += f"Rarity: {truck_data.get('rarity', 'Unknown')}\n"
         details += f"ID: {truck_data.get('id', 'Unknown')}"
         self.truck_details_label.setText(details)
-        if image_path and os.path.exists(image_path):
-            pixmap = QPixmap(image_path).scaled(
-                180, 120,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
+        self.image_key = None
+        if not image_path:
+            self._show_pixmap(None)
+            return
+        width, height = StyleManager.TRUCK_IMAGE_SIZE
+        device_pixel_ratio = self.truck_image_label.devicePixelRatioF()
+        if self.image_loader is None:
+            self._show_pixmap(self.pixmap_cache.get(image_path, width, height, device_pixel_ratio))
+            return
+        self.image_key = (image_path, width, height, device_pixel_ratio)
+        pixmap = self.image_loader.request(image_path, width, height, device_pixel_ratio)
+        if pixmap is not None:
+            self.image_key = None
+            self._show_pixmap(pixmap)
+        else:
+            self.truck_image_label.setPixmap(QPixmap())
+            self.truck_image_label.setText("")
+    def prefetch_images(self, image_paths: List[str]):
+        if self.image_loader is None:
+            return
+        width, height = StyleManager.TRUCK_IMAGE_SIZE
+        device_pixel_ratio = self.truck_image_label.devicePixelRatioF()
+        for image_path in image_paths:
+            self.image_loader.request(image_path, width, height, device_pixel_ratio, prefetch=True)
+    def _on_image_ready(self, key):
+        if key != self.image_key:
+            return
+        self.image_key = None
+        self._show_pixmap(self.pixmap_cache.peek(key))
+    def _show_pixmap(self, pixmap: Optional[QPixmap]):
+        if pixmap is not None:
             self.truck_image_label.setPixmap(pixmap)
             self.truck_image_label.setText("")
         else:
             self.truck_image_label.setText("No image\navailable")
             self.truck_image_label.setPixmap(QPixmap())
             self.truck_image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+class TruckListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.truck_ids: List[str] = []
+        self.ranking: Optional[Dict[str, int]] = None
+        self.display_name_func = str
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.truck_ids)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        truck_id = self.truck_ids[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_name_func(truck_id)
+        if role == Qt.ItemDataRole.UserRole:
+            return truck_id
+        return None
+    def sort_key(self, truck_id: str):
+        if self.ranking is None:
+            return truck_id
+        return self.ranking.get(truck_id, len(self.ranking)), truck_id
+    def set_trucks(self, truck_ids: Iterable[str], display_name_func) -> None:
+        self.beginResetModel()
+        self.truck_ids = sorted(set(truck_ids), key=self.sort_key)
+        self.display_name_func = display_name_func
+        self.endResetModel()
+    def set_ranking(self, ranking: Optional[Dict[str, int]]) -> None:
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        persistent_ids = [self.truck_ids[index.row()] for index in persistent]
+        self.ranking = ranking
+        self.truck_ids.sort(key=self.sort_key)
+        self.changePersistentIndexList(persistent, [self.index(self.find_row(truck_id)) for truck_id in persistent_ids])
+        self.layoutChanged.emit()
+    def find_insert_row(self, truck_id: str) -> int:
+        return bisect.bisect_left(self.truck_ids, self.sort_key(truck_id), key=self.sort_key)
+    def find_row(self, truck_id: str) -> int:
+        row = self.find_insert_row(truck_id)
+        return row if row < len(self.truck_ids) and self.truck_ids[row] == truck_id else -1
+    def add_truck(self, truck_id: str) -> bool:
+        row = self.find_insert_row(truck_id)
+        if row < len(self.truck_ids) and self.truck_ids[row] == truck_id:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.truck_ids.insert(row, truck_id)
+        self.endInsertRows()
+        return True
+    def remove_truck(self, truck_id: str) -> bool:
+        row = self.find_row(truck_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.truck_ids[row]
+        self.endRemoveRows()
+        return True
+class TruckFilterProxyModel(QSortFilterProxyModel):
+    def set_ranking(self, ranking: Optional[Dict[str, int]]) -> None:
+        self.sourceModel().set_ranking(ranking)
+        self.invalidateFilter()
+    def filterAcceptsRow(self, source_row, source_parent):
+        model = self.sourceModel()
+        return model.ranking is None or model.truck_ids[source_row] in model.ranking
 class TruckListPanel(BasePanel):
     selectionChanged = pyqtSignal(str)
     def __init__(self, title: str, parent=None):
         super().__init__(title, parent)
-        self.list_widget = QListWidget()
-        StyleManager.apply_list_style(self.list_widget)
-        self.list_widget.itemSelectionChanged.connect(self._on_selection_changed)
-        self.add_widget(self.list_widget)
+        self.model = TruckListModel(self)
+        self.proxy_model = TruckFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        self.list_view = QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.proxy_model)
+        StyleManager.apply_list_style(self.list_view)
+        self.list_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.add_widget(self.list_view)
     def _on_selection_changed(self):
-        items = self.list_widget.selectedItems()
-        if items:
-            truck_id = items[0].data(Qt.ItemDataRole.UserRole)
+        truck_id = self.get_selected_truck_id()
+        if truck_id:
             self.selectionChanged.emit(truck_id)
     def clear_selection(self):
-        self.list_widget.clearSelection()
+        self.list_view.clearSelection()
     def populate_trucks(self, trucks: list, display_name_func):
-        self.list_widget.clear()
-        for truck_id in trucks:
-            item = QListWidgetItem(display_name_func(truck_id))
-            item.setData(Qt.ItemDataRole.UserRole, truck_id)
-            self.list_widget.addItem(item)
-    def get_selected_truck_id(self) -> str | None:
-        items = self.list_widget.selectedItems()
-        return items[0].data(Qt.ItemDataRole.UserRole) if items else None
-    def get_all_truck_ids(self) -> list:
+        self.model.set_trucks(trucks, display_name_func)
+    def add_truck(self, truck_id: str) -> bool:
+        return self.model.add_truck(truck_id)
+    def remove_truck(self, truck_id: str) -> bool:
+        return self.model.remove_truck(truck_id)
+    def set_search_ranking(self, ranking: Optional[Dict[str, int]]):
+        self.proxy_model.set_ranking(ranking)
+    def get_neighbor_truck_ids(self, radius: int) -> list:
+        row = self.list_view.currentIndex().row()
+        if row < 0:
+            return []
         truck_ids = []
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            if item is not None:
-                truck_id = item.data(Qt.ItemDataRole.UserRole)
-                if truck_id is not None:
-                    truck_ids.append(truck_id)
+        for i in range(max(0, row - radius), min(self.proxy_model.rowCount(), row + radius + 1)):
+            if i != row:
+                truck_ids.append(self.proxy_model.index(i, 0).data(Qt.ItemDataRole.UserRole))
         return truck_ids
+    def get_selected_truck_id(self) -> str | None:
+        indexes = self.list_view.selectionModel().selectedIndexes()
+        return indexes[0].data(Qt.ItemDataRole.UserRole) if indexes else None
 class TruckActionPanel(QFrame):
     unlockSelected = pyqtSignal()
     lockSelected = pyqtSignal()
@@ -861,7 +1793,7 @@ class TruckActionPanel(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMaximumWidth(StyleManager.TRUCK_ACTION_PANEL_WIDTH)
-        self.setStyleSheet("background-color: transparent;")
+        self.setObjectName("truckActionPanel")
         layout = QVBoxLayout(self)
         layout.setContentsMargins(*StyleManager.TRUCK_ACTION_PANEL_MARGINS)
         self.unlock_selected_btn = StyleManager.create_button(BUTTON_UNLOCK_SELECTED)
@@ -871,7 +1803,7 @@ class TruckActionPanel(QFrame):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet(StyleManager.get_style('panel'))
+        separator.setObjectName("separator")
         self.unlock_all_btn = StyleManager.create_button(BUTTON_UNLOCK_ALL_CAPS)
         self.unlock_all_btn.clicked.connect(self.unlockAll.emit)
         self.lock_all_btn = StyleManager.create_button(BUTTON_LOCK_ALL_CAPS)
@@ -886,6 +1818,7 @@ class TruckActionPanel(QFrame):
         layout.addWidget(self.lock_all_btn)
         layout.addStretch(1)
 class StatsPanel(BasePanel):
+    statsEdited = pyqtSignal()
     def __init__(self, parent=None):
         super().__init__(LABEL_PLAYER_STATS, parent)
         form_layout = QFormLayout()
@@ -894,15 +1827,18 @@ class StatsPanel(BasePanel):
         self.xp_entry = StyleManager.create_input_field(PLACEHOLDER_XP) 
         self.company_name_entry = StyleManager.create_input_field(PLACEHOLDER_COMPANY)
         money_label = QLabel(LABEL_MONEY)
-        money_label.setStyleSheet(StyleManager.get_style('form_label'))
+        money_label.setObjectName("formLabel")
         xp_label = QLabel(LABEL_XP)
-        xp_label.setStyleSheet(StyleManager.get_style('form_label'))
+        xp_label.setObjectName("formLabel")
         company_label = QLabel(LABEL_COMPANY_NAME)
-        company_label.setStyleSheet(StyleManager.get_style('form_label'))
+        company_label.setObjectName("formLabel")
         form_layout.addRow(money_label, self.money_entry)
         form_layout.addRow(xp_label, self.xp_entry)
         form_layout.addRow(company_label, self.company_name_entry)
         self.add_layout(form_layout)
+        self.updating = False
+        for entry in (self.money_entry, self.xp_entry, self.company_name_entry):
+            entry.textChanged.connect(self._on_entry_changed)
         quick_panel = QuickButtonPanel(LABEL_QUICK_ACTIONS)
         quick_panel.add_button(BUTTON_100K, lambda: self.money_entry.setText("100000"))
         quick_panel.add_button(BUTTON_500K, lambda: self.money_entry.setText("500000"))
@@ -910,16 +1846,164 @@ class StatsPanel(BasePanel):
         quick_panel.add_button(BUTTON_MAX_XP, lambda: self.xp_entry.setText("999999"))
         self.add_widget(quick_panel)
         self.add_stretch()
+    def _on_entry_changed(self):
+        if not self.updating:
+            self.statsEdited.emit()
     def get_stats_data(self) -> dict:
         return {
             'money': int(self.money_entry.text() or 0),
             'xp': int(self.xp_entry.text() or 0),
             'company_name': self.company_name_entry.text() or ""
         }
-    def set_stats_data(self, data: dict):
-        self.money_entry.setText(str(data.get('money', 0)))
-        self.xp_entry.setText(str(data.get('xp', 0)))
-        self.company_name_entry.setText(data.get('companyName', ''))
+    def set_stats_data(self, data: dict) -> int:
+        updated = 0
+        self.updating = True
+        try:
+            for entry, text in ((self.money_entry, str(data.get('money', 0))), (self.xp_entry, str(data.get('xp', 0))),
+                                (self.company_name_entry, data.get('companyName', ''))):
+                if entry.text() != text:
+                    entry.setText(text)
+                    updated += 1
+        finally:
+            self.updating = False
+        return updated
+def get_level_rows(levels_known: Iterable[Tuple[str, str]], ssl_value: Dict[str, Any]) -> List[Tuple[str, str]]:
+    rows = list(levels_known)
+    seen = {level_id for level_id, _ in rows}
+    for key in ("unlockedLevels", "completedLevels", "levelsProgress", "recoveryCoins", "fobsResources"):
+        for level_id in ssl_value.get(key, ()):
+            if isinstance(level_id, str) and level_id not in seen:
+                seen.add(level_id)
+                rows.append((level_id, level_id))
+    return rows
+class LevelsTableModel(QAbstractTableModel):
+    NAME_COLUMN = 0
+    UNLOCKED_COLUMN = 1
+    COMPLETED_COLUMN = 2
+    PROGRESS_COLUMN = 3
+    FUEL_COLUMN = 4
+    CHECK_COLUMNS = (UNLOCKED_COLUMN, COMPLETED_COLUMN)
+    VALUE_RANGES = {3: (0, 100), 4: (0, 9999), 5: (0, 999999), 6: (0, 999999), 7: (0, 9999), 8: (0, 999999)}
+    RESOURCE_COLUMNS = {
+        5: RESOURCE_INDEX['LOGS'], 6: RESOURCE_INDEX['STEEL_BEAMS'],
+        7: RESOURCE_INDEX['CONCRETE_SLABS'], 8: RESOURCE_INDEX['STEEL_PIPES']
+    }
+    RESOURCE_COUNT = 8
+    def __init__(self, columns: List[str], parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.level_ids: List[str] = []
+        self.rows: List[list] = []
+        self.resources: List[List[int]] = []
+        self.header_font = QFont("Segoe UI", 11, QFont.Weight.Bold)
+        self.header_foreground = QColor(StyleManager.DARK_THEME['accent'])
+        self.header_background = QColor(StyleManager.DARK_THEME['panel_bg'])
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        value = self.rows[index.row()][column]
+        if column in self.CHECK_COLUMNS:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if value else Qt.CheckState.Unchecked
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return value
+        if role == Qt.ItemDataRole.TextAlignmentRole and column != self.NAME_COLUMN:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+        column = index.column()
+        if column in self.CHECK_COLUMNS and role == Qt.ItemDataRole.CheckStateRole:
+            value = Qt.CheckState(value) == Qt.CheckState.Checked
+        elif column in self.VALUE_RANGES and role == Qt.ItemDataRole.EditRole:
+            minimum, maximum = self.VALUE_RANGES[column]
+            value = min(max(int(value), minimum), maximum)
+        else:
+            return False
+        self.rows[index.row()][column] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        column = index.column()
+        if column in self.CHECK_COLUMNS:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+        if column in self.VALUE_RANGES:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+        return Qt.ItemFlag.ItemIsEnabled
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or not 0 <= section < len(self.columns):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.columns[section]
+        if role == Qt.ItemDataRole.FontRole:
+            return self.header_font
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.header_foreground
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.header_background
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    def load_levels(self, levels_known: Iterable[Tuple[str, str]], ssl_value: Dict[str, Any]) -> None:
+        completed = set(ssl_value.get("completedLevels", []))
+        unlocked = set(ssl_value.get("unlockedLevels", []))
+        progress = ssl_value.get("levelsProgress", {})
+        recovery_coins = ssl_value.get("recoveryCoins", {})
+        fobs_resources = ssl_value.get("fobsResources", {})
+        self.beginResetModel()
+        self.level_ids = []
+        self.rows = []
+        self.resources = []
+        for level_id, level_name in get_level_rows(levels_known, ssl_value):
+            resources = list(fobs_resources.get(level_id, {}).get("resources", []))
+            resources += [0] * (self.RESOURCE_COUNT - len(resources))
+            self.level_ids.append(level_id)
+            self.resources.append(resources)
+            self.rows.append([
+                level_name, level_id in unlocked, level_id in completed,
+                progress.get(level_id, 0), recovery_coins.get(level_id, 0)
+            ] + [resources[resource_index] for resource_index in self.RESOURCE_COLUMNS.values()])
+        self.endResetModel()
+    def apply_to_ssl_value(self, ssl_value: Dict[str, Any]) -> None:
+        fobs_resources = {}
+        for level_id, row, resources in zip(self.level_ids, self.rows, self.resources):
+            res_list = list(resources)
+            for column, resource_index in self.RESOURCE_COLUMNS.items():
+                res_list[resource_index] = row[column]
+            fobs_resources[level_id] = {"resources": res_list}
+        ssl_value["unlockedLevels"] = [level_id for level_id, row in zip(self.level_ids, self.rows) if row[self.UNLOCKED_COLUMN]]
+        ssl_value["completedLevels"] = [level_id for level_id, row in zip(self.level_ids, self.rows) if row[self.COMPLETED_COLUMN]]
+        ssl_value["levelsProgress"] = {level_id: row[self.PROGRESS_COLUMN] for level_id, row in zip(self.level_ids, self.rows)}
+        ssl_value["recoveryCoins"] = {level_id: row[self.FUEL_COLUMN] for level_id, row in zip(self.level_ids, self.rows)}
+        ssl_value["fobsResources"] = fobs_resources
+    def set_column(self, column: int, value) -> None:
+        if not self.rows:
+            return
+        for row in self.rows:
+            row[column] = value
+        self.dataChanged.emit(self.index(0, column), self.index(len(self.rows) - 1, column))
+class LevelSpinBoxDelegate(QStyledItemDelegate):
+    def createEditor(self, parent, option, index):
+        minimum, maximum = index.model().VALUE_RANGES[index.column()]
+        editor = StyleManager.create_table_cell_spinbox(minimum, maximum, index.data(Qt.ItemDataRole.EditRole))
+        editor.setParent(parent)
+        return editor
+    def setEditorData(self, editor, index):
+        editor.setValue(index.data(Qt.ItemDataRole.EditRole))
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
 class LevelsPanel(BasePanel):
     TABLE_COLUMNS = [
         LABEL_LEVEL_NAME, LABEL_UNLOCKED, LABEL_COMPLETED, LABEL_PROGRESS_PERCENT,
@@ -935,7 +2019,7 @@ class LevelsPanel(BasePanel):
         self.lock_all_btn = StyleManager.create_button(BUTTON_LOCK_ALL)
         self.complete_all_btn = StyleManager.create_button(BUTTON_COMPLETE_ALL)
         progress_label = QLabel(LABEL_PROGRESS)
-        progress_label.setStyleSheet(StyleManager.get_style('form_label'))
+        progress_label.setObjectName("formLabel")
         self.progress_spin = StyleManager.create_spinbox(0, 100, 100)
         self.set_progress_btn = StyleManager.create_button(BUTTON_SET_ALL_PROGRESS)
         controls_grid.addWidget(self.unlock_all_btn, 0, 0)
@@ -945,18 +2029,15 @@ class LevelsPanel(BasePanel):
         controls_grid.addWidget(self.progress_spin, 1, 1)
         controls_grid.addWidget(self.set_progress_btn, 1, 2)
         self.add_layout(controls_grid)
-        self.levels_table = QTableWidget()
+        self.levels_model = LevelsTableModel(self.TABLE_COLUMNS, self)
+        self.value_delegate = LevelSpinBoxDelegate(self)
+        self.levels_table = QTableView()
+        self.levels_table.setModel(self.levels_model)
         self._setup_levels_table()
         self.add_widget(self.levels_table)
     def _setup_levels_table(self):
-        from PyQt6.QtWidgets import QHeaderView, QTableWidget, QCheckBox
-        from PyQt6.QtGui import QColor, QFont
+        from PyQt6.QtWidgets import QHeaderView
         from PyQt6.QtCore import Qt
-        if self.levels_table is None:
-            self.levels_table = QTableWidget(self)
-        self.levels_table.clear()
-        self.levels_table.setColumnCount(self.COLUMN_COUNT)
-        self.levels_table.setRowCount(0)
         header = self.levels_table.horizontalHeader()
         if header is not None:
             header.setVisible(True)
@@ -970,29 +2051,28 @@ class LevelsPanel(BasePanel):
         if vertical_header:
             vertical_header.setVisible(False)
             vertical_header.setDefaultSectionSize(StyleManager.LEVELS_TABLE_ROW_HEIGHT)
-        header_font = QFont()
-        header_font.setPointSize(11)
-        header_font.setBold(True)
-        header_font.setFamily("Segoe UI")
-        for col, header_text in enumerate(self.TABLE_COLUMNS):
-            item = QTableWidgetItem(header_text)
-            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            item.setFont(QFont("Segoe UI", 11, QFont.Weight.Bold))
-            item.setForeground(QColor(StyleManager.DARK_THEME['accent']))
-            item.setBackground(QColor(StyleManager.DARK_THEME['panel_bg']))
-            self.levels_table.setHorizontalHeaderItem(col, item)
+        for col in range(self.COLUMN_COUNT):
             self.levels_table.setColumnWidth(col, self.COLUMN_WIDTHS[col])
+        for col in LevelsTableModel.VALUE_RANGES:
+            self.levels_table.setItemDelegateForColumn(col, self.value_delegate)
         self.levels_table.setAlternatingRowColors(True)
-        self.levels_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.levels_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.levels_table.setShowGrid(False)
-        self.levels_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.levels_table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.levels_table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
+        self.levels_table.setEditTriggers(
+            QTableView.EditTrigger.CurrentChanged | QTableView.EditTrigger.DoubleClicked |
+            QTableView.EditTrigger.SelectedClicked | QTableView.EditTrigger.EditKeyPressed |
+            QTableView.EditTrigger.AnyKeyPressed
+        )
+        self.levels_table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.levels_table.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
         StyleManager.apply_table_style(self.levels_table)
         self.levels_table.setCornerButtonEnabled(False)
         self.levels_table.setWordWrap(False)
-        self.levels_table.update()
-        self.levels_table.show()
+    def commit_edits(self):
+        self.levels_table.setCurrentIndex(QModelIndex())
+    def load_levels(self, levels_known: Iterable[Tuple[str, str]], ssl_value: Dict[str, Any]):
+        self.commit_edits()
+        self.levels_model.load_levels(levels_known, ssl_value)
 class SettingsPanel(BasePanel):
     def __init__(self, config, parent=None):
         super().__init__(LABEL_SETTINGS_TITLE, parent)
@@ -1008,11 +2088,11 @@ class SettingsPanel(BasePanel):
         self.theme_combo.addItem("Dark")
         self.theme_combo.setCurrentText(config.get('theme', 'dark').capitalize())
         auto_backup_label = QLabel(LABEL_AUTO_BACKUP)
-        auto_backup_label.setStyleSheet(StyleManager.get_style('form_label'))
+        auto_backup_label.setObjectName("formLabel")
         max_backups_label = QLabel(LABEL_MAX_BACKUPS)
-        max_backups_label.setStyleSheet(StyleManager.get_style('form_label'))
+        max_backups_label.setObjectName("formLabel")
         theme_label = QLabel("Theme:")
-        theme_label.setStyleSheet(StyleManager.get_style('form_label'))
+        theme_label.setObjectName("formLabel")
         form_layout.addRow(auto_backup_label, self.auto_backup_cb)
         form_layout.addRow(max_backups_label, self.backup_count_spinbox)
         form_layout.addRow(theme_label, self.theme_combo)
@@ -1021,6 +2101,8 @@ def main():
     app = QApplication(sys.argv)
     StyleManager.apply_dark_theme(app)
     window = MainWindow()
+    app.aboutToQuit.connect(window.image_loader.shutdown)
+    app.aboutToQuit.connect(window.shutdown_file_worker)
     window.show()
     sys.exit(app.exec())
 if __name__ == "__main__":
@@ -48,6 +48,7 @@ class StyleManager:
     TRUCK_DETAILS_MAX_WIDTH = 300
     TRUCK_IMAGE_CONTAINER_SIZE = (240, 170)
     TRUCK_IMAGE_LABEL_SIZE = (200, 140)
+    TRUCK_IMAGE_SIZE = (180, 120)
     FILE_ENTRY_MIN_WIDTH = 320
     
     STYLES = {
@@ -302,39 +303,39 @@ class StyleManager:
         """,
         
         'list_widget': """
-            QListWidget {{
+            QListView {{
                 border: 1px solid {border};
                 border-radius: 5px;
                 background-color: rgba(30, 30, 30, 210);
                 alternate-background-color: rgba(35, 35, 35, 210);
                 padding: 5px;
             }}
-            QListWidget::item {{
+            QListView::item {{
                 padding: 8px;
                 border-bottom: 1px solid {border};
                 margin: 2px 0px;
             }}
-            QListWidget::item:selected {{
+            QListView::item:selected {{
                 background-color: rgba(255, 204, 0, 120);
                 color: {text};
                 border-left: 3px solid {accent};
             }}
-            QListWidget::item:hover:!selected {{
+            QListView::item:hover:!selected {{
                 background-color: rgba(50, 50, 50, 150);
             }}
-            QListWidget QScrollBar:vertical {{
+            QListView QScrollBar:vertical {{
                 border: none;
                 background: rgba(45, 45, 45, 180);
                 width: 10px;
                 border-radius: 5px;
                 margin: 0px;
             }}
-            QListWidget QScrollBar::handle:vertical {{
+            QListView QScrollBar::handle:vertical {{
                 background: rgba(255, 204, 0, 180);
                 border-radius: 5px;
                 min-height: 20px;
             }}
-            QListWidget QScrollBar::add-line:vertical, QListWidget QScrollBar::sub-line:vertical {{
+            QListView QScrollBar::add-line:vertical, QListView QScrollBar::sub-line:vertical {{
                 height: 0px;
             }}
         """,
@@ -366,7 +367,7 @@ class StyleManager:
         """,
         
         'table_widget': """
-            QTableWidget {{
+            QTableView {{
                 background-color: rgba(30, 30, 30, 180);
                 alternate-background-color: rgba(35, 35, 35, 180);
                 border-radius: 8px;
@@ -375,11 +376,25 @@ class StyleManager:
                 selection-background-color: rgba(255, 204, 0, 120);
                 selection-color: {text};
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 5px 5px;
                 border-bottom: 1px solid rgba(68, 68, 68, 120);
             }}
-            QTableWidget QHeaderView::section {{
+            QTableView::indicator {{
+                width: 22px;
+                height: 22px;
+                border: 1px solid {disabled};
+                border-radius: 3px;
+                background-color: rgba(40, 40, 40, 220);
+            }}
+            QTableView::indicator:checked {{
+                background-color: {accent};
+                border: 1px solid {accent};
+            }}
+            QTableView::indicator:unchecked:hover {{
+                border: 1px solid {accent};
+            }}
+            QTableView QHeaderView::section {{
                 background-color: rgba(45, 45, 45, 240);
                 color: {accent};
                 padding: 15px 10px;
@@ -389,14 +404,14 @@ class StyleManager:
                 font-size: 14px;
                 text-transform: uppercase;
             }}
-            QTableWidget QHeaderView::section:hover {{
+            QTableView QHeaderView::section:hover {{
                 background-color: rgba(55, 55, 55, 250);
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: rgba(255, 204, 0, 150);
                 color: #000000;
             }}
-            QTableWidget::item:hover:!selected {{
+            QTableView::item:hover:!selected {{
                 background-color: rgba(45, 45, 45, 200);
             }}
             QScrollBar:vertical {{
@@ -660,8 +675,81 @@ class StyleManager:
             color: {text_secondary};
             margin-top: 8px;
         """,
+
+        'truck_name_label': """
+            font-size: 11px;
+            color: {text_secondary};
+            margin-top: 12px;
+            text-align: center;
+        """,
+
+        'truck_details_label': """
+            color: #fff;
+            background: transparent;
+            border: none;
+            font-size: 13px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+        """,
+
+        'truck_image_label': """
+            border-radius: 10px;
+            border: 1px solid {border};
+            padding: 15px;
+            background: transparent;
+            background-position: center;
+            background-repeat: no-repeat;
+        """,
+
+        'transparent_panel': """
+            background-color: transparent;
+        """,
     }
 
+    THEME_NAME = 'dark'
+
+    # Object names styled by the application stylesheet: (object name, widget type, style name). Containers come
+    # before the widgets placed inside them, so equally specific rules resolve in favour of the inner widget.
+    OBJECT_STYLES = [
+        ('headerFrame', 'QFrame', 'header_frame'),
+        ('panel', 'QFrame', 'panel'),
+        ('basePanel', 'QFrame', 'panel'),
+        ('settingsPanel', 'QFrame', 'panel'),
+        ('aboutPanel', 'QFrame', 'panel'),
+        ('truckActionPanel', 'QFrame', 'transparent_panel'),
+        ('separator', 'QFrame', 'panel'),
+        ('imageContainer', 'QFrame', 'truck_frame'),
+        ('detailsFrame', 'QFrame', 'truck_frame'),
+        ('mainTabs', 'QTabWidget', 'tab_widget'),
+        ('listView', 'QListView', 'list_widget'),
+        ('tableView', 'QTableView', 'table_widget'),
+        ('statusBar', 'QStatusBar', 'status_bar'),
+        ('progressBar', 'QProgressBar', 'progress_bar'),
+        ('logoLabel', 'QLabel', 'logo_label'),
+        ('mainTitleLabel', 'QLabel', 'main_title_label'),
+        ('headerLabel', 'QLabel', 'header_label'),
+        ('titleLabel', 'QLabel', 'title_label'),
+        ('settingsTitleLabel', 'QLabel', 'settings_title_label'),
+        ('aboutTitleLabel', 'QLabel', 'about_title_label'),
+        ('aboutContentLabel', 'QLabel', 'about_content_label'),
+        ('dialogLabel', 'QLabel', 'dialog_label'),
+        ('formLabel', 'QLabel', 'form_label'),
+        ('truckImageLabel', 'QLabel', 'truck_image_label'),
+        ('truckNameLabel', 'QLabel', 'truck_name_label'),
+        ('truckDetailsLabel', 'QLabel', 'truck_details_label'),
+        ('inputField', 'QLineEdit', 'input_field'),
+        ('button', 'QPushButton', 'button'),
+        ('actionButton', 'QPushButton', 'action_button'),
+        ('windowMinButton', 'QPushButton', 'window_min_button'),
+        ('windowCloseButton', 'QPushButton', 'window_close_button'),
+        ('spinbox', 'QSpinBox', 'spinbox'),
+        ('tableCellSpinbox', 'QSpinBox', 'table_cell_spinbox'),
+        ('checkbox', 'QCheckBox', 'checkbox'),
+        ('tableCellCheckbox', 'QCheckBox', 'table_cell_checkbox'),
+    ]
+    OBJECT_STYLE_NAMES = {object_name for object_name, _, _ in OBJECT_STYLES}
+
+    _style_cache = {}
+
     @classmethod
     def apply_dark_theme(cls, app):
         """Apply dark theme to the application"""
@@ -689,13 +777,27 @@ class StyleManager:
             palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, QColor(colors['disabled']))
             
             app.setPalette(palette)
-            app.setStyleSheet(cls.get_style('tooltip'))
+            stylesheet = cls.get_application_stylesheet()
+            if app.styleSheet() != stylesheet:
+                app.setStyleSheet(stylesheet)
         except Exception:
             pass
 
     @classmethod
     def get_style(cls, style_name: str, **kwargs) -> str:
         """Get a style string by name with optional parameter substitution"""
+        try:
+            key = (style_name, cls.THEME_NAME, tuple(sorted(kwargs.items())))
+            style = cls._style_cache.get(key)
+        except TypeError:
+            return cls._format_style(style_name, kwargs)
+        if style is None:
+            style = cls._style_cache[key] = cls._format_style(style_name, kwargs)
+        return style
+
+    @classmethod
+    def _format_style(cls, style_name: str, kwargs) -> str:
+        """Format a style template with the theme colors"""
         try:
             if style_name not in cls.STYLES:
                 return ""
@@ -705,19 +807,62 @@ class StyleManager:
         except Exception:
             return ""
 
+    @classmethod
+    def clear_style_cache(cls):
+        """Drop compiled styles, e.g. after changing theme colors"""
+        cls._style_cache.clear()
+
+    @classmethod
+    def get_application_stylesheet(cls) -> str:
+        """Get the application stylesheet with every object style scoped to its object name"""
+        key = ('application', cls.THEME_NAME, ())
+        stylesheet = cls._style_cache.get(key)
+        if stylesheet is None:
+            rules = [cls.get_style('tooltip')]
+            for object_name, widget_type, style_name in cls.OBJECT_STYLES:
+                rules.append(cls._scope_style(cls.get_style(style_name), widget_type, object_name))
+            stylesheet = cls._style_cache[key] = "\n".join(rules)
+        return stylesheet
+
+    @staticmethod
+    def _scope_style(style: str, widget_type: str, object_name: str) -> str:
+        """Restrict a style to widgets of the given type and object name"""
+        scoped = f"{widget_type}#{object_name}"
+        if "{" not in style:
+            # Like a widget's own selector-less stylesheet, the declarations also reach its children
+            return f"{scoped}, {scoped} * {{{style}}}"
+        rules = []
+        for block in style.split("}"):
+            if "{" not in block:
+                continue
+            selectors, declarations = block.split("{", 1)
+            scoped_selectors = []
+            for selector in selectors.split(","):
+                selector = selector.strip()
+                first = selector.split(" ", 1)[0]
+                if "#" in first:
+                    scoped_selectors.append(selector)
+                elif first == widget_type or first.startswith((f"{widget_type}:", f"{widget_type}::")):
+                    scoped_selectors.append(scoped + selector[len(widget_type):])
+                else:
+                    scoped_selectors.append(f"{scoped} {selector}")
+            rules.append(f"{', '.join(scoped_selectors)} {{{declarations}}}")
+        return "\n".join(rules)
+
     @classmethod
     def create_panel(cls, object_name: str = "panel") -> QFrame:
         """Create a styled panel frame"""
         panel = QFrame()
         panel.setObjectName(object_name)
-        panel.setStyleSheet(cls.get_style('panel'))
+        if object_name not in cls.OBJECT_STYLE_NAMES:
+            panel.setStyleSheet(cls.get_style('panel'))
         return panel
 
     @classmethod
     def create_header_label(cls, text: str) -> QLabel:
         """Create a styled header label"""
         label = QLabel(text)
-        label.setStyleSheet(cls.get_style('header_label'))
+        label.setObjectName("headerLabel")
         label.setFont(cls.FONTS['header'])
         return label
 
@@ -725,7 +870,7 @@ class StyleManager:
     def create_title_label(cls, text: str) -> QLabel:
         """Create a styled title label"""
         label = QLabel(text)
-        label.setStyleSheet(cls.get_style('title_label'))
+        label.setObjectName("titleLabel")
         label.setFont(cls.FONTS['title'])
         return label
 
@@ -733,8 +878,7 @@ class StyleManager:
     def create_button(cls, text: str, action_button: bool = False, icon_path: Optional[str] = None) -> QPushButton:
         """Create a styled button"""
         button = QPushButton(text)
-        style = 'action_button' if action_button else 'button'
-        button.setStyleSheet(cls.get_style(style))
+        button.setObjectName("actionButton" if action_button else "button")
         button.setFont(cls.FONTS['button'])
         if icon_path and os.path.exists(icon_path):
             button.setIcon(QIcon(icon_path))
@@ -745,7 +889,7 @@ class StyleManager:
     def create_input_field(cls, placeholder: str = "", read_only: bool = False) -> QLineEdit:
         """Create a styled input field"""
         field = QLineEdit()
-        field.setStyleSheet(cls.get_style('input_field'))
+        field.setObjectName("inputField")
         field.setFont(cls.FONTS['default'])
         if placeholder:
             field.setPlaceholderText(placeholder)
@@ -759,8 +903,7 @@ class StyleManager:
         spinbox = QSpinBox()
         spinbox.setRange(min_val, max_val)
         spinbox.setValue(value)
-        style = 'table_cell_spinbox' if table_cell else 'spinbox'
-        spinbox.setStyleSheet(cls.get_style(style))
+        spinbox.setObjectName("tableCellSpinbox" if table_cell else "spinbox")
         spinbox.setFont(cls.FONTS['default'])
         return spinbox
 
@@ -769,21 +912,20 @@ class StyleManager:
         """Create a styled checkbox"""
         checkbox = QCheckBox(text)
         checkbox.setChecked(checked)
-        style = 'table_cell_checkbox' if table_cell else 'checkbox'
-        checkbox.setStyleSheet(cls.get_style(style))
+        checkbox.setObjectName("tableCellCheckbox" if table_cell else "checkbox")
         checkbox.setFont(cls.FONTS['default'])
         return checkbox
 
     @classmethod
     def apply_list_style(cls, list_widget):
         """Apply styling to a list widget"""
-        list_widget.setStyleSheet(cls.get_style('list_widget'))
+        list_widget.setObjectName("listView")
         list_widget.setAlternatingRowColors(True)
 
     @classmethod
     def apply_table_style(cls, table_widget):
         """Apply styling to a table widget"""
-        table_widget.setStyleSheet(cls.get_style('table_widget'))
+        table_widget.setObjectName("tableView")
         table_widget.setAlternatingRowColors(True)
         table_widget.horizontalHeader().setStretchLastSection(True)
         table_widget.verticalHeader().setVisible(False)
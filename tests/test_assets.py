@@ -0,0 +1,41 @@
+import pytest
+import trucks
+from assets import ImagePack, write_image_pack
+
+IMAGES = [("alpha.png", b"A" * 40, 4, 5), ("beta_2x.png", b"B" * 12, 8, 10)]
+
+def test_image_pack_round_trip(tmp_path):
+    path = str(tmp_path / "trucks.pack")
+    write_image_pack(path, IMAGES)
+    image_pack = ImagePack(path)
+    try:
+        assert image_pack.names() == ["alpha.png", "beta_2x.png"]
+        assert bytes(image_pack.get("beta_2x.png")) == b"B" * 12
+        assert image_pack.get_size("alpha.png") == (4, 5)
+    finally:
+        image_pack.close()
+
+def test_truncated_image_pack_raises_value_error(tmp_path):
+    path = tmp_path / "trucks.pack"
+    write_image_pack(str(path), IMAGES)
+    data = path.read_bytes()
+    for length in range(1, len(data)):
+        path.write_bytes(data[:length])
+        with pytest.raises(ValueError):
+            ImagePack(str(path))
+
+def test_broken_image_pack_is_not_reopened(tmp_path, monkeypatch):
+    path = tmp_path / "trucks.pack"
+    write_image_pack(str(path), IMAGES)
+    path.write_bytes(path.read_bytes()[:20])
+    opened = []
+    def open_pack(pack_path):
+        opened.append(pack_path)
+        return ImagePack(pack_path)
+    monkeypatch.setattr(trucks, "IMAGE_PACK_PATH", str(path))
+    monkeypatch.setattr(trucks, "IMAGE_PACK", None)
+    monkeypatch.setattr(trucks, "IMAGE_PACK_FAILED", False)
+    monkeypatch.setattr(trucks, "ImagePack", open_pack)
+    assert trucks.get_image_pack() is None
+    assert trucks.get_image_pack() is None
+    assert opened == [str(path)]
@@ -0,0 +1,45 @@
+import random
+import pytest
+from benchmark_json_codec import generate_synthetic_save
+from main import JsonCodec, OrjsonCodec
+
+pytest.importorskip("orjson")
+
+EDGE_VALUES = [
+    {}, [], [[]], [{}], {"a": {}, "b": [], "c": {"d": [[], {}]}},
+    "plain", "", 'quote " and \\ backslash', "\t\n\r\b\f\x00\x1f", "\x7f", "é", "Лесовоз «Север»", "道路",
+    "🚚", "  ", "mixed é 🚚 \x7f end",
+    0, -1, 2 ** 63 - 1, 2 ** 64, -(2 ** 70), True, False, None,
+    0.0, -0.0, 0.1, 1 / 3, 1e-4, 9.99e-5, 1e-5, 2.5e-05, 1e-7, 5e-324, 1e15, 1e16, 1.5e300, -1e-300,
+    4250.00004516773, 10.00001, float("nan"), float("inf"), float("-inf"), [1.0, float("nan"), None],
+    (1, 2.5, "tuple"),
+]
+
+def assert_same_bytes(value):
+    assert OrjsonCodec().dumps(value) == JsonCodec().dumps(value), value
+
+@pytest.mark.parametrize("edge_cases", [False, True])
+def test_orjson_codec_matches_stdlib_on_save_documents(edge_cases):
+    document = generate_synthetic_save(300, edge_cases=edge_cases)
+    assert_same_bytes(document)
+    assert_same_bytes(document["SslValue"])
+    for value in document["SslValue"].values():
+        assert_same_bytes(value)
+
+@pytest.mark.parametrize("value", EDGE_VALUES)
+def test_orjson_codec_matches_stdlib_on_edge_values(value):
+    assert_same_bytes(value)
+    assert_same_bytes({"SslValue": {"money": 5, "value": value}})
+
+def test_orjson_codec_matches_stdlib_on_random_floats():
+    rng = random.Random(0)
+    values = [rng.random() * 10 ** rng.uniform(-30, 30) * rng.choice((1, -1)) for _ in range(20000)]
+    for value in values[:2000]:
+        assert_same_bytes(value)
+    assert_same_bytes(values)
+
+def test_orjson_codec_round_trips_through_stdlib_loads():
+    document = generate_synthetic_save(100, edge_cases=True)
+    data = OrjsonCodec().dumps(document)
+    assert data.isascii()
+    assert JsonCodec().loads(data) == OrjsonCodec().loads(data) == document
@@ -0,0 +1,134 @@
+import copy
+import json
+import pytest
+from benchmark_json_codec import generate_synthetic_save
+from main import JSON_CODECS, LazyDocument, orjson
+
+CODECS = [codec_class() for name, codec_class in JSON_CODECS.items() if orjson is not None or name == "json"]
+
+def load_document(document, codec):
+    raw = bytearray(json.dumps(document, separators=(",", ":")).encode('ascii'))
+    return LazyDocument.parse(raw, codec)
+
+def full_dumps(document):
+    return json.dumps(document, separators=(",", ":")).encode('ascii')
+
+def apply_edits(document, lazy, edits):
+    expected = copy.deepcopy(document)
+    for key, value in edits.items():
+        lazy.data["SslValue"][key] = value
+        expected["SslValue"][key] = value
+    return expected
+
+PATCH_EDITS = [
+    pytest.param({"money": 7654321}, id="same-length"),
+    pytest.param({"money": 10 ** 15, "xp": 123456789}, id="longer"),
+    pytest.param({"money": 1, "xp": 0}, id="shorter"),
+    pytest.param({"companyName": 'New "Roads" \\ Co é 🚚\n'}, id="escaped-string"),
+    pytest.param({"money": 5, "companyName": "x" * 300, "recoveryCoins": {}, "xp": 2.5}, id="mixed"),
+    pytest.param({"lockedTrucks": [], "unlockedLevels": ["a", "b"]}, id="lists"),
+]
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+@pytest.mark.parametrize("edits", PATCH_EDITS)
+def test_patch_in_place_matches_full_dumps(codec, edits):
+    document = generate_synthetic_save(50, edge_cases=True)
+    lazy = load_document(document, codec)
+    expected = apply_edits(document, lazy, edits)
+    patched = lazy.patch_in_place(lazy.data)
+    assert patched is not None
+    assert json.loads(patched) == expected
+    assert bytes(patched) == full_dumps(expected)
+    assert bytes(lazy.dumps(lazy.data)) == full_dumps(expected)
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_repeated_patches_track_shifted_spans(codec):
+    document = generate_synthetic_save(20, edge_cases=True)
+    lazy = load_document(document, codec)
+    for edits in ({"money": 10 ** 12}, {"companyName": "a"}, {"money": 3, "xp": 10 ** 9},
+                  {"companyName": 'é "quoted" é' * 5}):
+        document = apply_edits(document, lazy, edits)
+        patched = lazy.patch_in_place(lazy.data)
+        assert bytes(patched) == full_dumps(document)
+        assert LazyDocument.parse(bytearray(patched), codec).data == lazy.data
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_patch_in_place_without_changes_keeps_the_buffer(codec):
+    document = generate_synthetic_save(20)
+    lazy = load_document(document, codec)
+    original = bytes(lazy.raw)
+    assert bytes(lazy.patch_in_place(lazy.data)) == original
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_structural_changes_skip_patching(codec):
+    document = generate_synthetic_save(20)
+    lazy = load_document(document, codec)
+    del lazy.data["SslValue"]["money"]
+    assert lazy.patch_in_place(lazy.data) is None
+    expected = copy.deepcopy(document)
+    del expected["SslValue"]["money"]
+    assert bytes(lazy.dumps(lazy.data)) == full_dumps(expected)
+
+TRICKY_SSL_VALUE = {
+    "note": 'contains "money":1 and {"xp":2} and \\"lockedTrucks\\":[',
+    "money": 100,
+    'key "with" quotes': {"money": 5, "xp": ["}", "]", "\\", '"']},
+    "xp": 200,
+    "world": [{"SslValue": {"money": 3}}, "\\", "\\\"", "{[", [[[[[[[{"deep": ["]"]}]]]]]]]],
+    "companyName": "back\\slash \"quoted\" é",
+    "lockedTrucks": ["a\"b", "c\\"],
+    "unlockedTrucks": {"map_1": ["a\"b"], 'map "2"': []},
+    "newUnlockedTrucks": [],
+    "unlockedLevels": ["map_1"],
+    "completedLevels": [],
+    "levelsProgress": {"map_1": 0.5},
+    "recoveryCoins": {},
+    "fobsResources": {"map_1": {"resources": [1, 2, 3]}},
+    "big": ["x" * 1000] * 400,
+}
+TRICKY_DOCUMENT = {"before": {"SslValue": {"money": 1}}, "SslValue": TRICKY_SSL_VALUE, "after": '"SslValue":{}'}
+SPLICE_VALUES = {"money": 7, "xp": 10 ** 10, "companyName": 'new "name"', "lockedTrucks": ["z"],
+                 "unlockedTrucks": {"map_9": ["z"]}, "newUnlockedTrucks": ["q"], "unlockedLevels": [],
+                 "completedLevels": ["map_1"], "levelsProgress": {}, "recoveryCoins": {"map_1": 4},
+                 "fobsResources": {"map_1": {"resources": []}}}
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_parse_decodes_only_the_edited_ssl_value_keys(codec):
+    lazy = load_document(TRICKY_DOCUMENT, codec)
+    assert list(lazy.data) == ["SslValue"]
+    assert lazy.data["SslValue"] == {key: TRICKY_SSL_VALUE[key] for key in SPLICE_VALUES}
+    assert [member[0] for member in lazy.members] == list(TRICKY_DOCUMENT)
+    assert [member[0] for member in lazy.ssl_members] == list(TRICKY_SSL_VALUE)
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+@pytest.mark.parametrize("key", list(SPLICE_VALUES))
+def test_splice_each_section_matches_full_dumps(codec, key):
+    lazy = load_document(TRICKY_DOCUMENT, codec)
+    expected = copy.deepcopy(TRICKY_DOCUMENT)
+    lazy.data["SslValue"][key] = expected["SslValue"][key] = SPLICE_VALUES[key]
+    assert bytes(lazy.dumps(lazy.data)) == full_dumps(expected)
+    del lazy.data["SslValue"][key], expected["SslValue"][key]
+    assert bytes(lazy.dumps(lazy.data)) == full_dumps(expected)
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_splice_adds_top_level_and_ssl_value_keys(codec):
+    lazy = load_document(TRICKY_DOCUMENT, codec)
+    expected = copy.deepcopy(TRICKY_DOCUMENT)
+    lazy.data["SslValue"]["brandNew"] = expected["SslValue"]["brandNew"] = {"a": [1, "é"]}
+    lazy.data["extra"] = expected["extra"] = 'top "level"'
+    assert bytes(lazy.dumps(lazy.data)) == full_dumps(expected)
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_splice_keeps_whitespace_formatted_input_valid(codec):
+    raw = bytearray(json.dumps(TRICKY_DOCUMENT, indent=2).encode('ascii'))
+    lazy = LazyDocument.parse(raw, codec)
+    expected = copy.deepcopy(TRICKY_DOCUMENT)
+    for key, value in SPLICE_VALUES.items():
+        lazy.data["SslValue"][key] = expected["SslValue"][key] = value
+    assert json.loads(lazy.dumps(lazy.data)) == expected
+    assert json.loads(lazy.patch_in_place(lazy.data)) == expected
+
+@pytest.mark.parametrize("raw", [b'', b'[]', b'{"a":1', b'{"a" 1}', b'{"a":1}}', b'{"a":"unterminated}', b'{"a":[1,2}'])
+def test_parse_rejects_malformed_json(raw):
+    with pytest.raises(ValueError):
+        LazyDocument.parse(bytearray(raw), CODECS[0])
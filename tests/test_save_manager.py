@@ -0,0 +1,88 @@
+import mmap
+import os
+import random
+import re
+import subprocess
+import sys
+import pytest
+from constants import ERROR_DECOMPRESS_BLOCK
+from main import SAVE_FILE_HEADER_LENGTH, SaveManager
+
+SYNTHETIC_HEADER = b"SAVE" + bytes(SAVE_FILE_HEADER_LENGTH - 4)
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PEAK_RSS_PAYLOAD_SIZE = 32 * 1024 * 1024
+PEAK_RSS_SLACK = 8 * 1024 * 1024
+# Resets the peak RSS after the imports, so only the growth during the decode is measured
+DECODE_PEAK_RSS_SCRIPT = """
+import sys
+from main import SaveManager
+def read_status_kb(field):
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+manager = SaveManager()
+with open('/proc/self/clear_refs', 'w') as f:
+    f.write('5')
+baseline_kb = read_status_kb('VmRSS:')
+_, data = manager.decode_file(sys.argv[1])
+print(len(data), (read_status_kb('VmHWM:') - baseline_kb) * 1024)
+"""
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/clear_refs'), reason="needs Linux peak RSS reset")
+def test_decode_peak_rss_stays_within_output_and_mapped_file(tmp_path):
+    path = str(tmp_path / "CompleteSave")
+    # Incompressible data keeps the file as large as the output, where a copy of the file shows up
+    payload = random.Random(0).randbytes(PEAK_RSS_PAYLOAD_SIZE)
+    SaveManager().encode_file(SYNTHETIC_HEADER, payload, path, workers=1)
+    del payload
+    result = subprocess.run([sys.executable, "-c", DECODE_PEAK_RSS_SCRIPT, path], cwd=REPO_DIR,
+                            capture_output=True, text=True, check=True)
+    decoded_size, growth = map(int, result.stdout.split()[-2:])
+    assert decoded_size == PEAK_RSS_PAYLOAD_SIZE
+    assert growth <= decoded_size + os.path.getsize(path) + PEAK_RSS_SLACK
+
+def write_save(tmp_path, payload: bytes, block_size: int) -> str:
+    path = str(tmp_path / "CompleteSave")
+    SaveManager().encode_file(SYNTHETIC_HEADER, payload, path, block_size=block_size, workers=1)
+    return path
+
+STREAM_PAYLOAD = bytes(range(256)) * 4096 + b'{"SslValue":{"money":1}}' * 5000
+
+def test_iter_decompressed_chunks_from_path_file_and_mmap(tmp_path):
+    path = write_save(tmp_path, STREAM_PAYLOAD, block_size=300 * 1024)
+    manager = SaveManager()
+    chunk_size = 64 * 1024
+    chunks = list(manager.iter_decompressed_chunks(path, chunk_size))
+    assert b"".join(chunks) == STREAM_PAYLOAD
+    assert all(len(chunk) == chunk_size for chunk in chunks[:-1]) and 0 < len(chunks[-1]) <= chunk_size
+    with open(path, 'rb') as f:
+        assert list(manager.iter_decompressed_chunks(f, chunk_size)) == chunks
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        assert list(manager.iter_decompressed_chunks(mapped, chunk_size)) == chunks
+    finally:
+        mapped.close()
+    with open(path, 'rb') as f:
+        assert list(manager.iter_decompressed_chunks(f.read(), chunk_size)) == chunks
+
+def test_iter_decompressed_chunks_closes_sources_early(tmp_path):
+    path = write_save(tmp_path, STREAM_PAYLOAD, block_size=300 * 1024)
+    manager = SaveManager()
+    chunks = manager.iter_decompressed_chunks(path, 1024)
+    assert next(chunks) == STREAM_PAYLOAD[:1024]
+    chunks.close()
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    chunks = manager.iter_decompressed_chunks(mapped, 1024)
+    assert next(chunks) == STREAM_PAYLOAD[:1024]
+    chunks.close()
+    # Fails with BufferError if the generator still holds views into the mapping
+    mapped.close()
+
+def test_iter_decompressed_chunks_reports_the_corrupt_block(tmp_path):
+    path = write_save(tmp_path, STREAM_PAYLOAD, block_size=300 * 1024)
+    with open(path, 'r+b') as f:
+        f.seek(SAVE_FILE_HEADER_LENGTH + 8 + 100)
+        f.write(b"\xff" * 64)
+    with pytest.raises(Exception, match=re.escape(ERROR_DECOMPRESS_BLOCK.format(offset=SAVE_FILE_HEADER_LENGTH))):
+        list(SaveManager().iter_decompressed_chunks(path))
@@ -0,0 +1,42 @@
+from main import SAVE_FILE_HEADER_LENGTH, JsonCodec, SaveManager, SaveWriteWorker
+
+SYNTHETIC_HEADER = b"SAVE" + bytes(SAVE_FILE_HEADER_LENGTH - 4)
+
+class CancelAfterReplaceManager(SaveManager):
+    def __init__(self):
+        super().__init__()
+        self.worker = None
+    def encode_file(self, *args, **kwargs) -> bool:
+        result = super().encode_file(*args, **kwargs)
+        self.worker.cancel()
+        return result
+
+def test_cancel_after_replace_reports_success(tmp_path):
+    path = tmp_path / "CompleteSave.cfg"
+    path.write_bytes(b"old save")
+    manager = CancelAfterReplaceManager()
+    json_data = {"SslValue": {"money": 7}}
+    worker = SaveWriteWorker(manager, JsonCodec(), json_data, None, SYNTHETIC_HEADER, str(path), block_size=64)
+    manager.worker = worker
+    events = []
+    worker.succeeded.connect(lambda result: events.append('succeeded'))
+    worker.cancelled.connect(lambda: events.append('cancelled'))
+    worker.failed.connect(lambda error: events.append(error))
+    worker.run()
+    assert events == ['succeeded']
+    _, data = SaveManager().decode_file(str(path))
+    assert JsonCodec().loads(data) == json_data
+
+def test_cancel_before_replace_keeps_the_old_save(tmp_path):
+    path = tmp_path / "CompleteSave.cfg"
+    path.write_bytes(b"old save")
+    worker = SaveWriteWorker(SaveManager(), JsonCodec(), {"SslValue": {"money": 7}}, None, SYNTHETIC_HEADER,
+                             str(path), block_size=64)
+    events = []
+    worker.succeeded.connect(lambda result: events.append('succeeded'))
+    worker.cancelled.connect(lambda: events.append('cancelled'))
+    worker.progressChanged.connect(lambda value, detail: worker.cancel())
+    worker.run()
+    assert events == ['cancelled']
+    assert path.read_bytes() == b"old save"
+    assert not (tmp_path / "CompleteSave.cfg.tmp").exists()
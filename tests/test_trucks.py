@@ -0,0 +1,88 @@
+import json
+from benchmark_search import TYPED_QUERIES, generate_synthetic_catalog
+from trucks import (TRUCK_CLASSIFIER_RULES, TRUCK_ID_TO_DISPLAY_NAME, TruckLockState, TruckRuleEngine, TrucksData,
+                    TruckSearchIndex, load_classifier_rules)
+
+def type_query(index: TruckSearchIndex, query: str):
+    results = index.search("")
+    for length in range(1, len(query) + 1):
+        results = index.search(query[:length])
+    return results
+
+def test_incremental_search_matches_fresh_search():
+    catalog = generate_synthetic_catalog(2000)
+    typed_index = TruckSearchIndex(catalog)
+    for query in TYPED_QUERIES + ["alpha cran", "scout tuz", "heavy dump"]:
+        assert type_query(typed_index, query) == TruckSearchIndex(catalog).search(query), query
+
+def test_incremental_search_keeps_fuzzy_matches():
+    catalog = {"alpha_crab": "Alpha Crab", "alpha_cxran": "Alpha Cxran"}
+    assert type_query(TruckSearchIndex(catalog), "alpha cran") == ["alpha_crab", "alpha_cxran"]
+
+def test_search_tolerates_transpositions():
+    index = TruckSearchIndex(TRUCK_ID_TO_DISPLAY_NAME)
+    assert index.search("crnae") and set(index.search("crnae")) == set(index.search("crane"))
+
+def test_short_queries_match_inside_tokens():
+    index = TruckSearchIndex(TRUCK_ID_TO_DISPLAY_NAME)
+    for query in ("34", "76", "00", "l3"):
+        expected = {truck_id for truck_id, display_name in TRUCK_ID_TO_DISPLAY_NAME.items()
+                    if query in display_name.lower() or query in truck_id}
+        assert expected and set(index.search(query)) >= expected, query
+    assert set(index.search("34")) == set(index.search("l34"))
+
+def test_classifier_keeps_case_sensitive_id_rules():
+    engine = TruckRuleEngine(TRUCK_CLASSIFIER_RULES)
+    assert engine.classify_field('rarity', "BASE_X_OLD", "Thing") == "Common"
+    assert engine.classify_field('category', "BASE_X_OLD") == "Off-Road Trucks"
+    assert engine.classify_field('rarity', "base_x_old", "Thing") == "Rusty"
+    assert engine.classify_field('category', "base_x") == "Special Vehicles"
+    assert engine.classify_field('type', "SCOUT_X", "") == "Scout"
+
+def test_malformed_rule_fields_fall_back_to_builtin_rules(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({
+        'type': [{'value': "Scout"}],
+        'rarity': {'rules': [{'id': ['_old']}]},
+        'category': {'rules': [{'value': "Scouts", 'id': "tuz"}]},
+    }))
+    rules = load_classifier_rules(str(path))
+    assert rules == TRUCK_CLASSIFIER_RULES
+    assert TruckRuleEngine(rules).classify_field('category', "tuz_x") == "Scout Vehicles"
+
+def test_valid_rule_fields_replace_builtin_rules(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({'type': {'default': "Other", 'rules': [{'value': "Crane", 'id': ['crane']}]}, 'rarity': 5}))
+    rules = load_classifier_rules(str(path))
+    assert rules['rarity'] == TRUCK_CLASSIFIER_RULES['rarity']
+    engine = TruckRuleEngine(rules)
+    assert engine.classify_field('type', "big_crane") == "Crane"
+    assert engine.classify_field('type', "tuz_x") == "Other"
+
+def test_reset_discovered_drops_trucks_from_the_previous_save():
+    trucks_data = TrucksData()
+    catalog_size = len(trucks_data.get_all_trucks())
+    assert trucks_data.discover_trucks({"lockedTrucks": ["only_in_save_a_new"]}) == ["only_in_save_a_new"]
+    assert trucks_data.search_trucks("only in save") == ["only_in_save_a_new"]
+    trucks_data.reset_discovered()
+    trucks_data.discover_trucks({"lockedTrucks": ["only_in_save_b_new"]})
+    assert "only_in_save_a_new" not in trucks_data.get_all_trucks()
+    assert trucks_data.get_ordinal("only_in_save_b_new") == catalog_size
+    assert trucks_data.search_trucks("only in save") == ["only_in_save_b_new"]
+
+def test_lock_state_covers_maps_missing_from_the_known_table():
+    ssl_value = {"lockedTrucks": ["b"], "unlockedTrucks": {"custom_map": ["a"], "known_2": ["a"]}}
+    state = TruckLockState.from_ssl_value(ssl_value, ["known_1", "known_2"], ["a", "b", "c"])
+    assert state.map_ids == ["custom_map", "known_2", "known_1"]
+    state.unlock("b")
+    assert all(state.is_unlocked("b", map_id) for map_id in state.map_ids)
+    state.lock("a")
+    assert state.is_locked("a") and not state.is_unlocked("a")
+    state.set_all_unlocked(["a", "b", "c"])
+    state.to_ssl_value(ssl_value)
+    assert ssl_value == {"lockedTrucks": [], "unlockedTrucks": {map_id: ["a", "b", "c"] for map_id in
+                                                                   ("custom_map", "known_2", "known_1")}}
+    state.set_all_locked(["a", "b", "c"])
+    state.to_ssl_value(ssl_value)
+    assert ssl_value["lockedTrucks"] == ["a", "b", "c"]
+    assert all(trucks == [] for trucks in ssl_value["unlockedTrucks"].values())
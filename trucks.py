@@ -1,8 +1,20 @@
+import bisect
+import json
 import os
-from typing import Dict, List, Optional
-from constants import IMAGES_DIR_NAME
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+from assets import ImagePack
+from constants import CONFIG_DIR_NAME, IMAGES_DIR_NAME, IMAGE_PACK_FILE_NAME, TRUCK_RULES_FILE_NAME
 
-IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), IMAGES_DIR_NAME, "trucks")
+BASE_DIR = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+IMAGE_DIR = os.path.join(BASE_DIR, IMAGES_DIR_NAME, "trucks")
+IMAGE_PACK_PATH = os.path.join(BASE_DIR, IMAGES_DIR_NAME, IMAGE_PACK_FILE_NAME)
+IMAGE_PACK_SCALES = (1, 2)
+IMAGE_EXTENSIONS = ('.png', '.webp', '.jpg', '.jpeg')
+NO_IMAGE_STEM = "no_image_available"
 
 TRUCK_ID_TO_DISPLAY_NAME = {
     "alces_c400_concrete_mixer_new": "ALCES C400 Concrete Mixer",
@@ -101,64 +113,460 @@ TRUCK_PATTERNS = {
     'special': ['base_']
 }
 
-class TruckClassifier:
+TRUCK_CLASSIFIER_RULES = {
+    'type': {
+        'default': "Unknown",
+        'rules': [
+            {'value': "Scout", 'id': TRUCK_PATTERNS['scout']},
+            {'value': "Construction", 'id': TRUCK_PATTERNS['construction']},
+            {'value': "Cargo", 'id': ['cargo', 'truck']},
+            {'value': "Tractor", 'id': ['tractor']},
+        ],
+    },
+    'rarity': {
+        'default': "Common",
+        'rules': [
+            {'value': "Rusty", 'id': ['_old'], 'name': ['rusty'], 'case_sensitive': True},
+            {'value': "Base", 'id': TRUCK_PATTERNS['special'], 'case_sensitive': True},
+            {'value': "Heavy", 'id': TRUCK_PATTERNS['heavy']},
+        ],
+    },
+    'category': {
+        'default': "Off-Road Trucks",
+        'rules': [
+            {'value': "Scout Vehicles", 'id': TRUCK_PATTERNS['scout']},
+            {'value': "Construction", 'id': TRUCK_PATTERNS['construction']},
+            {'value': "Heavy Trucks", 'id': TRUCK_PATTERNS['heavy']},
+            {'value': "Special Vehicles", 'id': TRUCK_PATTERNS['special'], 'case_sensitive': True},
+        ],
+    },
+}
+TRUCK_RULES_PATH = os.path.join(os.path.expanduser("~"), CONFIG_DIR_NAME, TRUCK_RULES_FILE_NAME)
+
+def is_pattern_list(patterns: Any) -> bool:
+    return isinstance(patterns, list) and all(isinstance(pattern, str) for pattern in patterns)
+def is_valid_rule_table(table: Any) -> bool:
+    if not isinstance(table, dict) or not isinstance(table.get('default', ""), str):
+        return False
+    rules = table.get('rules', [])
+    if not isinstance(rules, list):
+        return False
+    for rule in rules:
+        if not isinstance(rule, dict) or not isinstance(rule.get('value'), str):
+            return False
+        if not is_pattern_list(rule.get('id', [])) or not is_pattern_list(rule.get('name', [])):
+            return False
+        if not isinstance(rule.get('case_sensitive', False), bool):
+            return False
+    return True
+def load_classifier_rules(path: str = TRUCK_RULES_PATH) -> Dict[str, Any]:
+    rules = dict(TRUCK_CLASSIFIER_RULES)
+    if os.path.isfile(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                # Malformed fields keep the built-in rules instead of failing later inside a GUI slot
+                rules.update({field: table for field, table in loaded.items()
+                              if field in rules and is_valid_rule_table(table)})
+        except (OSError, ValueError):
+            pass
+    return rules
+
+class TruckRuleEngine:
+    def __init__(self, rules: Dict[str, Any]):
+        self.fields = {field: index for index, field in enumerate(rules)}
+        self.id_patterns: Dict[str, int] = {}
+        self.exact_id_patterns: Dict[str, int] = {}
+        self.name_patterns: Dict[str, int] = {}
+        self.tables = []
+        for field in rules:
+            compiled_rules = []
+            for rule in rules[field].get('rules', []):
+                if rule.get('case_sensitive', False):
+                    id_mask = 0
+                    exact_id_mask = self.compile_patterns(self.exact_id_patterns, rule.get('id', []), case_sensitive=True)
+                else:
+                    id_mask = self.compile_patterns(self.id_patterns, rule.get('id', []))
+                    exact_id_mask = 0
+                name_mask = self.compile_patterns(self.name_patterns, rule.get('name', []))
+                compiled_rules.append((rule['value'], id_mask, exact_id_mask, name_mask))
+            self.tables.append((tuple(compiled_rules), rules[field].get('default')))
+        self.id_patterns_items = tuple(self.id_patterns.items())
+        self.exact_id_patterns_items = tuple(self.exact_id_patterns.items())
+        self.name_patterns_items = tuple(self.name_patterns.items())
+        self.id_masks: Dict[str, tuple] = {}
+        self.cache: Dict[tuple, tuple] = {}
     @staticmethod
-    def get_truck_type(truck_id: str, display_name: str) -> str:
-        truck_id_lower = truck_id.lower()
-        display_name_lower = display_name.lower()
-        if any(pattern in truck_id_lower for pattern in TRUCK_PATTERNS['scout']):
-            return "Scout"
-        elif any(pattern in truck_id_lower for pattern in TRUCK_PATTERNS['construction']):
-            return "Construction"
-        elif any(pattern in truck_id_lower for pattern in ['cargo', 'truck']):
-            return "Cargo"
-        elif "tractor" in truck_id_lower:
-            return "Tractor"
-        else:
-            return "Unknown"
+    def compile_patterns(bits: Dict[str, int], patterns: Iterable[str], case_sensitive: bool = False) -> int:
+        mask = 0
+        for pattern in patterns:
+            if not case_sensitive:
+                pattern = pattern.lower()
+            if pattern not in bits:
+                bits[pattern] = 1 << len(bits)
+            mask |= bits[pattern]
+        return mask
     @staticmethod
-    def get_truck_rarity(truck_id: str, display_name: str) -> str:
-        if "rusty" in display_name.lower() or "_old" in truck_id:
-            return "Rusty"
-        elif "base_" in truck_id:
-            return "Base"
-        elif any(pattern in truck_id.lower() for pattern in TRUCK_PATTERNS['heavy']):
-            return "Heavy"
-        else:
-            return "Common"
-    @staticmethod
-    def get_truck_category(truck_id: str) -> str:
-        truck_id_lower = truck_id.lower()
-        if any(pattern in truck_id_lower for pattern in TRUCK_PATTERNS['scout']):
-            return "Scout Vehicles"
-        elif any(pattern in truck_id_lower for pattern in TRUCK_PATTERNS['construction']):
-            return "Construction"
-        elif any(pattern in truck_id_lower for pattern in TRUCK_PATTERNS['heavy']):
-            return "Heavy Trucks"
-        elif 'base_' in truck_id:
-            return "Special Vehicles"
-        else:
-            return "Off-Road Trucks"
+    def match_patterns(patterns: tuple, text: str, case_sensitive: bool = False) -> int:
+        if not case_sensitive:
+            text = text.lower()
+        mask = 0
+        for pattern, bit in patterns:
+            if pattern in text:
+                mask |= bit
+        return mask
+    def classify(self, truck_id: str, display_name: str = "") -> tuple:
+        key = (truck_id, display_name)
+        result = self.cache.get(key)
+        if result is not None:
+            return result
+        id_masks = self.id_masks.get(truck_id)
+        if id_masks is None:
+            id_masks = self.id_masks[truck_id] = (
+                self.match_patterns(self.id_patterns_items, truck_id),
+                self.match_patterns(self.exact_id_patterns_items, truck_id, case_sensitive=True)
+            )
+        id_mask, exact_id_mask = id_masks
+        name_mask = self.match_patterns(self.name_patterns_items, display_name) if display_name else 0
+        values = []
+        for compiled_rules, default in self.tables:
+            value = default
+            for rule_value, rule_id_mask, rule_exact_id_mask, rule_name_mask in compiled_rules:
+                if id_mask & rule_id_mask or exact_id_mask & rule_exact_id_mask or name_mask & rule_name_mask:
+                    value = rule_value
+                    break
+            values.append(value)
+        result = self.cache[key] = tuple(values)
+        return result
+    def classify_field(self, field: str, truck_id: str, display_name: str = "") -> str:
+        return self.classify(truck_id, display_name)[self.fields[field]]
 
+class TruckClassifier:
+    engine: Optional[TruckRuleEngine] = None
+    @classmethod
+    def get_engine(cls) -> TruckRuleEngine:
+        if cls.engine is None:
+            cls.engine = TruckRuleEngine(load_classifier_rules())
+        return cls.engine
+    @classmethod
+    def reload_rules(cls, rules: Optional[Dict[str, Any]] = None) -> None:
+        cls.engine = TruckRuleEngine(rules if rules is not None else load_classifier_rules())
+    @classmethod
+    def classify(cls, truck_id: str, display_name: str = "") -> Dict[str, str]:
+        engine = cls.get_engine()
+        return dict(zip(engine.fields, engine.classify(truck_id, display_name)))
+    @classmethod
+    def get_truck_type(cls, truck_id: str, display_name: str) -> str:
+        return cls.get_engine().classify_field('type', truck_id, display_name)
+    @classmethod
+    def get_truck_rarity(cls, truck_id: str, display_name: str) -> str:
+        return cls.get_engine().classify_field('rarity', truck_id, display_name)
+    @classmethod
+    def get_truck_category(cls, truck_id: str) -> str:
+        return cls.get_engine().classify_field('category', truck_id)
+
+TRUCK_ID_SUFFIX_LABELS = {'new': "", 'res': "", 'old': "Rusty"}
+TRUCK_ID_LIST_KEYS = ("lockedTrucks", "newUnlockedTrucks")
+def get_display_name_from_id(truck_id: str) -> str:
+    words = [word for word in truck_id.split("_") if word]
+    suffix = ""
+    if len(words) > 1 and words[-1] in TRUCK_ID_SUFFIX_LABELS:
+        suffix = TRUCK_ID_SUFFIX_LABELS[words.pop()]
+    name = " ".join([word.capitalize() if word.isalpha() else word.upper() for word in words])
+    return f"{name} ({suffix})" if suffix else name
+def iter_truck_id_lists(ssl_value: Dict[str, Any]) -> Iterable[List[Any]]:
+    for key in TRUCK_ID_LIST_KEYS:
+        values = ssl_value.get(key)
+        if isinstance(values, list):
+            yield values
+    unlocked_trucks = ssl_value.get("unlockedTrucks")
+    if isinstance(unlocked_trucks, dict):
+        for values in unlocked_trucks.values():
+            if isinstance(values, list):
+                yield values
 def get_truck_display_name(truck_id: str) -> str:
     return TRUCK_ID_TO_DISPLAY_NAME.get(truck_id, f"Unknown Truck ({truck_id})")
 def get_truck_id_from_display_name(display_name: str) -> Optional[str]:
     return DISPLAY_NAME_TO_TRUCK_ID.get(display_name)
+def get_packed_image_name(file_name: str, scale: int = 1) -> str:
+    if scale == 1:
+        return file_name
+    stem, ext = os.path.splitext(file_name)
+    return f"{stem}@{scale}x{ext}"
+IMAGE_PACK: Optional[ImagePack] = None
+IMAGE_PACK_FAILED = False
+IMAGE_PACK_LOCK = threading.Lock()
+def get_image_pack() -> Optional[ImagePack]:
+    global IMAGE_PACK, IMAGE_PACK_FAILED
+    if IMAGE_PACK is None and not IMAGE_PACK_FAILED and os.path.isfile(IMAGE_PACK_PATH):
+        # Image loader workers race here on the first lookup
+        with IMAGE_PACK_LOCK:
+            if IMAGE_PACK is None and not IMAGE_PACK_FAILED:
+                try:
+                    IMAGE_PACK = ImagePack(IMAGE_PACK_PATH)
+                except (OSError, ValueError):
+                    # A broken pack stays broken, so later lookups go straight to the loose image files
+                    IMAGE_PACK_FAILED = True
+    return IMAGE_PACK
+def find_packed_image(path: str, pixel_width: int, pixel_height: int) -> Optional[memoryview]:
+    image_pack = get_image_pack()
+    if image_pack is None or os.path.dirname(path) != IMAGE_DIR:
+        return None
+    file_name = os.path.basename(path)
+    best = None
+    for scale in IMAGE_PACK_SCALES:
+        name = get_packed_image_name(file_name, scale)
+        size = image_pack.get_size(name)
+        if size is None:
+            continue
+        best = name
+        if size[0] >= pixel_width or size[1] >= pixel_height:
+            break
+    return image_pack.get(best) if best else None
+def build_image_index(image_dir: str = IMAGE_DIR) -> Dict[str, str]:
+    ranked: Dict[str, tuple] = {}
+    def add(file_name: str, path: str):
+        stem, ext = os.path.splitext(file_name)
+        ext = ext.lower()
+        if ext not in IMAGE_EXTENSIONS:
+            return
+        key = os.path.normcase(stem)
+        rank = IMAGE_EXTENSIONS.index(ext)
+        if key not in ranked or rank < ranked[key][0]:
+            ranked[key] = (rank, path)
+    image_pack = get_image_pack() if image_dir == IMAGE_DIR else None
+    if image_pack is not None:
+        for name in image_pack.names():
+            if "@" not in name:
+                add(name, os.path.join(image_dir, name))
+    try:
+        entries = os.scandir(image_dir)
+    except OSError:
+        entries = None
+    if entries is not None:
+        with entries:
+            for entry in entries:
+                if entry.is_file():
+                    add(entry.name, entry.path)
+    return {key: path for key, (_, path) in ranked.items()}
+IMAGE_INDEX: Optional[Dict[str, str]] = None
+def get_image_index() -> Dict[str, str]:
+    global IMAGE_INDEX
+    if IMAGE_INDEX is None:
+        IMAGE_INDEX = build_image_index()
+    return IMAGE_INDEX
+def invalidate_image_index() -> None:
+    global IMAGE_INDEX
+    IMAGE_INDEX = None
+def find_image(stem: str) -> Optional[str]:
+    return get_image_index().get(os.path.normcase(stem))
+def get_image_stem_from_display_name(display_name: str) -> str:
+    filename_base = display_name.lower()
+    filename_base = filename_base.replace("\"", "")
+    filename_base = filename_base.replace(" ", "_")
+    filename_base = filename_base.replace(".", "")
+    return filename_base
 def get_truck_image_path(truck_id: str) -> Optional[str]:
     if not truck_id:
         return None
-    for ext in ['.png', '.webp', '.jpg', '.jpeg']:
-        path = os.path.join(IMAGE_DIR, f"{truck_id}{ext}")
-        if os.path.exists(path):
-            return path
-    return None
+    return find_image(truck_id)
 def get_all_truck_ids() -> List[str]:
     return list(TRUCK_ID_TO_DISPLAY_NAME.keys())
+SEARCH_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SEARCH_FUZZY_THRESHOLD = 0.4
+SEARCH_FUZZY_MIN_LENGTH = 3
+SEARCH_MAX_EDIT_DISTANCE = 1
+SEARCH_TOKEN_CACHE_SIZE = 256
+def tokenize_search_text(text: str) -> List[str]:
+    return SEARCH_TOKEN_PATTERN.findall(text.lower())
+def get_trigrams(token: str) -> Set[str]:
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+def get_edit_distance(first: str, second: str) -> int:
+    # Levenshtein distance that also counts swapping two adjacent characters as one edit
+    previous_row = None
+    row = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        previous_row, row, current = row, [i] + [0] * len(second), previous_row
+        for j in range(1, len(second) + 1):
+            cost = 0 if first[i - 1] == second[j - 1] else 1
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                row[j] = min(row[j], current[j - 2] + 1)
+    return row[-1]
+class TruckSearchIndex:
+    def __init__(self, truck_data: Dict[str, str]):
+        self.truck_ids = list(truck_data)
+        vocabulary: Dict[str, int] = {}
+        self.entry_tokens: List[tuple] = []
+        for truck_id, display_name in truck_data.items():
+            token_ids = []
+            for token in tokenize_search_text(display_name) + tokenize_search_text(truck_id):
+                token_id = vocabulary.setdefault(token, len(vocabulary))
+                if token_id not in token_ids:
+                    token_ids.append(token_id)
+            self.entry_tokens.append(tuple(token_ids))
+        self.tokens = list(vocabulary)
+        self.sorted_tokens = sorted(vocabulary)
+        self.sorted_token_ids = [vocabulary[token] for token in self.sorted_tokens]
+        postings: List[List[int]] = [[] for _ in self.tokens]
+        for entry, token_ids in enumerate(self.entry_tokens):
+            for token_id in token_ids:
+                postings[token_id].append(entry)
+        self.postings = postings
+        self.token_trigram_counts = []
+        self.trigrams: Dict[str, List[int]] = {}
+        for token_id, token in enumerate(self.tokens):
+            trigrams = get_trigrams(token)
+            self.token_trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                self.trigrams.setdefault(trigram, []).append(token_id)
+        self.token_cache: "OrderedDict[str, Dict[int, float]]" = OrderedDict()
+        self.result_cache: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        for character in sorted({token[0] for token in self.tokens}):
+            self.search(character)
+    def match_token(self, query_token: str) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        start = bisect.bisect_left(self.sorted_tokens, query_token)
+        for index in range(start, len(self.sorted_tokens)):
+            token = self.sorted_tokens[index]
+            if not token.startswith(query_token):
+                break
+            scores[self.sorted_token_ids[index]] = 1.0 if len(token) == len(query_token) else \
+                0.8 + 0.2 * len(query_token) / len(token)
+        if len(query_token) < SEARCH_FUZZY_MIN_LENGTH:
+            # Too short for trigrams, so scan the vocabulary for the substring like the old filter did
+            for token_id, token in enumerate(self.tokens):
+                if token_id not in scores and query_token in token:
+                    scores[token_id] = 0.6
+            return scores
+        query_trigrams = get_trigrams(query_token)
+        shared: Dict[int, int] = {}
+        for trigram in query_trigrams:
+            for token_id in self.trigrams.get(trigram, ()):
+                shared[token_id] = shared.get(token_id, 0) + 1
+        inner_trigrams = {trigram for trigram in query_trigrams if " " not in trigram}
+        for token_id, count in shared.items():
+            if token_id in scores:
+                continue
+            token = self.tokens[token_id]
+            if count >= len(inner_trigrams) and query_token in token:
+                scores[token_id] = 0.6
+                continue
+            similarity = 2 * count / (len(query_trigrams) + self.token_trigram_counts[token_id])
+            if similarity >= SEARCH_FUZZY_THRESHOLD:
+                scores[token_id] = 0.5 * similarity
+            elif abs(len(token) - len(query_token)) <= SEARCH_MAX_EDIT_DISTANCE and \
+                    get_edit_distance(query_token, token) <= SEARCH_MAX_EDIT_DISTANCE:
+                scores[token_id] = 0.5 * SEARCH_FUZZY_THRESHOLD
+        return scores
+    def get_token_entry_scores(self, query_token: str) -> Dict[int, float]:
+        entry_scores = self.token_cache.get(query_token)
+        if entry_scores is not None:
+            self.token_cache.move_to_end(query_token)
+            return entry_scores
+        entry_scores = {}
+        for token_id, score in sorted(self.match_token(query_token).items(), key=lambda item: item[1]):
+            entry_scores.update(dict.fromkeys(self.postings[token_id], score))
+        self.token_cache[query_token] = entry_scores
+        if len(self.token_cache) > SEARCH_TOKEN_CACHE_SIZE:
+            self.token_cache.popitem(last=False)
+        return entry_scores
+    def search(self, query: str) -> List[str]:
+        query_tokens = tokenize_search_text(query)
+        if not query_tokens:
+            return list(self.truck_ids)
+        key = tuple(query_tokens)
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            self.result_cache.move_to_end(key)
+            return list(cached)
+        token_entry_scores = sorted((self.get_token_entry_scores(token) for token in query_tokens), key=len)
+        if len(token_entry_scores) == 1:
+            scores = token_entry_scores[0]
+        else:
+            candidates = token_entry_scores[0].keys()
+            for entry_scores in token_entry_scores[1:]:
+                candidates = candidates & entry_scores.keys()
+            scores = {entry: token_entry_scores[0][entry] for entry in candidates}
+            for entry_scores in token_entry_scores[1:]:
+                scores = {entry: score + entry_scores[entry] for entry, score in scores.items()}
+        ranked = sorted(sorted(scores), key=scores.__getitem__, reverse=True)
+        results = [self.truck_ids[entry] for entry in ranked]
+        self.result_cache[key] = results
+        if len(self.result_cache) > SEARCH_TOKEN_CACHE_SIZE:
+            self.result_cache.popitem(last=False)
+        return list(results)
+TRUCK_CATEGORY_ORDER = ("Off-Road Trucks", "Heavy Trucks", "Scout Vehicles", "Special Vehicles", "Construction")
 class TrucksData:
     def __init__(self):
-        self.truck_data = TRUCK_ID_TO_DISPLAY_NAME
-        self.reverse_mapping = DISPLAY_NAME_TO_TRUCK_ID
+        self.truck_data = dict(TRUCK_ID_TO_DISPLAY_NAME)
+        self.reverse_mapping = dict(DISPLAY_NAME_TO_TRUCK_ID)
+        self.ordinals = {truck_id: ordinal for ordinal, truck_id in enumerate(self.truck_data)}
+        self.discovered: List[str] = []
         self.classifier = TruckClassifier()
+        self.index: Optional[Dict[str, Any]] = None
+        self.search_index: Optional[TruckSearchIndex] = None
+    def add_truck(self, truck_id: str, display_name: Optional[str] = None) -> int:
+        ordinal = self.ordinals.get(truck_id)
+        if ordinal is not None:
+            return ordinal
+        display_name = display_name or get_display_name_from_id(truck_id)
+        self.truck_data[truck_id] = display_name
+        self.reverse_mapping.setdefault(display_name, truck_id)
+        ordinal = self.ordinals[truck_id] = len(self.ordinals)
+        self.discovered.append(truck_id)
+        self.invalidate_index()
+        return ordinal
+    def reset_discovered(self) -> None:
+        if not self.discovered:
+            return
+        for truck_id in self.discovered:
+            display_name = self.truck_data.pop(truck_id)
+            if self.reverse_mapping.get(display_name) == truck_id:
+                del self.reverse_mapping[display_name]
+            del self.ordinals[truck_id]
+        self.discovered = []
+        self.invalidate_index()
+    def discover_trucks(self, ssl_value: Dict[str, Any]) -> List[str]:
+        discovered = []
+        for values in iter_truck_id_lists(ssl_value):
+            for index, truck_id in enumerate(values):
+                if not isinstance(truck_id, str):
+                    continue
+                truck_id = values[index] = sys.intern(truck_id)
+                if truck_id not in self.ordinals:
+                    self.add_truck(truck_id)
+                    discovered.append(truck_id)
+        return discovered
+    def get_ordinal(self, truck_id: str) -> Optional[int]:
+        return self.ordinals.get(truck_id)
+    def get_truck_ids_by_ordinal(self) -> List[str]:
+        return list(self.ordinals)
+    def is_discovered(self, truck_id: str) -> bool:
+        return truck_id in self.ordinals and truck_id not in TRUCK_ID_TO_DISPLAY_NAME
+    def invalidate_index(self) -> None:
+        self.index = None
+        self.search_index = None
+    def get_index(self) -> Dict[str, Any]:
+        if self.index is None:
+            self.index = self.build_index()
+        return self.index
+    def build_index(self) -> Dict[str, Any]:
+        stats = {}
+        inverted: Dict[str, Dict[Any, Set[str]]] = {'category': {}, 'rarity': {}, 'type': {}, 'has_image': {}}
+        for truck_id in self.truck_data:
+            truck_stats = self.compute_truck_stats(truck_id)
+            stats[truck_id] = truck_stats
+            for field, values in inverted.items():
+                values.setdefault(truck_stats[field], set()).add(truck_id)
+        index: Dict[str, Any] = {
+            field: {value: frozenset(truck_ids) for value, truck_ids in values.items()}
+            for field, values in inverted.items()
+        }
+        index['stats'] = stats
+        return index
     def get_display_name(self, truck_id: str) -> str:
         return self.truck_data.get(truck_id, truck_id)
     def get_truck_id(self, display_name: str) -> str:
@@ -166,57 +574,42 @@ class TrucksData:
     def get_all_trucks(self) -> Dict[str, str]:
         return self.truck_data.copy()
     def get_truck_categories(self) -> Dict[str, List[str]]:
+        by_category = self.get_index()['category']
         categories = {
-            "Off-Road Trucks": [],
-            "Heavy Trucks": [],
-            "Scout Vehicles": [],
-            "Special Vehicles": [],
-            "Construction": [],
+            category: [truck_id for truck_id in self.truck_data if truck_id in by_category.get(category, ())]
+            for category in TRUCK_CATEGORY_ORDER
         }
-        for truck_id in self.truck_data.keys():
-            category = self.classifier.get_truck_category(truck_id)
-            if category in categories:
-                categories[category].append(truck_id)
-            else:
-                categories["Off-Road Trucks"].append(truck_id)
         return {k: v for k, v in categories.items() if v}
     def search_trucks(self, query: str) -> List[str]:
-        query = query.lower()
-        results = []
-        for truck_id, display_name in self.truck_data.items():
-            if (query in display_name.lower() or query in truck_id.lower()):
-                results.append(truck_id)
-        return results
+        if self.search_index is None:
+            self.search_index = TruckSearchIndex(self.truck_data)
+        return self.search_index.search(query)
     def get_truck_image_path(self, truck_id: str) -> Optional[str]:
         if not truck_id:
             return None
-        for ext in ['.png', '.webp', '.jpg', '.jpeg']:
-            path = os.path.join(IMAGE_DIR, f"{truck_id}{ext}")
-            if os.path.exists(path):
-                return path
+        path = find_image(truck_id)
+        if path:
+            return path
         display_name = self.get_display_name(truck_id)
         if display_name:
-            filename_base = display_name.lower()
-            filename_base = filename_base.replace("\"", "")
-            filename_base = filename_base.replace(" ", "_")
-            filename_base = filename_base.replace("-", "-")
-            filename_base = filename_base.replace(".", "")
-            for ext in ['.png', '.webp', '.jpg', '.jpeg']:
-                path = os.path.join(IMAGE_DIR, f"{filename_base}{ext}")
-                if os.path.exists(path):
-                    return path
-        no_image_path = os.path.join(IMAGE_DIR, "no_image_available.png")
-        if os.path.exists(no_image_path):
-            return no_image_path
-        return None
+            path = find_image(get_image_stem_from_display_name(display_name))
+            if path:
+                return path
+        return find_image(NO_IMAGE_STEM)
     def get_truck_stats(self, truck_id: str) -> dict:
+        truck_stats = self.get_index()['stats'].get(truck_id)
+        if truck_stats is None:
+            return self.compute_truck_stats(truck_id)
+        return dict(truck_stats)
+    def compute_truck_stats(self, truck_id: str) -> dict:
         display_name = self.get_display_name(truck_id)
+        classification = self.classifier.classify(truck_id, display_name)
         return {
             'id': truck_id,
             'display_name': display_name,
-            'type': self.classifier.get_truck_type(truck_id, display_name),
-            'rarity': self.classifier.get_truck_rarity(truck_id, display_name),
-            'category': self.classifier.get_truck_category(truck_id),
+            'type': classification['type'],
+            'rarity': classification['rarity'],
+            'category': classification['category'],
             'has_image': bool(self.get_truck_image_path(truck_id))
         }
     def filter_trucks(self, trucks: List[str], 
@@ -224,21 +617,123 @@ class TrucksData:
                      rarity: Optional[str] = None,
                      truck_type: Optional[str] = None,
                      has_image: Optional[bool] = None) -> List[str]:
-        filtered = trucks.copy()
-        if category:
-            categories = self.get_truck_categories()
-            if category in categories:
-                filtered = [t for t in filtered if t in categories[category]]
-        if rarity or truck_type or has_image is not None:
-            filtered_by_stats = []
-            for truck_id in filtered:
-                stats = self.get_truck_stats(truck_id)
-                if rarity and stats['rarity'] != rarity:
-                    continue
-                if truck_type and stats['type'] != truck_type:
-                    continue
-                if has_image is not None and stats['has_image'] != has_image:
-                    continue
-                filtered_by_stats.append(truck_id)
-            filtered = filtered_by_stats
+        index = self.get_index()
+        criteria = []
+        if category and category in index['category']:
+            criteria.append(('category', category))
+        if rarity:
+            criteria.append(('rarity', rarity))
+        if truck_type:
+            criteria.append(('type', truck_type))
+        if has_image is not None:
+            criteria.append(('has_image', has_image))
+        if not criteria:
+            return trucks.copy()
+        allowed = frozenset.intersection(*(index[field].get(value, frozenset()) for field, value in criteria))
+        stats = index['stats']
+        filtered = []
+        for truck_id in trucks:
+            if truck_id in stats:
+                if truck_id in allowed:
+                    filtered.append(truck_id)
+            elif not category or category not in index['category']:
+                truck_stats = self.compute_truck_stats(truck_id)
+                if all(truck_stats[field] == value for field, value in criteria):
+                    filtered.append(truck_id)
         return filtered
+class TruckLockState:
+    def __init__(self, locked_trucks: Iterable[str] = (), unlocked_trucks: Optional[Dict[str, Iterable[str]]] = None,
+                 map_ids: Iterable[str] = (), truck_ids: Iterable[str] = ()):
+        self.truck_ids: List[str] = []
+        self.ordinals: Dict[str, int] = {}
+        for truck_id in truck_ids:
+            self.ordinal(truck_id)
+        self.locked = self.mask_for(locked_trucks)
+        self.unlocked = {map_id: self.mask_for(trucks) for map_id, trucks in (unlocked_trucks or {}).items()}
+        # Maps the save lists but the known table lacks still take part in every lock and unlock
+        for map_id in map_ids:
+            self.unlocked.setdefault(map_id, 0)
+        self.map_ids = list(self.unlocked)
+    @classmethod
+    def from_ssl_value(cls, ssl_value: Dict[str, Any], map_ids: Iterable[str],
+                       truck_ids: Iterable[str] = ()) -> 'TruckLockState':
+        return cls(ssl_value.get("lockedTrucks", []), ssl_value.get("unlockedTrucks", {}), map_ids, truck_ids)
+    def ordinal(self, truck_id: str) -> int:
+        index = self.ordinals.get(truck_id)
+        if index is None:
+            index = self.ordinals[truck_id] = len(self.truck_ids)
+            self.truck_ids.append(truck_id)
+        return index
+    def mask_for(self, truck_ids: Iterable[str]) -> int:
+        mask = 0
+        for truck_id in truck_ids:
+            mask |= 1 << self.ordinal(truck_id)
+        return mask
+    def truck_ids_for(self, mask: int) -> List[str]:
+        truck_ids = self.truck_ids
+        return sorted(truck_ids[index] for index, bit in enumerate(reversed(bin(mask)[2:])) if bit == "1")
+    def _select_maps(self, map_ids: Optional[Iterable[str]]) -> List[str]:
+        if map_ids is None:
+            return self.map_ids
+        return [map_id for map_id in map_ids if map_id in self.unlocked]
+    def unlocked_mask(self, map_ids: Optional[Iterable[str]] = None, require_all: bool = False) -> int:
+        rows = [self.unlocked[map_id] for map_id in (self.unlocked if map_ids is None else self._select_maps(map_ids))]
+        if not rows:
+            return 0
+        mask = rows[0]
+        for row in rows[1:]:
+            mask = mask & row if require_all else mask | row
+        return mask
+    def unlock_mask(self, mask: int, map_ids: Optional[Iterable[str]] = None) -> None:
+        for map_id in self._select_maps(map_ids):
+            self.unlocked[map_id] |= mask
+        self.locked &= ~mask
+    def lock_mask(self, mask: int, map_ids: Optional[Iterable[str]] = None) -> None:
+        for map_id in self._select_maps(map_ids):
+            self.unlocked[map_id] &= ~mask
+        self.locked |= mask & ~self.unlocked_mask()
+    def unlock(self, truck_id: str) -> None:
+        self.unlock_mask(1 << self.ordinal(truck_id))
+    def lock(self, truck_id: str) -> None:
+        self.lock_mask(1 << self.ordinal(truck_id))
+    def unlock_many(self, truck_ids: Iterable[str], map_ids: Optional[Iterable[str]] = None) -> None:
+        self.unlock_mask(self.mask_for(truck_ids), map_ids)
+    def lock_many(self, truck_ids: Iterable[str], map_ids: Optional[Iterable[str]] = None) -> None:
+        self.lock_mask(self.mask_for(truck_ids), map_ids)
+    def set_all_unlocked(self, truck_ids: Iterable[str]) -> None:
+        mask = self.mask_for(truck_ids)
+        self.locked = 0
+        for map_id in self.map_ids:
+            self.unlocked[map_id] = mask
+    def set_all_locked(self, truck_ids: Iterable[str]) -> None:
+        self.locked = self.mask_for(truck_ids)
+        for map_id in self.map_ids:
+            self.unlocked[map_id] = 0
+    def spread_unlocked(self) -> None:
+        mask = self.unlocked_mask()
+        for map_id in self.map_ids:
+            self.unlocked[map_id] = mask
+    def is_locked(self, truck_id: str) -> bool:
+        index = self.ordinals.get(truck_id)
+        return index is not None and bool(self.locked >> index & 1)
+    def is_unlocked(self, truck_id: str, map_id: Optional[str] = None) -> bool:
+        index = self.ordinals.get(truck_id)
+        if index is None:
+            return False
+        mask = self.unlocked.get(map_id, 0) if map_id is not None else self.unlocked_mask()
+        return bool(mask >> index & 1)
+    def get_unlocked_anywhere(self) -> Set[str]:
+        return set(self.truck_ids_for(self.unlocked_mask()))
+    def get_locked_list(self) -> List[str]:
+        return self.truck_ids_for(self.locked)
+    def get_unlocked_list(self, map_id: Optional[str] = None) -> List[str]:
+        return self.truck_ids_for(self.unlocked_mask(None if map_id is None else [map_id]))
+    def to_ssl_value(self, ssl_value: Dict[str, Any]) -> None:
+        ssl_value["lockedTrucks"] = self.truck_ids_for(self.locked)
+        unlocked_trucks = ssl_value.setdefault("unlockedTrucks", {})
+        materialized: Dict[int, List[str]] = {}
+        for map_id in self.map_ids:
+            mask = self.unlocked[map_id]
+            if mask not in materialized:
+                materialized[mask] = self.truck_ids_for(mask)
+            unlocked_trucks[map_id] = list(materialized[mask])